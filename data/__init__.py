@@ -1,14 +1,34 @@
-from .puzzle import Puzzle, Puzzles
+from .puzzle import Puzzle, PuzzleColumns, Puzzles, PuzzleView, wrap_phrase
+from .puzzle_state import PuzzleState
 from .player import Player, Players
 from .constants import VOWEL_COST, DEFAULT_WEDGES, PRESENTER_KEY_DOWN, PRESENTER_KEY_UP
+from .spin import SpinPlan, plan_spin
+from .tossup import TossupSchedule, plan_tossup
+from .engine import GameEngine, GameEvent
+from .solver import SolverSession, WordIndex
+from .wedge import Wedge, WedgeLayout
 
 __all__ = [
     "Puzzle",
     "Puzzles",
+    "PuzzleColumns",
+    "PuzzleView",
+    "wrap_phrase",
+    "PuzzleState",
     "Player",
     "Players",
     "VOWEL_COST",
     "DEFAULT_WEDGES",
     "PRESENTER_KEY_DOWN",
     "PRESENTER_KEY_UP",
+    "SpinPlan",
+    "plan_spin",
+    "TossupSchedule",
+    "plan_tossup",
+    "GameEngine",
+    "GameEvent",
+    "SolverSession",
+    "WordIndex",
+    "Wedge",
+    "WedgeLayout",
 ]
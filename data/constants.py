@@ -1,10 +1,20 @@
+from .wedge import Wedge
+
 VOWEL_COST = 0.25
 
 PRESENTER_KEY_UP = 16777238
 PRESENTER_KEY_DOWN = 16777239
 
+# puzzle board: the show's board wraps words onto four rows of (at most) 14 cells
+BOARD_ROWS = 4
+BOARD_COLUMNS = 14
+# characters besides A-Z a phrase may hold; the board shows them as-is
+BOARD_PUNCTUATION = " !\"&'(),-./:;?0123456789"
+
 
-DEFAULT_WEDGES: list[float | str] = [
+# Entries are plain values (standard width) or Wedge(value, width) for custom widths,
+# e.g. Wedge("BANKRUPT", 1 / 3), Wedge(10.00, 1 / 3), Wedge("BANKRUPT", 1 / 3).
+DEFAULT_WEDGES: list[float | str | Wedge] = [
     "BANKRUPT",
     0.75,
     0.25,
@@ -30,3 +40,39 @@ DEFAULT_WEDGES: list[float | str] = [
     0.25,
     0.30,
 ]
+
+# Wheel spin physics: the wheel advances `velocity` degrees per frame step and the
+# velocity decays by `friction` each step until it drops below the stop threshold.
+SPIN_VELOCITY_RANGE: tuple[float, float] = (30.0, 140.0)
+SPIN_FRICTION_RANGE: tuple[float, float] = (0.980, 0.994)
+SPIN_STOP_VELOCITY: float = 0.04
+SPIN_STEP_MS: float = 16.0
+# per-spin variation of the step length: changes how long a spin takes, not where
+# it lands, and is independent of the display's frame timing
+SPIN_STEP_JITTER_MS: float = 2.0
+
+# Toss-up reveals: one letter position every TOSSUP_INTERVAL_MS, scaled per step by
+# the pacing curve (a data.tossup.TOSSUP_PACING name); never faster than the minimum
+TOSSUP_INTERVAL_MS: float = 1500.0
+TOSSUP_MIN_INTERVAL_MS: float = 400.0
+TOSSUP_PACING_CURVE: str = "constant"
+
+# puzzles parsed from the library file are kept in an LRU of this many entries
+PUZZLE_CACHE_SIZE: int = 256
+
+# puzzle types of one show, in order; used to pick a show from a puzzle library
+# that keeps air history (a SQLite store)
+SHOW_FORMAT: tuple[str, ...] = (
+    "TOSS-UP",
+    "MAIN",
+    "TOSS-UP",
+    "MAIN",
+    "TOSS-UP",
+    "MAIN",
+    "FINAL SPIN",
+    "BONUS ROUND",
+)
+
+# host-assist solver: word lists to index (one word per line, optional TAB category);
+# missing files are skipped
+SOLVER_WORDLISTS: tuple[str, ...] = ("/usr/share/dict/words", "/usr/dict/words")
@@ -0,0 +1,262 @@
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+
+from .constants import VOWEL_COST
+from .player import Player, Players
+from .puzzle import Puzzle
+from .puzzle_state import VOWELS, PuzzleState
+from .tossup import TossupSchedule, plan_tossup
+
+# phases come from Puzzle.type; SETUP until the first puzzle is loaded
+PHASE_SETUP = "SETUP"
+PHASE_TOSSUP = "TOSS-UP"
+PHASE_MAIN = "MAIN"
+PHASE_FINAL_SPIN = "FINAL SPIN"
+PHASE_BONUS = "BONUS ROUND"
+
+# event kinds emitted by GameEngine; see GameEvent.data for each payload
+EVENT_PUZZLE_LOADED = "puzzle_loaded"  # puzzle, phase
+EVENT_TURN_CHANGED = "turn_changed"
+EVENT_SPIN_VALUE = "spin_value"  # amount
+EVENT_BANKRUPT = "bankrupt"
+EVENT_LOSE_TURN = "lose_turn"
+EVENT_LETTER_CALLED = "letter_called"  # letter, count, gained
+EVENT_POSITION_REVEALED = "position_revealed"  # position
+EVENT_BONUS_LETTERS_CHOSEN = "bonus_letters_chosen"  # letters
+EVENT_SOLVED = "solved"  # round_score, prize
+EVENT_SOLVE_FAILED = "solve_failed"
+EVENT_SCORES_CHANGED = "scores_changed"
+EVENT_GAME_OVER = "game_over"  # standings
+
+BONUS_LETTER_COUNT = 10
+
+
+@dataclass(slots=True)
+class GameEvent:
+    kind: str
+    player: int = -1  # index of the player it concerns, -1 for none
+    data: dict = field(default_factory=dict)
+
+
+class GameEngine:
+    """
+    The game's rules without any UI: phases, turn rotation, scoring, vowel cost,
+    toss-up / final-spin / bonus-round handling.
+
+    Callers drive it with commands (next_puzzle, spin_result, call_letter, solve,
+    ...) and subscribers receive a GameEvent for every state change, so GameWindow
+    is only a view and whole games can be played headlessly. The engine keeps its
+    own PuzzleState: letters count as revealed as soon as they are called, while a
+    view is free to animate them.
+    """
+
+    def __init__(
+        self,
+        puzzles: Sequence[Puzzle],
+        players: list[str] | None = None,
+        vowel_cost: float = VOWEL_COST,
+    ) -> None:
+        self.puzzles: Sequence[Puzzle] = puzzles
+        self.vowel_cost: float = vowel_cost
+        self.players: list[Player] = []
+        self.current_puzzle_index: int = -1
+        self.current_player_index: int = -1
+        self.round_number: int = -1
+        self.phase: str = PHASE_SETUP
+        self.puzzle: Puzzle | None = None
+        self.state: PuzzleState = PuzzleState()
+        # last money wedge; letters called after it are paid at this value
+        self.last_spin_value: float | None = None
+        self.bonus_letters: set[str] = set()
+        # every letter called on the current puzzle, hits and misses
+        self.called_letters: set[str] = set()
+        # reveal order of the current toss-up; set tossup_seed for a fixed order
+        self.tossup_schedule: TossupSchedule | None = None
+        self.tossup_seed: int | None = None
+        self._listeners: list[Callable[[GameEvent], None]] = []
+        if players:
+            self.set_players(players)
+
+    # ----- events -----
+    def subscribe(self, listener: Callable[[GameEvent], None]) -> None:
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[GameEvent], None]) -> None:
+        self._listeners.remove(listener)
+
+    def _emit(self, kind: str, player: int = -1, **data) -> None:
+        if not self._listeners:
+            return
+        event: GameEvent = GameEvent(kind, player, data)
+        for listener in list(self._listeners):
+            listener(event)
+
+    # ----- queries -----
+    @property
+    def current_player(self) -> Player | None:
+        if 0 <= self.current_player_index < len(self.players):
+            return self.players[self.current_player_index]
+        return None
+
+    def leader(self) -> Player:
+        return max(self.players, key=lambda x: x.total_score)
+
+    def standings(self) -> list[Player]:
+        return sorted(self.players, key=lambda p: p.total_score, reverse=True)
+
+    def can_call(self, letter: str) -> bool:
+        """Whether the current player may call `letter` after a money spin."""
+        letter = letter.upper()
+        if self.state.is_letter_revealed(letter):
+            return False
+        if letter not in VOWELS or self.phase == PHASE_FINAL_SPIN:
+            return True
+        player: Player | None = self.current_player
+        return player is not None and player.round_score > self.vowel_cost
+
+    def can_spin(self) -> bool:
+        player: Player | None = self.current_player
+        return player is not None and not player.has_spun
+
+    # ----- commands -----
+    def set_players(self, names: list[str]) -> None:
+        self.players = Players(names).get_players()
+        self._emit(EVENT_SCORES_CHANGED)
+
+    def set_turn(self, idx: int) -> None:
+        self.current_player_index = idx
+        self._emit(EVENT_TURN_CHANGED, idx)
+
+    def next_puzzle(self) -> Puzzle:
+        """Load the next puzzle and start its phase."""
+        if not self.puzzles:
+            raise RuntimeError("No puzzles")
+        self.current_puzzle_index = (self.current_puzzle_index + 1) % len(self.puzzles)
+        puzzle: Puzzle = self.puzzles[self.current_puzzle_index]
+        self.puzzle = puzzle
+        self.phase = puzzle.type
+        self.state = PuzzleState(puzzle.phrase)
+        self.tossup_schedule = None
+        self.bonus_letters.clear()
+        self.called_letters.clear()
+        if self.phase == PHASE_TOSSUP:
+            self.tossup_schedule = plan_tossup(self.state, seed=self.tossup_seed)
+        self._emit(EVENT_PUZZLE_LOADED, puzzle=puzzle, phase=self.phase)
+
+        if self.phase == PHASE_TOSSUP:
+            # nobody's turn until someone buzzes in
+            self.current_player_index = -1
+            return puzzle
+
+        self.round_number += 1
+        self.current_player_index = self.round_number % len(self.players)
+        if self.phase == PHASE_MAIN:
+            for p in self.players:
+                p.round_score = 0.0
+            self._emit(EVENT_SCORES_CHANGED)
+        elif self.phase == PHASE_BONUS:
+            self.current_player_index = self.players.index(self.leader())
+        self._emit(EVENT_TURN_CHANGED, self.current_player_index)
+        return puzzle
+
+    def tossup_step(self) -> int | None:
+        """Reveal the next toss-up position; None once every letter is showing."""
+        if self.tossup_schedule is None:
+            return None
+        pos: int | None = self.tossup_schedule.next_position(self.state)
+        if pos is not None:
+            self.state.reveal(pos)
+            self._emit(EVENT_POSITION_REVEALED, position=pos)
+        return pos
+
+    def advance_turn(self) -> None:
+        self.current_player_index = (self.current_player_index + 1) % len(self.players)
+        self._emit(EVENT_TURN_CHANGED, self.current_player_index)
+
+    def spin_result(self, wedge: float | str | None) -> None:
+        """Apply the wedge the wheel stopped on for the current player."""
+        self.last_spin_value = None
+        idx: int = self.current_player_index
+        if wedge == "BANKRUPT" and self.phase != PHASE_FINAL_SPIN:
+            self.players[idx].set_bankrupt()
+            self._emit(EVENT_BANKRUPT, idx)
+            self._emit(EVENT_SCORES_CHANGED)
+            self.advance_turn()
+        elif wedge == "LOSE A TURN" and self.phase != PHASE_FINAL_SPIN:
+            self._emit(EVENT_LOSE_TURN, idx)
+            self.advance_turn()
+        else:
+            try:
+                amount: float = float(wedge)
+            except (TypeError, ValueError):
+                amount = 0.0
+            self.last_spin_value = amount
+            self._emit(EVENT_SPIN_VALUE, idx, amount=amount)
+
+    def call_letter(self, letter: str) -> int:
+        """
+        Call a letter for the current player; returns how many times it appears.
+        Consonants pay last_spin_value per occurrence, vowels cost vowel_cost. In the
+        bonus round letters are only collected. The turn passes afterwards.
+        """
+        letter = letter.upper()
+        idx: int = self.current_player_index
+        count: int = 0
+        self.called_letters.add(letter)
+        if not self.state.is_letter_revealed(letter):
+            # every occurrence counts, even ones a toss-up already showed
+            count = self.state.count(letter)
+            self.state.reveal_letter(letter)
+        gained: float = 0.0
+        if self.phase != PHASE_BONUS:
+            if count > 0:
+                if letter in VOWELS:
+                    self.players[idx].round_score -= self.vowel_cost
+                    gained = -self.vowel_cost
+                else:
+                    gained = (self.last_spin_value or 0.0) * count
+                    self.players[idx].add_money(gained)
+        else:
+            self.bonus_letters.add(letter)
+        self._emit(EVENT_LETTER_CALLED, idx, letter=letter, count=count, gained=gained)
+        if gained:
+            self._emit(EVENT_SCORES_CHANGED)
+        if self.phase == PHASE_BONUS and len(self.bonus_letters) >= BONUS_LETTER_COUNT:
+            self._emit(EVENT_BONUS_LETTERS_CHOSEN, idx, letters=set(self.bonus_letters))
+
+        self.advance_turn()
+        if self.phase != PHASE_FINAL_SPIN:
+            self.last_spin_value = None
+        return count
+
+    def solve(self, correct: bool) -> None:
+        """The host's verdict on the current player's solve attempt."""
+        idx: int = self.current_player_index
+        if not correct:
+            self._emit(EVENT_SOLVE_FAILED, idx)
+            # a missed toss-up just lets the reveal carry on
+            if self.phase != PHASE_TOSSUP:
+                self.advance_turn()
+            return
+
+        player: Player = self.players[idx]
+        prize: float = 0.0
+        if self.phase == PHASE_TOSSUP:
+            prize = self.puzzle.prize_value if self.puzzle else 0.0
+            player.add_money(prize)
+        player.total_score += player.round_score
+        round_score: float = player.round_score
+        self.state.reveal_all()
+        if self.round_number < len(self.puzzles):
+            for p in self.players:
+                p.round_score = 0.0
+        self._emit(EVENT_SOLVED, idx, round_score=round_score, prize=prize)
+        self._emit(EVENT_SCORES_CHANGED)
+        if self.phase == PHASE_BONUS:
+            self._emit(EVENT_GAME_OVER, standings=self.standings())
+
+    def override_score(self, idx: int, round_score: float, total_score: float) -> None:
+        player: Player = self.players[idx]
+        player.round_score = round_score
+        player.total_score = total_score
+        self._emit(EVENT_SCORES_CHANGED)
@@ -1,8 +1,60 @@
+from array import array
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
-import json
+from functools import lru_cache
+from itertools import compress
 import sys
 from pathlib import Path
 
+from .constants import PUZZLE_CACHE_SIZE, SHOW_FORMAT
+from .puzzle_source import PuzzleSource, open_puzzle_source
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def wrap_phrase(phrase: str, columns: int) -> list[list[int]]:
+    """
+    Word-wrap `phrase` into lines of at most `columns` cells, returning the phrase
+    indices on each line. Words are never split unless a single word is longer than
+    a line; the spaces where a line breaks are dropped.
+    """
+    columns = max(1, columns)
+    lines: list[list[int]] = []
+    current: list[int] = []
+    i: int = 0
+    n: int = len(phrase)
+    while i < n:
+        if phrase[i] == " ":
+            i += 1
+            continue
+        end: int = phrase.find(" ", i)
+        end = n if end == -1 else end
+        word: list[int] = list(range(i, end))
+        i = end
+        # a word longer than a whole line has to be broken
+        while len(word) > columns:
+            if current:
+                lines.append(current)
+                current = []
+            lines.append(word[:columns])
+            word = word[columns:]
+        if not word:
+            continue
+        needed: int = len(word) + (1 if current else 0)
+        if current and len(current) + needed > columns:
+            lines.append(current)
+            current = []
+        if current:
+            # keep the single space between words on the same line
+            current.append(word[0] - 1)
+        current.extend(word)
+    if current:
+        lines.append(current)
+    return lines
+
 
 @dataclass
 class Puzzle:
@@ -11,38 +63,284 @@ class Puzzle:
     type: str
     prize_value: float
 
+    @classmethod
+    def from_dict(cls, item: dict[str, str | float]) -> "Puzzle":
+        return cls(
+            category=str(item.get("category", "")),
+            phrase=str(item.get("phrase", "")),
+            type=str(item.get("type", "MAIN")),
+            prize_value=float(item.get("prize_value", 0.0)),
+        )
+
+
+def _column_mask(column: array, value: int) -> int:
+    """
+    Rows of `column` equal to `value` as a big int with one byte per row (1 or 0),
+    built from C-level passes over the array's bytes: each byte plane of the items
+    is translated to a 0/1 mask and the planes are ANDed together.
+    """
+    data: bytes = column.tobytes()
+    size: int = column.itemsize
+    mask: int = -1
+    for k, byte in enumerate(array(column.typecode, [value]).tobytes()):
+        table: bytearray = bytearray(256)
+        table[byte] = 1
+        mask &= int.from_bytes(data[k::size].translate(table), "little")
+    return mask
+
+
+class PuzzleView:
+    """
+    Read-only stand-in for a Puzzle: one row of a PuzzleColumns. Holds only the
+    columns and the row index, and reads the fields from the columns on access.
+    """
+
+    __slots__ = ("columns", "index")
+
+    def __init__(self, columns: "PuzzleColumns", index: int) -> None:
+        self.columns: PuzzleColumns = columns
+        self.index: int = index
+
+    @property
+    def category(self) -> str:
+        return self.columns.category_names[self.columns.category_ids[self.index]]
+
+    @property
+    def phrase(self) -> str:
+        return self.columns.phrase(self.index)
+
+    @property
+    def type(self) -> str:
+        return self.columns.type_names[self.columns.type_codes[self.index]]
+
+    @property
+    def prize_value(self) -> float:
+        return self.columns.prize_values[self.index]
+
+    def to_puzzle(self) -> Puzzle:
+        return Puzzle(self.category, self.phrase, self.type, self.prize_value)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (Puzzle, PuzzleView)):
+            return NotImplemented
+        return (self.category, self.phrase, self.type, self.prize_value) == (
+            other.category,
+            other.phrase,
+            other.type,
+            other.prize_value,
+        )
+
+    def __repr__(self) -> str:
+        return f"PuzzleView({self.index}, {self.to_puzzle()!r})"
+
+
+class PuzzleColumns:
+    """
+    A puzzle bank as parallel columns instead of one object per puzzle: type codes
+    (array of uint8) and category ids (uint32) into interned name lists, prize
+    values (float64), and every phrase in one concatenated string with start
+    offsets. Rows come out as PuzzleView objects, which have the Puzzle
+    attributes.
+
+    filter() works on whole columns: with NumPy as array comparisons, otherwise as
+    byte masks of the arrays (see _column_mask), so no Python code runs per row.
+    """
 
-class Puzzles:
     def __init__(self) -> None:
-        self.PUZZLES_FILE: Path = Path(__file__).parent / "puzzles.json"
-        self.puzzles: list[Puzzle] = self.load_puzzles()
+        self.type_names: list[str] = []
+        self.category_names: list[str] = []
+        self._type_codes: dict[str, int] = {}
+        self._category_ids: dict[str, int] = {}
+        self.type_codes: array = array("B")
+        self.category_ids: array = array("I")
+        self.prize_values: array = array("d")
+        # phrase i is text[phrase_offsets[i]:phrase_offsets[i + 1]]
+        self.phrase_offsets: array = array("Q", [0])
+        self._text: str = ""
+        self._pending: list[str] = []
+
+    @classmethod
+    def from_records(cls, records: Iterable[dict]) -> "PuzzleColumns":
+        return cls.from_puzzles(Puzzle.from_dict(item) for item in records)
+
+    @classmethod
+    def from_puzzles(cls, puzzles: Iterable[Puzzle]) -> "PuzzleColumns":
+        columns: PuzzleColumns = cls()
+        for puzzle in puzzles:
+            columns.append(puzzle)
+        columns.text  # join the phrases now rather than on the first read
+        return columns
+
+    def append(self, puzzle: Puzzle) -> int:
+        """Add a puzzle as a new row; returns its index."""
+        code: int | None = self._type_codes.get(puzzle.type)
+        if code is None:
+            if len(self.type_names) > 255:
+                raise ValueError("more than 256 puzzle types")
+            code = self._type_codes[puzzle.type] = len(self.type_names)
+            self.type_names.append(puzzle.type)
+        cid: int | None = self._category_ids.get(puzzle.category)
+        if cid is None:
+            cid = self._category_ids[puzzle.category] = len(self.category_names)
+            self.category_names.append(puzzle.category)
+        self.type_codes.append(code)
+        self.category_ids.append(cid)
+        self.prize_values.append(puzzle.prize_value)
+        self.phrase_offsets.append(self.phrase_offsets[-1] + len(puzzle.phrase))
+        self._pending.append(puzzle.phrase)
+        return len(self.type_codes) - 1
+
+    def __len__(self) -> int:
+        return len(self.type_codes)
+
+    def __getitem__(self, idx: int) -> PuzzleView:
+        n: int = len(self.type_codes)
+        if idx < 0:
+            idx += n
+        if not 0 <= idx < n:
+            raise IndexError("puzzle index out of range")
+        return PuzzleView(self, idx)
+
+    def __iter__(self) -> Iterator[PuzzleView]:
+        for idx in range(len(self)):
+            yield PuzzleView(self, idx)
+
+    @property
+    def text(self) -> str:
+        # appends are batched and joined on first read
+        if self._pending:
+            self._text += "".join(self._pending)
+            self._pending.clear()
+        return self._text
+
+    def phrase(self, idx: int) -> str:
+        return self.text[self.phrase_offsets[idx] : self.phrase_offsets[idx + 1]]
+
+    def count(self, type: str) -> int:
+        code: int | None = self._type_codes.get(type)
+        return 0 if code is None else self.type_codes.count(code)
+
+    def filter(self, type: str | None = None, category: str | None = None) -> list[int]:
+        """Indices of the puzzles of `type` and/or in `category`, in order."""
+        tests: list[tuple[array, int]] = []
+        if type is not None:
+            if type not in self._type_codes:
+                return []
+            tests.append((self.type_codes, self._type_codes[type]))
+        if category is not None:
+            if category not in self._category_ids:
+                return []
+            tests.append((self.category_ids, self._category_ids[category]))
+        if not tests:
+            return list(range(len(self)))
+        if np is not None:
+            mask = np.ones(len(self), dtype=bool)
+            for column, value in tests:
+                mask &= np.frombuffer(column, dtype=column.typecode) == value
+            return np.flatnonzero(mask).tolist()
+        mask: int = -1
+        for column, value in tests:
+            mask &= _column_mask(column, value)
+        return list(compress(range(len(self)), mask.to_bytes(len(self), "little")))
+
+
+class Puzzles:
+    """
+    The puzzle library as a lazy sequence: len(), puzzles[idx] and iteration read
+    through a PuzzleSource, and only the puzzles actually used are parsed (with a
+    small LRU in front). type_counts comes from the source's index.
+    """
+
+    def __init__(
+        self, path: str | Path | None = None, cache_size: int = PUZZLE_CACHE_SIZE
+    ) -> None:
+        self.PUZZLES_FILE: Path = (
+            Path(path) if path else Path(__file__).parent / "puzzles.json"
+        )
+        self.ensure_puzzles_file()
+        self.source: PuzzleSource = open_puzzle_source(self.PUZZLES_FILE)
+        self._cached: Callable[[int], Puzzle] = lru_cache(maxsize=cache_size)(
+            self._load
+        )
+        self._columns: PuzzleColumns | None = None
 
     def ensure_puzzles_file(self) -> None:
         if not self.PUZZLES_FILE.exists():
             print("NO PUZZLES FILE")
             sys.exit(1)
 
+    def _load(self, idx: int) -> Puzzle:
+        return Puzzle.from_dict(self.source.record(idx))
+
+    def __len__(self) -> int:
+        return len(self.source)
+
+    def __getitem__(self, idx: int) -> Puzzle:
+        n: int = len(self.source)
+        if idx < 0:
+            idx += n
+        if not 0 <= idx < n:
+            raise IndexError("puzzle index out of range")
+        return self._cached(idx)
+
+    def __iter__(self) -> Iterator[Puzzle]:
+        for idx in range(len(self)):
+            yield self[idx]
+
+    @property
+    def type_counts(self) -> dict[str, int]:
+        return self.source.type_counts
+
+    @property
+    def columns(self) -> PuzzleColumns:
+        """The whole library as a PuzzleColumns, read in one pass on first use."""
+        if self._columns is None:
+            self._columns = PuzzleColumns.from_records(self.source.records())
+        return self._columns
+
+    def filter(self, type: str | None = None, category: str | None = None) -> list[int]:
+        """Indices of the puzzles of `type` and/or in `category` (see PuzzleColumns)."""
+        return self.columns.filter(type, category)
+
+    def count(self, type: str) -> int:
+        """How many puzzles of `type` ("MAIN", "TOSS-UP", ...) the library holds."""
+        return self.type_counts.get(type, 0)
+
+    # ----- air history -----
+    @property
+    def tracks_history(self) -> bool:
+        return self.source.tracks_history
+
+    def next_unplayed(
+        self, type: str, category: str | None = None, exclude: Iterable[int] = ()
+    ) -> int | None:
+        return self.source.next_unplayed(type, category, exclude)
+
+    def plan_show(self, show_format: Iterable[str] = SHOW_FORMAT) -> list[int]:
+        """Puzzle indices for one show: per slot type, the next puzzle to air."""
+        picked: list[int] = []
+        for kind in show_format:
+            idx: int | None = self.next_unplayed(kind, exclude=picked)
+            if idx is not None:
+                picked.append(idx)
+        return picked
+
+    def mark_played(self, idx: int) -> None:
+        """Record that puzzle `idx` aired (queued; no-op without history)."""
+        self.source.mark_played(idx)
+
+    def close(self) -> None:
+        self.source.close()
+
     def load_puzzles(self) -> list[Puzzle]:
-        self.ensure_puzzles_file()
-        raw: str = self.PUZZLES_FILE.read_text(encoding="utf-8")
-        data: list[dict[str, str | float]] = json.loads(raw)
-        puzzles: list[Puzzle] = []
-        for item in data:
-            puzzles.append(
-                Puzzle(
-                    category=str(item.get("category", "")),
-                    phrase=str(item.get("phrase", "")),
-                    type=str(item.get("type", "MAIN")),
-                    prize_value=float(item.get("prize_value", 0.0)),
-                )
-            )
-        return puzzles
+        """Every puzzle, parsed in one sequential pass (for tools that read all)."""
+        return [Puzzle.from_dict(item) for item in self.source.records()]
 
     def get_puzzles(self) -> list[Puzzle]:
-        return self.puzzles
+        return self.load_puzzles()
 
     def get_puzzle(self, idx: int) -> Puzzle:
-        return self.puzzles[idx]
+        return self[idx]
 
     def get_prize_value(self, idx: int) -> float:
         p = self.get_puzzle(idx)
@@ -0,0 +1,676 @@
+import array
+import json
+import math
+import mmap
+import os
+import queue
+import sqlite3
+import struct
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack
+from pathlib import Path
+
+# bump when the .idx layout changes; older index files are then rebuilt
+INDEX_VERSION = 1
+
+
+class PuzzleSource(ABC):
+    """
+    Read-only storage behind Puzzles. Records are dicts with the Puzzle fields
+    (category, phrase, type, prize_value); Puzzles turns them into Puzzle objects.
+    """
+
+    path: Path
+    # puzzle type -> number of puzzles of that type
+    type_counts: dict[str, int]
+    # whether mark_played() is remembered and next_unplayed() honours it
+    tracks_history: bool = False
+
+    @abstractmethod
+    def __len__(self) -> int: ...
+
+    @abstractmethod
+    def record(self, idx: int) -> dict:
+        """The record at `idx` (0 <= idx < len)."""
+
+    def records(self) -> Iterator[dict]:
+        """Every record in order; sources override this with a sequential read."""
+        for idx in range(len(self)):
+            yield self.record(idx)
+
+    def next_unplayed(
+        self, type: str, category: str | None = None, exclude: Iterable[int] = ()
+    ) -> int | None:
+        """
+        Index of the next puzzle of `type` (in `category`) to air, skipping
+        `exclude`. Without history that is simply the first match in file order.
+        """
+        skip: set[int] = set(exclude)
+        for idx, item in enumerate(self.records()):
+            if (
+                idx not in skip
+                and item.get("type", "MAIN") == type
+                and (category is None or item.get("category", "") == category)
+            ):
+                return idx
+        return None
+
+    def mark_played(self, idx: int, when: float | None = None) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp: Path = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def convert_json_to_jsonl(src: Path, dst: Path) -> int:
+    """
+    Rewrite a JSON array of puzzles as one JSON object per line; returns count.
+    The whole array is parsed in memory, a one-time cost per edit of the JSON file.
+    """
+    items: list[dict] = json.loads(src.read_text(encoding="utf-8"))
+    lines: list[str] = [json.dumps(item, ensure_ascii=False) + "\n" for item in items]
+    _write_atomic(dst, "".join(lines).encode("utf-8"))
+    return len(items)
+
+
+class MemoryPuzzleSource(PuzzleSource):
+    """Records held in a list; the fallback when no JSONL copy can be written."""
+
+    def __init__(self, path: str | Path, items: list[dict]) -> None:
+        self.path = Path(path)
+        self.items: list[dict] = items
+        self.type_counts = {}
+        for item in items:
+            kind: str = str(item.get("type", "MAIN"))
+            self.type_counts[kind] = self.type_counts.get(kind, 0) + 1
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def record(self, idx: int) -> dict:
+        return self.items[idx]
+
+    def records(self) -> Iterator[dict]:
+        return iter(self.items)
+
+
+class JsonlPuzzleSource(PuzzleSource):
+    """
+    Puzzles stored one JSON object per line, read lazily through a byte-offset index.
+
+    The index (line start offsets + per-type counts) is built by one pass over the
+    file and cached next to it as `<name>.idx`: a JSON header line followed by the
+    raw offsets. It is keyed on the file's size and mtime, so it is rebuilt after an
+    edit. Opening reads only the index; record(idx) seeks to one line and parses it.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.index_path: Path = self.path.with_name(self.path.name + ".idx")
+        # start of every record plus a final end-of-file entry
+        self.offsets: array.array = array.array("Q")
+        self.type_counts = {}
+        if not self._load_index():
+            self._build_index()
+            self._save_index()
+        self._fh = self.path.open("rb")
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return max(0, len(self.offsets) - 1)
+
+    def _stamp(self) -> dict[str, int]:
+        stat: os.stat_result = self.path.stat()
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def _load_index(self) -> bool:
+        try:
+            with self.index_path.open("rb") as fh:
+                header: dict = json.loads(fh.readline())
+                raw: bytes = fh.read()
+        except (OSError, ValueError):
+            return False
+        if (
+            header.get("version") != INDEX_VERSION
+            or header.get("source") != self._stamp()
+        ):
+            return False
+        offsets: array.array = array.array("Q")
+        offsets.frombytes(raw)
+        if header.get("byteorder") != sys.byteorder:
+            offsets.byteswap()
+        if len(offsets) != header.get("count", -1) + 1:
+            return False
+        self.offsets = offsets
+        self.type_counts = header.get("types", {})
+        return True
+
+    def _build_index(self) -> None:
+        offsets: array.array = array.array("Q")
+        counts: dict[str, int] = {}
+        pos: int = 0
+        with self.path.open("rb") as fh:
+            for line in fh:
+                if line.strip():
+                    offsets.append(pos)
+                    kind: str = str(json.loads(line).get("type", "MAIN"))
+                    counts[kind] = counts.get(kind, 0) + 1
+                pos += len(line)
+        offsets.append(pos)
+        self.offsets = offsets
+        self.type_counts = counts
+
+    def _save_index(self) -> None:
+        header: dict = {
+            "version": INDEX_VERSION,
+            "source": self._stamp(),
+            "byteorder": sys.byteorder,
+            "count": len(self),
+            "types": self.type_counts,
+        }
+        data: bytes = json.dumps(header).encode("utf-8") + b"\n"
+        try:
+            _write_atomic(self.index_path, data + self.offsets.tobytes())
+        except OSError:
+            # read-only location: work from the in-memory index
+            pass
+
+    def record(self, idx: int) -> dict:
+        start: int = self.offsets[idx]
+        # blank lines between records are harmless whitespace to json.loads
+        size: int = self.offsets[idx + 1] - start
+        with self._lock:
+            self._fh.seek(start)
+            line: bytes = self._fh.read(size)
+        return json.loads(line)
+
+    def records(self) -> Iterator[dict]:
+        with self.path.open("rb") as fh:
+            for line in fh:
+                if line.strip():
+                    yield json.loads(line)
+
+    def close(self) -> None:
+        self._fh.close()
+
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS puzzles (
+    id INTEGER PRIMARY KEY,  -- library index + 1
+    type TEXT NOT NULL,
+    category TEXT NOT NULL,
+    phrase TEXT NOT NULL,
+    prize_value REAL NOT NULL DEFAULT 0,
+    last_played REAL,  -- unix time, NULL = never aired
+    play_count INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS puzzles_type_played ON puzzles (type, last_played);
+CREATE INDEX IF NOT EXISTS puzzles_type_category_played
+    ON puzzles (type, category, last_played);
+CREATE INDEX IF NOT EXISTS puzzles_category ON puzzles (category);
+CREATE INDEX IF NOT EXISTS puzzles_played ON puzzles (last_played);
+CREATE TABLE IF NOT EXISTS plays (
+    puzzle_id INTEGER NOT NULL REFERENCES puzzles (id),
+    played_at REAL NOT NULL
+);
+"""
+SQLITE_SUFFIXES: frozenset[str] = frozenset({".sqlite", ".sqlite3", ".db"})
+
+
+def convert_to_sqlite(src: str | Path, dst: str | Path) -> int:
+    """Build a SQLite puzzle store at `dst` from any puzzle file; returns count."""
+    dst = Path(dst)
+    if dst.exists():
+        raise FileExistsError(dst)
+    source: PuzzleSource = open_puzzle_source(src)
+    conn: sqlite3.Connection = sqlite3.connect(dst)
+    try:
+        conn.executescript(_SQLITE_SCHEMA)
+        with conn:
+            conn.executemany(
+                "INSERT INTO puzzles (id, type, category, phrase, prize_value)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (
+                    (
+                        i + 1,
+                        str(item.get("type", "MAIN")),
+                        str(item.get("category", "")),
+                        str(item.get("phrase", "")),
+                        float(item.get("prize_value", 0.0)),
+                    )
+                    for i, item in enumerate(source.records())
+                ),
+            )
+        return conn.execute("SELECT COUNT(*) FROM puzzles").fetchone()[0]
+    finally:
+        conn.close()
+        source.close()
+
+
+class _HistoryWriter(threading.Thread):
+    """
+    Writes play history on its own connection, so marking a puzzle as aired never
+    waits on disk on the GUI thread. Queued marks are committed in batches.
+    """
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(name="puzzle-history", daemon=True)
+        self.path: Path = path
+        self.queue: queue.Queue[tuple[int, float] | None] = queue.Queue()
+
+    def run(self) -> None:
+        conn: sqlite3.Connection = sqlite3.connect(self.path)
+        try:
+            while True:
+                batch: list[tuple[int, float] | None] = [self.queue.get()]
+                while not self.queue.empty():
+                    batch.append(self.queue.get_nowait())
+                marks: list[tuple[int, float]] = [m for m in batch if m is not None]
+                if marks:
+                    with conn:
+                        conn.executemany(
+                            "UPDATE puzzles SET last_played = ?,"
+                            " play_count = play_count + 1 WHERE id = ?",
+                            [(when, pid) for pid, when in marks],
+                        )
+                        conn.executemany(
+                            "INSERT INTO plays (puzzle_id, played_at) VALUES (?, ?)",
+                            marks,
+                        )
+                for _ in batch:
+                    self.queue.task_done()
+                if None in batch:
+                    return
+        finally:
+            conn.close()
+
+
+class SqlitePuzzleSource(PuzzleSource):
+    """
+    Puzzle library in SQLite (see convert_to_sqlite), with play history.
+
+    Puzzle idx is row id idx + 1. Indexes on (type, last_played),
+    (type, category, last_played), category and last_played make "next unplayed
+    TOSS-UP in category X" a single index seek. mark_played() only queues the
+    write; a background thread commits it.
+    """
+
+    tracks_history = True
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._conn: sqlite3.Connection = sqlite3.connect(
+            self.path, check_same_thread=False
+        )
+        # readers keep going while the history thread commits
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SQLITE_SCHEMA)
+        self._lock: threading.Lock = threading.Lock()
+        (self._count,) = self._conn.execute("SELECT COUNT(*) FROM puzzles").fetchone()
+        self.type_counts = dict(
+            self._conn.execute("SELECT type, COUNT(*) FROM puzzles GROUP BY type")
+        )
+        self._writer: _HistoryWriter | None = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _query(self, sql: str, params: tuple = ()) -> list[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def record(self, idx: int) -> dict:
+        rows: list[tuple] = self._query(
+            "SELECT type, category, phrase, prize_value FROM puzzles WHERE id = ?",
+            (idx + 1,),
+        )
+        if not rows:
+            raise IndexError(idx)
+        kind, category, phrase, prize_value = rows[0]
+        return {
+            "type": kind,
+            "category": category,
+            "phrase": phrase,
+            "prize_value": prize_value,
+        }
+
+    def records(self) -> Iterator[dict]:
+        for kind, category, phrase, prize_value in self._query(
+            "SELECT type, category, phrase, prize_value FROM puzzles ORDER BY id"
+        ):
+            yield {
+                "type": kind,
+                "category": category,
+                "phrase": phrase,
+                "prize_value": prize_value,
+            }
+
+    def next_unplayed(
+        self, type: str, category: str | None = None, exclude: Iterable[int] = ()
+    ) -> int | None:
+        """
+        Index of the first never-aired puzzle of `type` (in `category`), or else
+        the one aired longest ago; None if there is no such puzzle. NULLs sort
+        first, so both cases are one walk of the (type[, category], last_played)
+        index.
+        """
+        ids: list[int] = [idx + 1 for idx in exclude]
+        sql: str = "SELECT id FROM puzzles WHERE type = ?"
+        params: list = [type]
+        if category is not None:
+            sql += " AND category = ?"
+            params.append(category)
+        if ids:
+            sql += f" AND id NOT IN ({', '.join('?' * len(ids))})"
+            params += ids
+        sql += " ORDER BY last_played, id LIMIT 1"
+        rows: list[tuple] = self._query(sql, tuple(params))
+        return rows[0][0] - 1 if rows else None
+
+    def last_played(self, idx: int) -> float | None:
+        rows: list[tuple] = self._query(
+            "SELECT last_played FROM puzzles WHERE id = ?", (idx + 1,)
+        )
+        return rows[0][0] if rows else None
+
+    def mark_played(self, idx: int, when: float | None = None) -> None:
+        if self._writer is None:
+            self._writer = _HistoryWriter(self.path)
+            self._writer.start()
+        self._writer.queue.put((idx + 1, time.time() if when is None else when))
+
+    def flush(self) -> None:
+        """Block until every queued history write is committed."""
+        if self._writer is not None:
+            self._writer.queue.join()
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.queue.put(None)
+            self._writer.join()
+            self._writer = None
+        self._conn.close()
+
+
+# ----- compiled pack -----
+# Layout (little-endian), every section fixed-width except the blob:
+#   header
+#   string table: (offset, length) into the blob per interned string
+#                 (categories first, then types)
+#   type counts:  u32 per type
+#   records:      per puzzle phrase offset/length, category id, type id,
+#                 prize (fixed point), letter bitmask
+#   blob:         UTF-8 strings
+# The checksum is a CRC-32 of everything after the header, written at compile
+# time and only verified on request (utils.puzzle_pack --check), since checking
+# it means reading the whole file.
+PACK_MAGIC = b"WOFPACK\0"
+PACK_VERSION = 1
+PACK_PRIZE_SCALE = 10_000
+_PACK_HEADER = struct.Struct("<8sHHIIIQqQI")
+_PACK_STRING = struct.Struct("<II")
+_PACK_COUNT = struct.Struct("<I")
+_PACK_RECORD = struct.Struct("<IIHBxqI")
+# field limits of _PACK_RECORD / _PACK_STRING
+PACK_MAX_CATEGORIES = 1 << 16
+PACK_MAX_TYPES = 1 << 8
+PACK_MAX_BLOB = (1 << 32) - 1
+PACK_MAX_PRIZE = ((1 << 63) - 1) // PACK_PRIZE_SCALE
+
+
+class PackError(ValueError):
+    """A puzzle pack that is damaged, from another version, or older than its JSON."""
+
+
+def letter_mask(phrase: str) -> int:
+    """Bit i set when the letter chr(ord("A") + i) appears in `phrase`."""
+    mask: int = 0
+    for ch in phrase.upper():
+        if "A" <= ch <= "Z":
+            mask |= 1 << (ord(ch) - 65)
+    return mask
+
+
+def compile_pack(src: str | Path, dst: str | Path) -> int:
+    """
+    Compile a .json / .jsonl puzzle file into a binary pack; returns count.
+    Raises PackError when the library doesn't fit the format's fixed-width fields
+    (too many categories or types, an unrepresentable prize, over 4 GiB of text).
+    """
+    src = Path(src)
+    with ExitStack() as stack:
+        items: Iterable[dict]
+        if src.suffix == ".json":
+            items = json.loads(src.read_text(encoding="utf-8"))
+        else:
+            # stream the lines; a JsonlPuzzleSource would also write an .idx
+            # beside the input and keep its file open
+            fh = stack.enter_context(src.open("rb"))
+            items = (json.loads(line) for line in fh if line.strip())
+        strings: dict[str, int] = {}
+        types: dict[str, int] = {}
+        type_totals: list[int] = []
+        blob: bytearray = bytearray()
+        rows: list[tuple] = []
+        for n, item in enumerate(items):
+            category: str = str(item.get("category", ""))
+            kind: str = str(item.get("type", "MAIN"))
+            phrase: str = str(item.get("phrase", ""))
+            if category not in strings:
+                if len(strings) == PACK_MAX_CATEGORIES:
+                    raise PackError(f"more than {PACK_MAX_CATEGORIES} categories")
+                strings[category] = len(strings)
+            if kind not in types:
+                if len(types) == PACK_MAX_TYPES:
+                    raise PackError(f"more than {PACK_MAX_TYPES} puzzle types")
+                types[kind] = len(types)
+                type_totals.append(0)
+            type_totals[types[kind]] += 1
+            try:
+                prize: float = float(item.get("prize_value", 0.0))
+            except (TypeError, ValueError) as exc:
+                raise PackError(f"puzzle {n}: prize_value is not a number") from exc
+            if not math.isfinite(prize) or abs(prize) > PACK_MAX_PRIZE:
+                raise PackError(f"puzzle {n}: prize_value {prize} out of range")
+            data: bytes = phrase.encode("utf-8")
+            rows.append(
+                (
+                    len(blob),
+                    len(data),
+                    strings[category],
+                    types[kind],
+                    round(prize * PACK_PRIZE_SCALE),
+                    letter_mask(phrase),
+                )
+            )
+            blob += data
+
+    body: bytearray = bytearray()
+    for text in [*strings, *types]:
+        data = text.encode("utf-8")
+        body += _PACK_STRING.pack(len(blob), len(data))
+        blob += data
+    if len(blob) > PACK_MAX_BLOB:
+        raise PackError(f"{len(blob):,} bytes of text, the pack holds at most 4 GiB")
+    for total in type_totals:
+        body += _PACK_COUNT.pack(total)
+    for row in rows:
+        body += _PACK_RECORD.pack(*row)
+    body += blob
+
+    stat: os.stat_result = src.stat()
+    header: bytes = _PACK_HEADER.pack(
+        PACK_MAGIC,
+        PACK_VERSION,
+        0,
+        len(rows),
+        len(strings),
+        len(types),
+        stat.st_size,
+        stat.st_mtime_ns,
+        len(blob),
+        zlib.crc32(body),
+    )
+    _write_atomic(Path(dst), header + bytes(body))
+    return len(rows)
+
+
+class PackPuzzleSource(PuzzleSource):
+    """
+    Puzzles from a compiled pack (see compile_pack), mapped with mmap.
+
+    Opening reads only the header, the string table and the type counts: it
+    checks the magic, version and section sizes and, when `source` is given, that
+    the pack was compiled from the current version of that file; any mismatch
+    raises PackError so the caller can fall back to the JSON. The full checksum
+    pass reads every page, so it only runs with `verify=True`.
+
+    record(idx) unpacks one fixed-width record and decodes its phrase from the
+    mapping into a new dict and str: nothing is parsed or decoded until asked for,
+    but records are copies, not views into the mapping.
+    """
+
+    def __init__(
+        self, path: str | Path, source: Path | None = None, verify: bool = False
+    ) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as fh:
+            try:
+                self._mm: mmap.mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as exc:  # empty file
+                raise PackError(f"{self.path}: empty pack") from exc
+        try:
+            self._open(source, verify)
+        except (PackError, struct.error) as exc:
+            self._mm.close()
+            raise PackError(f"{self.path}: {exc}") from exc
+
+    def _open(self, source: Path | None, verify: bool) -> None:
+        mm: mmap.mmap = self._mm
+        (
+            magic,
+            version,
+            _,
+            count,
+            n_categories,
+            n_types,
+            source_size,
+            source_mtime_ns,
+            blob_size,
+            checksum,
+        ) = _PACK_HEADER.unpack_from(mm, 0)
+        if magic != PACK_MAGIC:
+            raise PackError("not a puzzle pack")
+        if version != PACK_VERSION:
+            raise PackError(f"pack version {version}, expected {PACK_VERSION}")
+        if source is not None:
+            stat: os.stat_result = source.stat()
+            if (stat.st_size, stat.st_mtime_ns) != (source_size, source_mtime_ns):
+                raise PackError(f"stale: {source.name} changed since it was compiled")
+        strings_at: int = _PACK_HEADER.size
+        counts_at: int = strings_at + (n_categories + n_types) * _PACK_STRING.size
+        self._records_at: int = counts_at + n_types * _PACK_COUNT.size
+        self._blob_at: int = self._records_at + count * _PACK_RECORD.size
+        if self._blob_at + blob_size != len(mm):
+            raise PackError("truncated")
+        if verify and zlib.crc32(memoryview(mm)[_PACK_HEADER.size :]) != checksum:
+            raise PackError("checksum mismatch")
+        self._count: int = count
+        names: list[str] = [
+            self._text(*entry)
+            for entry in _PACK_STRING.iter_unpack(mm[strings_at:counts_at])
+        ]
+        self.categories: list[str] = names[:n_categories]
+        self.types: list[str] = names[n_categories:]
+        self.type_counts = {
+            kind: _PACK_COUNT.unpack_from(mm, counts_at + i * _PACK_COUNT.size)[0]
+            for i, kind in enumerate(self.types)
+        }
+
+    def _text(self, offset: int, length: int) -> str:
+        start: int = self._blob_at + offset
+        return self._mm[start : start + length].decode("utf-8")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _row(self, idx: int) -> tuple[int, int, int, int, int, int]:
+        if not 0 <= idx < self._count:
+            raise IndexError(idx)
+        return _PACK_RECORD.unpack_from(
+            self._mm, self._records_at + idx * _PACK_RECORD.size
+        )
+
+    def record(self, idx: int) -> dict:
+        offset, length, category, kind, prize, _ = self._row(idx)
+        return {
+            "type": self.types[kind],
+            "category": self.categories[category],
+            "phrase": self._text(offset, length),
+            "prize_value": prize / PACK_PRIZE_SCALE,
+        }
+
+    def letter_mask(self, idx: int) -> int:
+        """Bitmask of the letters in puzzle `idx` (bit 0 = A), without decoding it."""
+        return self._row(idx)[5]
+
+    def close(self) -> None:
+        self._mm.close()
+
+
+def open_puzzle_source(path: str | Path) -> PuzzleSource:
+    """
+    Open the puzzle file at `path`: a SQLite store (.sqlite / .sqlite3 / .db), a
+    compiled pack (.pack), a JSONL file, or a JSON array file (the original
+    puzzles.json format).
+
+    A JSON file prefers a current `.pack` beside it (see compile_pack); a stale or
+    damaged pack falls back to the JSON, which is converted once to a `.jsonl` file
+    beside it, and again whenever the JSON is newer, so editing puzzles.json keeps
+    working. Where that can't be written the copy goes to the temp directory, and
+    failing that the JSON is read into memory.
+    """
+    path = Path(path)
+    if path.suffix in SQLITE_SUFFIXES:
+        return SqlitePuzzleSource(path)
+    if path.suffix == ".jsonl":
+        return JsonlPuzzleSource(path)
+    if path.suffix == ".pack":
+        json_path: Path = path.with_suffix(".json")
+        if not json_path.exists():
+            return PackPuzzleSource(path)
+        path = json_path
+    pack: Path = path.with_suffix(".pack")
+    if pack.exists():
+        try:
+            return PackPuzzleSource(pack, source=path)
+        except PackError:
+            pass
+    # beside the JSON, or in the temp directory on a read-only install
+    tag: int = zlib.crc32(str(path.resolve()).encode("utf-8"))
+    for jsonl in (
+        path.with_suffix(".jsonl"),
+        Path(tempfile.gettempdir()) / f"{path.stem}-{tag:08x}.jsonl",
+    ):
+        try:
+            if (
+                not jsonl.exists()
+                or jsonl.stat().st_mtime_ns < path.stat().st_mtime_ns
+            ):
+                convert_json_to_jsonl(path, jsonl)
+            return JsonlPuzzleSource(jsonl)
+        except OSError:
+            continue
+    return MemoryPuzzleSource(path, json.loads(path.read_text(encoding="utf-8")))
@@ -0,0 +1,145 @@
+VOWELS: frozenset[str] = frozenset("AEIOU")
+
+
+class PuzzleState:
+    """
+    Reveal state of one puzzle phrase, with no Qt dependency.
+
+    Built once per puzzle: a letter -> positions index, a bitmask per letter and the
+    revealed positions as a single integer bitmask (bit i set = phrase[i] shown).
+    Per-letter remaining counts are kept up to date on every reveal, so "how many
+    X", "is X fully shown" and "is solved" are O(1) and reveal() is O(1) per
+    position instead of rescanning the phrase.
+    """
+
+    __slots__ = (
+        "phrase",
+        "positions",
+        "letter_masks",
+        "letters_mask",
+        "revealed_mask",
+        "revealed_letters",
+        "_remaining",
+        "_unrevealed",
+    )
+
+    def __init__(self, phrase: str = "") -> None:
+        self.phrase: str = phrase
+        index: dict[str, list[int]] = {}
+        masks: dict[str, int] = {}
+        for i, ch in enumerate(phrase):
+            if ch.isalpha():
+                ch = ch.upper()
+                if ch in index:
+                    index[ch].append(i)
+                    masks[ch] |= 1 << i
+                else:
+                    index[ch] = [i]
+                    masks[ch] = 1 << i
+        self.positions: dict[str, tuple[int, ...]] = {
+            letter: tuple(found) for letter, found in index.items()
+        }
+        self.letter_masks: dict[str, int] = masks
+        self.letters_mask: int = 0
+        for mask in masks.values():
+            self.letters_mask |= mask
+        self.reset()
+
+    def reset(self) -> None:
+        self.revealed_mask: int = 0
+        # letters whose every position is shown
+        self.revealed_letters: set[str] = set()
+        self._remaining: dict[str, int] = {
+            letter: len(found) for letter, found in self.positions.items()
+        }
+        self._unrevealed: int = sum(self._remaining.values())
+
+    # ----- queries -----
+    @property
+    def letters(self) -> frozenset[str]:
+        """Every distinct letter in the phrase (upper-case)."""
+        return frozenset(self.positions)
+
+    def count(self, letter: str) -> int:
+        """How many times `letter` appears in the phrase."""
+        return len(self.positions.get(letter.upper(), ()))
+
+    def positions_of(self, letter: str) -> tuple[int, ...]:
+        return self.positions.get(letter.upper(), ())
+
+    def remaining(self, letter: str) -> int:
+        """How many positions of `letter` are still hidden."""
+        return self._remaining.get(letter.upper(), 0)
+
+    def is_revealed(self, pos: int) -> bool:
+        return bool(self.revealed_mask >> pos & 1)
+
+    def is_letter_revealed(self, letter: str) -> bool:
+        return letter.upper() in self.revealed_letters
+
+    def is_solved(self) -> bool:
+        return self._unrevealed == 0
+
+    @property
+    def hidden_count(self) -> int:
+        return self._unrevealed
+
+    def hidden_positions(self) -> list[int]:
+        """Letter positions not yet shown, left to right."""
+        hidden: int = self.letters_mask & ~self.revealed_mask
+        found: list[int] = []
+        while hidden:
+            low: int = hidden & -hidden
+            found.append(low.bit_length() - 1)
+            hidden ^= low
+        return found
+
+    def remaining_letters(self) -> list[str]:
+        """Letters with at least one hidden position, alphabetically."""
+        return sorted(letter for letter, n in self._remaining.items() if n)
+
+    def remaining_consonants(self) -> list[str]:
+        return [letter for letter in self.remaining_letters() if letter not in VOWELS]
+
+    def remaining_vowels(self) -> list[str]:
+        return [letter for letter in self.remaining_letters() if letter in VOWELS]
+
+    def pattern(self, hidden: str = "_") -> str:
+        """The phrase as currently shown, with `hidden` for each unrevealed letter."""
+        mask: int = self.revealed_mask
+        return "".join(
+            hidden if ch.isalpha() and not mask >> i & 1 else ch.upper()
+            for i, ch in enumerate(self.phrase)
+        )
+
+    # ----- updates -----
+    def reveal(self, pos: int) -> bool:
+        """Show the letter at `pos`; False if it isn't a letter or is already shown."""
+        if not 0 <= pos < len(self.phrase):
+            raise IndexError(f"position {pos} out of range for {len(self.phrase)}")
+        bit: int = 1 << pos
+        if not self.letters_mask & bit or self.revealed_mask & bit:
+            return False
+        self.revealed_mask |= bit
+        letter: str = self.phrase[pos].upper()
+        self._remaining[letter] -= 1
+        self._unrevealed -= 1
+        if not self._remaining[letter]:
+            self.revealed_letters.add(letter)
+        return True
+
+    def reveal_letter(self, letter: str) -> tuple[int, ...]:
+        """Show every position of `letter`; returns the positions that were hidden."""
+        letter = letter.upper()
+        hidden: tuple[int, ...] = tuple(
+            pos for pos in self.positions.get(letter, ()) if not self.is_revealed(pos)
+        )
+        for pos in hidden:
+            self.reveal(pos)
+        return hidden
+
+    def reveal_all(self) -> None:
+        self.revealed_mask = self.letters_mask
+        self.revealed_letters = set(self.positions)
+        self._remaining = dict.fromkeys(self.positions, 0)
+        self._unrevealed = 0
@@ -0,0 +1,292 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+from .puzzle_state import VOWELS, PuzzleState
+
+CONSONANTS: str = "".join(ch for ch in "ABCDEFGHIJKLMNOPQRSTUVWXYZ" if ch not in VOWELS)
+
+
+def normalize_word(text: str) -> str:
+    """Upper-case `text` and keep only letters and apostrophes ("" if no letters)."""
+    word: str = "".join(ch for ch in text.strip().upper() if ch.isalpha() or ch == "'")
+    word = word.strip("'")
+    return word if any(ch.isalpha() for ch in word) else ""
+
+
+def load_wordlist(paths: Iterable[str | Path]) -> tuple[list[str], list[str]]:
+    """
+    Read every existing word list in `paths` (one word per line, e.g. a system
+    dictionary). A line may carry a category after a tab ("PIZZA<TAB>Food &
+    Drink"). Returns (words, categories) in file order, duplicates kept once.
+    """
+    seen: dict[str, str] = {}
+    for path in paths:
+        path = Path(path)
+        if not path.is_file():
+            continue
+        with path.open(encoding="utf-8", errors="ignore") as fh:
+            for line in fh:
+                text, _, category = line.rstrip("\n").partition("\t")
+                word: str = normalize_word(text)
+                if word and word not in seen:
+                    seen[word] = category.strip().lower()
+    return list(seen), list(seen.values())
+
+
+def _to_bits(rows: bytearray) -> int:
+    return int.from_bytes(rows, "little")
+
+
+class WordGroup:
+    """
+    All index words of one length. Word i of the group is bit i of every mask:
+    masks[(pos, ch)] has the words with `ch` at `pos`, category_masks the words
+    tagged with a category.
+    """
+
+    __slots__ = ("length", "words", "masks", "all_mask", "category_masks")
+
+    def __init__(self, length: int, words: list[str], categories: list[str]) -> None:
+        self.length: int = length
+        self.words: list[str] = words
+        size: int = (len(words) + 7) // 8
+        rows: dict[tuple[int, str], bytearray] = {}
+        tagged: dict[str, bytearray] = {}
+        # set bits in byte arrays and convert once: or-ing into a growing int
+        # would copy it for every word
+        for i, word in enumerate(words):
+            byte: int = i >> 3
+            bit: int = 1 << (i & 7)
+            for pos, ch in enumerate(word):
+                row: bytearray | None = rows.get((pos, ch))
+                if row is None:
+                    row = rows[(pos, ch)] = bytearray(size)
+                row[byte] |= bit
+            if categories[i]:
+                row = tagged.get(categories[i])
+                if row is None:
+                    row = tagged[categories[i]] = bytearray(size)
+                row[byte] |= bit
+        self.masks: dict[tuple[int, str], int] = {
+            key: _to_bits(row) for key, row in rows.items()
+        }
+        self.category_masks: dict[str, int] = {
+            key: _to_bits(row) for key, row in tagged.items()
+        }
+        self.all_mask: int = (1 << len(words)) - 1
+
+    def mask(self, pos: int, ch: str) -> int:
+        return self.masks.get((pos, ch), 0)
+
+    def take(self, bits: int, limit: int) -> list[str]:
+        """The first `limit` words set in `bits`, in word-list order."""
+        found: list[str] = []
+        while bits and len(found) < limit:
+            low: int = bits & -bits
+            found.append(self.words[low.bit_length() - 1])
+            bits ^= low
+        return found
+
+
+class WordIndex:
+    """
+    A word list indexed for board-pattern queries: words grouped by length, and per
+    (position, letter) a bitset of the words in that group with that letter there.
+    A pattern query is a handful of big-int ANDs instead of a scan of the list.
+    """
+
+    def __init__(
+        self, words: Iterable[str], categories: Iterable[str] | None = None
+    ) -> None:
+        words = list(words)
+        tags: list[str] = list(categories) if categories is not None else []
+        tags += [""] * (len(words) - len(tags))
+        by_length: dict[int, tuple[list[str], list[str]]] = {}
+        seen: set[str] = set()
+        for word, tag in zip(words, tags):
+            word = normalize_word(word)
+            if not word or word in seen:
+                continue
+            seen.add(word)
+            group_words, group_tags = by_length.setdefault(len(word), ([], []))
+            group_words.append(word)
+            group_tags.append(tag.lower())
+        self.groups: dict[int, WordGroup] = {
+            length: WordGroup(length, group_words, group_tags)
+            for length, (group_words, group_tags) in sorted(by_length.items())
+        }
+
+    @classmethod
+    def from_files(cls, paths: Iterable[str | Path]) -> "WordIndex":
+        words, categories = load_wordlist(paths)
+        return cls(words, categories)
+
+    def __len__(self) -> int:
+        return sum(len(group.words) for group in self.groups.values())
+
+    def group(self, length: int) -> WordGroup | None:
+        return self.groups.get(length)
+
+    def match(
+        self, pattern: str, excluded: Iterable[str] = (), hidden: str = "_"
+    ) -> list[str]:
+        """
+        Words fitting `pattern` ("_A__'S"), where a `hidden` cell can't hold any
+        letter in `excluded` or any letter already shown. One-off query; the host
+        panel uses SolverSession to keep results up to date incrementally.
+        """
+        pattern = pattern.upper()
+        group: WordGroup | None = self.group(len(pattern))
+        if group is None:
+            return []
+        shown: set[str] = {ch for ch in pattern if ch != hidden}
+        # a hidden cell is a letter, never an apostrophe
+        banned: set[str] = {ch.upper() for ch in excluded} | shown | {"'"}
+        bits: int = group.all_mask
+        for pos, ch in enumerate(pattern):
+            if ch != hidden:
+                bits &= group.mask(pos, ch)
+            else:
+                for letter in banned:
+                    bits &= ~group.mask(pos, letter)
+            if not bits:
+                break
+        return group.take(bits, len(group.words))
+
+
+@dataclass(slots=True)
+class WordSlot:
+    """One word of the puzzle and the index words still consistent with the board."""
+
+    positions: tuple[int, ...]  # phrase index of each cell
+    group: WordGroup | None
+    candidates: int = 0
+
+    @property
+    def count(self) -> int:
+        return self.candidates.bit_count()
+
+
+class SolverSession:
+    """
+    Host-assist state for the puzzle on the board.
+
+    start() splits the phrase into word slots and seeds each slot with every index
+    word of its length. update() then applies only what changed since the last call
+    (positions shown since, letters known since), so each call costs a few big-int
+    ANDs per new fact and never rescans the word list.
+
+    A letter is "known" once it has been called or is fully shown; a known letter
+    can't be behind any cell that is still hidden, because calling a letter shows
+    every occurrence of it.
+    """
+
+    def __init__(self, index: WordIndex) -> None:
+        self.index: WordIndex = index
+        self.category: str = ""
+        self.slots: list[WordSlot] = []
+        # phrase position -> (slot, offset within the word)
+        self._cells: dict[int, tuple[WordSlot, int]] = {}
+        self._seen_mask: int = 0
+        self._known: set[str] = set()
+
+    def start(self, state: PuzzleState, category: str = "") -> None:
+        self.category = category.strip().lower()
+        self.slots = []
+        self._cells = {}
+        self._seen_mask = 0
+        self._known = set()
+        phrase: str = state.phrase
+        i: int = 0
+        while i < len(phrase):
+            if not phrase[i].isalpha():
+                i += 1
+                continue
+            start: int = i
+            while i < len(phrase) and (phrase[i].isalpha() or phrase[i] == "'"):
+                i += 1
+            end: int = i
+            while phrase[end - 1] == "'":
+                end -= 1
+            slot: WordSlot = WordSlot(
+                tuple(range(start, end)), self.index.group(end - start)
+            )
+            if slot.group is not None:
+                slot.candidates = slot.group.all_mask
+                # apostrophes are shown from the start: they must line up exactly,
+                # and a letter cell can't hold one
+                for offset, pos in enumerate(slot.positions):
+                    if phrase[pos] == "'":
+                        slot.candidates &= slot.group.mask(offset, "'")
+                    else:
+                        slot.candidates &= ~slot.group.mask(offset, "'")
+            for offset, pos in enumerate(slot.positions):
+                self._cells[pos] = (slot, offset)
+            self.slots.append(slot)
+
+    def update(self, state: PuzzleState, called: Iterable[str] = ()) -> None:
+        """Narrow the candidates by whatever the board showed since the last call."""
+        new_mask: int = state.revealed_mask & ~self._seen_mask
+        self._seen_mask |= new_mask
+        while new_mask:
+            low: int = new_mask & -new_mask
+            new_mask ^= low
+            pos: int = low.bit_length() - 1
+            cell: tuple[WordSlot, int] | None = self._cells.get(pos)
+            if cell is not None and cell[0].group is not None:
+                slot, offset = cell
+                slot.candidates &= slot.group.mask(offset, state.phrase[pos].upper())
+
+        known: set[str] = set(state.revealed_letters)
+        known.update(ch.upper() for ch in called)
+        new_letters: set[str] = known - self._known
+        if not new_letters:
+            return
+        self._known |= new_letters
+        for slot in self.slots:
+            if slot.group is None or not slot.candidates:
+                continue
+            for offset, pos in enumerate(slot.positions):
+                if state.is_revealed(pos) or state.phrase[pos] == "'":
+                    continue
+                for letter in new_letters:
+                    slot.candidates &= ~slot.group.mask(offset, letter)
+
+    # ----- results -----
+    def _ordered(self, slot: WordSlot, limit: int) -> list[str]:
+        # words tagged with the puzzle's category first, then word-list order
+        tagged: int = slot.group.category_masks.get(self.category, 0)
+        found: list[str] = slot.group.take(slot.candidates & tagged, limit)
+        found += slot.group.take(slot.candidates & ~tagged, limit - len(found))
+        return found
+
+    def candidates(self, limit: int = 10) -> list[list[str]]:
+        """Up to `limit` fitting words for each word slot; [] where none fit."""
+        return [
+            self._ordered(slot, limit) if slot.group is not None else []
+            for slot in self.slots
+        ]
+
+    def rank_consonants(self, state: PuzzleState) -> list[tuple[str, float]]:
+        """
+        Unknown consonants by expected hits: for every hidden cell, the share of its
+        slot's candidates with that consonant there, summed. Best first; slots with
+        no candidates (words missing from the list) don't count.
+        """
+        scores: dict[str, float] = {}
+        letters: list[str] = [ch for ch in CONSONANTS if ch not in self._known]
+        for slot in self.slots:
+            total: int = slot.count
+            if not total:
+                continue
+            for offset, pos in enumerate(slot.positions):
+                if state.is_revealed(pos) or state.phrase[pos] == "'":
+                    continue
+                for letter in letters:
+                    hits: int = slot.candidates & slot.group.mask(offset, letter)
+                    if hits:
+                        scores[letter] = scores.get(letter, 0.0) + (
+                            hits.bit_count() / total
+                        )
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
@@ -0,0 +1,105 @@
+import math
+import random
+from dataclasses import dataclass
+
+from .wedge import WedgeLayout
+from .constants import (
+    SPIN_FRICTION_RANGE,
+    SPIN_STEP_JITTER_MS,
+    SPIN_STEP_MS,
+    SPIN_STOP_VELOCITY,
+    SPIN_VELOCITY_RANGE,
+)
+
+
+def spin_steps(
+    velocity: float, friction: float, stop_velocity: float = SPIN_STOP_VELOCITY
+) -> int:
+    """
+    Number of frame steps before the velocity decays below `stop_velocity`, i.e. the
+    smallest n >= 1 with velocity * friction**n < stop_velocity.
+    """
+    if velocity < stop_velocity:
+        return 1
+    steps: float = math.log(stop_velocity / velocity) / math.log(friction)
+    return max(1, math.floor(steps) + 1)
+
+
+def spin_distance(velocity: float, friction: float, steps: int) -> float:
+    """
+    Total degrees travelled over `steps` frames: the closed-form sum of the friction
+    series velocity * (1 + f + f**2 + ... + f**(steps - 1)).
+    """
+    return velocity * (1.0 - friction**steps) / (1.0 - friction)
+
+
+@dataclass
+class SpinPlan:
+    start: float
+    distance: float
+    velocity: float
+    friction: float
+    steps: int
+    step_ms: float = SPIN_STEP_MS
+
+    @property
+    def duration_ms(self) -> float:
+        return self.steps * self.step_ms
+
+    @property
+    def final_rotation(self) -> float:
+        return (self.start + self.distance) % 360.0
+
+    def progress(self, elapsed_ms: float) -> float:
+        """
+        Fraction of the distance covered after `elapsed_ms`. This is the friction
+        series evaluated at fractional steps, so the wheel eases out exactly like the
+        old per-tick model but independently of how many frames were drawn.
+        """
+        if elapsed_ms <= 0:
+            return 0.0
+        k: float = elapsed_ms / self.step_ms
+        if k >= self.steps:
+            return 1.0
+        return (1.0 - self.friction**k) / (1.0 - self.friction**self.steps)
+
+    def rotation_at(self, elapsed_ms: float) -> float:
+        return (self.start + self.distance * self.progress(elapsed_ms)) % 360.0
+
+    def finished(self, elapsed_ms: float) -> bool:
+        return elapsed_ms >= self.duration_ms
+
+
+def plan_spin(
+    start: float,
+    layout: WedgeLayout | None = None,
+    target_index: int | None = None,
+    rng: random.Random | None = None,
+) -> SpinPlan:
+    """
+    Draw a random velocity / friction pair and compute where the wheel will stop.
+    The step length is jittered slightly so spin durations vary.
+
+    When `target_index` is given (rehearsals, tests) the natural distance is extended
+    by less than one revolution so the wheel lands inside that wedge of `layout`,
+    away from its edges; duration and feel of the spin are unchanged.
+    """
+    rng = rng or random
+    velocity: float = rng.uniform(*SPIN_VELOCITY_RANGE)
+    friction: float = rng.uniform(*SPIN_FRICTION_RANGE)
+    steps: int = spin_steps(velocity, friction)
+    distance: float = spin_distance(velocity, friction, steps)
+
+    if target_index is not None and layout:
+        idx: int = target_index % len(layout)
+        target: float = layout.rotation_for(idx, rng.uniform(0.2, 0.8))
+        distance += (target - (start + distance)) % 360.0
+
+    return SpinPlan(
+        start=start % 360.0,
+        distance=distance,
+        velocity=velocity,
+        friction=friction,
+        steps=steps,
+        step_ms=SPIN_STEP_MS + rng.uniform(-SPIN_STEP_JITTER_MS, SPIN_STEP_JITTER_MS),
+    )
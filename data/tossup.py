@@ -0,0 +1,98 @@
+import random
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from .puzzle_state import PuzzleState
+from .constants import (
+    TOSSUP_INTERVAL_MS,
+    TOSSUP_MIN_INTERVAL_MS,
+    TOSSUP_PACING_CURVE,
+)
+
+# pacing curves: (step, total steps) -> multiplier for the base reveal interval
+TOSSUP_PACING: dict[str, Callable[[int, int], float]] = {
+    "constant": lambda step, total: 1.0,
+    # starts at the base interval and ends at a third of it
+    "accelerating": lambda step, total: 1.0 - (2 / 3) * step / max(1, total - 1),
+    # slow start, then steady
+    "ease_in": lambda step, total: 1.0 + max(0.0, 1.0 - 4 * step / max(1, total)),
+}
+
+
+@dataclass
+class TossupSchedule:
+    """
+    Reveal order and pacing for one toss-up, fixed when the puzzle is loaded.
+
+    `order` is a permutation of the puzzle's letter positions and `delays_ms[i]` is
+    how long to wait before revealing `order[i]`. next_position() is O(1) amortized:
+    it only walks forward past positions that were revealed some other way.
+    """
+
+    order: list[int]
+    delays_ms: list[float]
+    seed: int | None = None
+    cursor: int = field(default=0)
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    @property
+    def remaining(self) -> int:
+        return len(self.order) - self.cursor
+
+    def _skip_revealed(self, state: PuzzleState | None) -> None:
+        if state is not None:
+            while self.cursor < len(self.order) and state.is_revealed(
+                self.order[self.cursor]
+            ):
+                self.cursor += 1
+
+    def next_delay_ms(self, state: PuzzleState | None = None) -> float | None:
+        """
+        Wait before the next reveal; None once the schedule is exhausted. Positions
+        already shown in `state` (if given) are skipped first, so the wait is the
+        one paced for the position that will actually be revealed.
+        """
+        self._skip_revealed(state)
+        if self.cursor >= len(self.order):
+            return None
+        return self.delays_ms[self.cursor]
+
+    def next_position(self, state: PuzzleState | None = None) -> int | None:
+        """Advance to the next position still hidden in `state` (if given)."""
+        self._skip_revealed(state)
+        if self.cursor >= len(self.order):
+            return None
+        pos: int = self.order[self.cursor]
+        self.cursor += 1
+        return pos
+
+    def reset(self) -> None:
+        self.cursor = 0
+
+
+def plan_tossup(
+    state: PuzzleState,
+    seed: int | None = None,
+    interval_ms: float = TOSSUP_INTERVAL_MS,
+    pacing: str | Callable[[int, int], float] = TOSSUP_PACING_CURVE,
+    min_interval_ms: float = TOSSUP_MIN_INTERVAL_MS,
+    rng: random.Random | None = None,
+) -> TossupSchedule:
+    """
+    Shuffle the hidden letter positions of `state` once and pace them with `pacing`
+    (a TOSSUP_PACING name or a (step, total) -> multiplier callable). The same seed
+    always gives the same order.
+    """
+    rng = rng or random.Random(seed)
+    curve: Callable[[int, int], float] = (
+        TOSSUP_PACING[pacing] if isinstance(pacing, str) else pacing
+    )
+    order: list[int] = state.hidden_positions()
+    rng.shuffle(order)
+    total: int = len(order)
+    delays: list[float] = [
+        max(min_interval_ms, interval_ms * curve(step, total)) for step in range(total)
+    ]
+    return TossupSchedule(order=order, delays_ms=delays, seed=seed)
@@ -0,0 +1,88 @@
+import bisect
+import math
+from dataclasses import dataclass
+
+# the pointer sits at 12 o'clock: 90 degrees counter-clockwise from 3 o'clock
+POINTER_ANGLE: float = 90.0
+
+
+@dataclass(frozen=True)
+class Wedge:
+    value: float | str
+    # relative width; 1.0 is a standard wedge, 1/3 a jackpot sliver
+    width: float = 1.0
+
+
+def wheel_angle_at_pointer(rotation: float) -> float:
+    """Wheel-local angle (degrees from the wheel origin) currently under the pointer."""
+    return (-rotation - POINTER_ANGLE) % 360.0
+
+
+def rotation_for_angle(angle: float) -> float:
+    """Inverse of wheel_angle_at_pointer: the rotation that puts `angle` under it."""
+    return (-angle - POINTER_ANGLE) % 360.0
+
+
+class WedgeLayout:
+    """
+    Angular layout of the wheel, built once from a wedge list. Entries may be plain
+    values (standard width) or Wedge instances with a custom relative width.
+
+    Wedge i spans [starts[i], starts[i] + sweeps[i]) degrees from the wheel origin.
+    Lookups go through a fixed-resolution table for O(1) hits and fall back to a
+    bisect over the cumulative start angles for table bins that straddle a boundary.
+    """
+
+    def __init__(
+        self, wedges: list["float | str | Wedge"], resolution: int = 3600
+    ) -> None:
+        self.wedges: list[Wedge] = [
+            w if isinstance(w, Wedge) else Wedge(value=w) for w in wedges
+        ]
+        if any(w.width <= 0 for w in self.wedges):
+            raise ValueError("wedge widths must be positive")
+        self.values: list[float | str] = [w.value for w in self.wedges]
+
+        total: float = sum(w.width for w in self.wedges) or 1.0
+        self.sweeps: list[float] = [w.width * 360.0 / total for w in self.wedges]
+        self.starts: list[float] = []
+        acc: float = 0.0
+        for sweep in self.sweeps:
+            self.starts.append(acc)
+            acc += sweep
+
+        self.key: tuple = tuple((w.value, w.width) for w in self.wedges)
+
+        # table[b] is the wedge covering bin b entirely, or -1 if a boundary falls in it
+        self._bin: float = 360.0 / resolution
+        self._table: list[int] = []
+        if self.wedges:
+            for b in range(resolution):
+                lo: int = self._bisect(b * self._bin)
+                hi: int = self._bisect(math.nextafter((b + 1) * self._bin, 0.0))
+                self._table.append(lo if lo == hi else -1)
+
+    def __len__(self) -> int:
+        return len(self.wedges)
+
+    def _bisect(self, angle: float) -> int:
+        return max(0, bisect.bisect_right(self.starts, angle) - 1)
+
+    def index_for_angle(self, angle: float) -> int | None:
+        """Index of the wedge containing the wheel-local `angle` (degrees)."""
+        if not self.wedges:
+            return None
+        angle %= 360.0
+        idx: int = self._table[min(int(angle / self._bin), len(self._table) - 1)]
+        return idx if idx >= 0 else self._bisect(angle)
+
+    def index_at(self, rotation: float) -> int | None:
+        """Index of the wedge under the pointer when the wheel is at `rotation`."""
+        return self.index_for_angle(wheel_angle_at_pointer(rotation))
+
+    def mid_angle(self, idx: int) -> float:
+        return self.starts[idx] + self.sweeps[idx] / 2.0
+
+    def rotation_for(self, idx: int, fraction: float = 0.5) -> float:
+        """Rotation that stops the pointer `fraction` of the way across wedge idx."""
+        return rotation_for_angle(self.starts[idx] + self.sweeps[idx] * fraction)
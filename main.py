@@ -1,11 +1,40 @@
+import argparse
+import random
 import sys
 from PySide6 import QtWidgets
-from widgets import GameWindow
+from widgets import GameWindow, use_software_scenegraph
 
 
 def main() -> None:
-    app = QtWidgets.QApplication(sys.argv)
-    w = GameWindow()
+    parser = argparse.ArgumentParser(description="Wheel of Fortune")
+    parser.add_argument(
+        "--backend",
+        choices=["widgets", "quick"],
+        default="widgets",
+        help="draw wheel and board with QPainter widgets or the QtQuick scene graph",
+    )
+    parser.add_argument(
+        "--software",
+        action="store_true",
+        help="use the software scene-graph adaptor (machines without a GPU)",
+    )
+    parser.add_argument(
+        "--puzzles",
+        help="puzzle file: .json, .jsonl or a SQLite library that tracks air history",
+    )
+    parser.add_argument(
+        "--seed", type=int, help="seed the wheel so every run spins the same"
+    )
+    args, qt_args = parser.parse_known_args()
+
+    if args.software:
+        use_software_scenegraph()
+    app = QtWidgets.QApplication(sys.argv[:1] + qt_args)
+    w = GameWindow(
+        backend=args.backend,
+        puzzles_path=args.puzzles,
+        rng=random.Random(args.seed) if args.seed is not None else None,
+    )
     w.showMaximized()
     sys.exit(app.exec())
 
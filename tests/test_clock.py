@@ -0,0 +1,107 @@
+from utils.clock import VirtualClock
+from utils.timeline import Timeline
+
+
+def test_repeating_timer_fires_every_interval() -> None:
+    clock: VirtualClock = VirtualClock()
+    ticks: list[float] = []
+    timer = clock.timer(lambda: ticks.append(clock.now_ms()))
+    timer.start(100)
+    assert timer.isActive() and timer.interval() == 100.0
+    assert clock.advance(350) == 3
+    assert ticks == [100.0, 200.0, 300.0]
+    assert clock.now_ms() == 350.0
+    assert timer.isActive()
+
+
+def test_single_shot_fires_once_and_goes_idle() -> None:
+    clock: VirtualClock = VirtualClock()
+    fired: list[float] = []
+    timer = clock.timer(lambda: fired.append(clock.now_ms()), single_shot=True)
+    timer.start(50)
+    assert clock.pending() == 1
+    assert clock.advance(1000) == 1
+    assert fired == [50.0]
+    assert not timer.isActive()
+    assert clock.pending() == 0
+
+    clock.single_shot(10, lambda: fired.append(clock.now_ms()))
+    clock.advance(10)
+    assert fired == [50.0, 1010.0]
+
+
+def test_restart_and_stop_drop_the_pending_tick() -> None:
+    clock: VirtualClock = VirtualClock()
+    fired: list[float] = []
+    timer = clock.timer(lambda: fired.append(clock.now_ms()), single_shot=True)
+    timer.start(100)
+    clock.advance(60)
+    # restarting re-arms from now; the first deadline no longer fires
+    timer.start()
+    clock.advance(60)
+    assert fired == []
+    clock.advance(40)
+    assert fired == [160.0]
+
+    timer.start(100)
+    timer.stop()
+    assert not timer.isActive()
+    assert clock.advance(500) == 0
+    assert fired == [160.0]
+
+
+def test_run_until_idle_stops_when_nothing_is_armed() -> None:
+    clock: VirtualClock = VirtualClock()
+    clock.single_shot(2500, lambda: None)
+    assert clock.run_until_idle(step_ms=1000) == 3000.0
+    assert clock.pending() == 0
+
+    # a repeating timer never goes idle; the limit ends the run
+    clock.timer(lambda: None).start(10)
+    assert clock.run_until_idle(limit_ms=2000, step_ms=500) == 2000.0
+
+
+def test_timeline_runs_headless_on_the_virtual_clock() -> None:
+    # the board's reveal pattern: one single-shot timer re-armed for the next event
+    clock: VirtualClock = VirtualClock()
+    timeline: Timeline = Timeline(clock.now_ms)
+    events: list[tuple[str, float]] = []
+
+    def arm() -> None:
+        delay: float | None = timeline.next_delay_ms()
+        if delay is not None:
+            timer.start(delay)
+
+    def on_timer() -> None:
+        timeline.run_due()
+        arm()
+
+    timer = clock.timer(on_timer, single_shot=True)
+    for step, pos in enumerate((3, 5, 8)):
+        placed_at: float = 1000.0 + step * 500.0
+        timeline.schedule(placed_at, lambda p=pos: events.append(("blue", p)))
+        timeline.schedule(
+            placed_at + 500.0,
+            lambda: events.append(("letter", clock.now_ms())),
+        )
+    arm()
+
+    clock.run_until_idle(step_ms=100)
+    assert [e for e in events if e[0] == "blue"] == [
+        ("blue", 3),
+        ("blue", 5),
+        ("blue", 8),
+    ]
+    assert [t for kind, t in events if kind == "letter"] == [1500.0, 2000.0, 2500.0]
+    assert len(timeline) == 0
+
+    # pausing the timeline holds queued events until it resumes
+    timeline.schedule(100.0, lambda: events.append(("late", clock.now_ms())))
+    timeline.pause()
+    arm()
+    clock.advance(1000)
+    assert events[-1][0] == "letter"
+    timeline.resume()
+    arm()
+    clock.run_until_idle(step_ms=10)
+    assert events[-1][0] == "late"
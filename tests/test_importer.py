@@ -0,0 +1,76 @@
+from pathlib import Path
+
+from utils.importer import ImportIssue, import_puzzles, read_rows, validate_record
+
+
+def _codes(issues: list[ImportIssue]) -> set[str]:
+    return {i.code for i in issues}
+
+
+def test_letters_are_checked_before_upper_casing() -> None:
+    puzzle, issues = validate_record(1, {"category": "C", "phrase": "straße"})
+    assert puzzle is None
+    assert _codes(issues) == {"unselectable_letter"}
+
+
+def test_only_board_punctuation_is_allowed() -> None:
+    ok, issues = validate_record(1, {"category": "C", "phrase": "it's a ten!"})
+    assert ok == {"type": "MAIN", "category": "C", "phrase": "IT'S A TEN!"}
+    assert not issues
+    bad, issues = validate_record(1, {"category": "C", "phrase": "it’s a ten"})
+    assert bad is None
+    assert _codes(issues) == {"unshowable_character"}
+
+
+def test_multiline_phrase_is_rejected() -> None:
+    puzzle, issues = validate_record(1, {"category": "C", "phrase": "A\nB"})
+    assert puzzle is None
+    assert "multiline_phrase" in _codes(issues)
+
+
+def test_unclosed_quote_is_reported_not_imported(tmp_path: Path) -> None:
+    src: Path = tmp_path / "in.csv"
+    src.write_text(
+        'category,phrase,type,prize_value\nA,"HELLO WORLD,MAIN,\nB,FOO,MAIN,\n',
+        encoding="utf-8",
+    )
+    rows = list(read_rows(src))
+    assert len(rows) == 1
+    line, row = rows[0]
+    assert line == 2
+    assert isinstance(row, ImportIssue) and row.code == "bad_csv"
+
+    stats = import_puzzles(
+        src, tmp_path / "out.jsonl", tmp_path / "errors.jsonl", workers=1
+    )
+    assert stats.imported == 0
+    assert stats.issues["bad_csv"] == 1
+    assert (tmp_path / "out.jsonl").read_text(encoding="utf-8") == ""
+
+
+def test_oversized_field_does_not_abort_the_import(tmp_path: Path) -> None:
+    src: Path = tmp_path / "in.csv"
+    src.write_text(
+        "category,phrase,type\n"
+        f'A,"{"X" * 200_000}",MAIN\n'
+        "B,GOOD ONE,MAIN\n",
+        encoding="utf-8",
+    )
+    stats = import_puzzles(
+        src, tmp_path / "out.jsonl", tmp_path / "errors.jsonl", workers=1
+    )
+    assert (stats.rows, stats.imported) == (2, 1)
+    assert stats.issues["bad_csv"] == 1
+
+
+def test_quoted_delimiter_is_not_an_issue(tmp_path: Path) -> None:
+    src: Path = tmp_path / "in.csv"
+    src.write_text(
+        'category,phrase,type\nA,"YES, CHEF",MAIN\nB,YES, CHEF,MAIN\n',
+        encoding="utf-8",
+    )
+    stats = import_puzzles(
+        src, tmp_path / "out.jsonl", tmp_path / "errors.jsonl", workers=1
+    )
+    assert (stats.rows, stats.imported) == (2, 1)
+    assert set(stats.issues) == {"extra_fields"}
@@ -0,0 +1,102 @@
+import pytest
+
+from data.puzzle_state import PuzzleState
+
+PHRASE: str = "MRS. PIGGY'S A TEN!"
+
+
+def test_count_is_case_insensitive_and_skips_punctuation() -> None:
+    state: PuzzleState = PuzzleState(PHRASE)
+    assert state.count("G") == 2
+    assert state.count("s") == 2
+    assert state.count("Z") == 0
+    assert state.count("'") == 0
+    assert state.letters == frozenset("MRSPIGYATEN")
+
+
+def test_reveal_returns_whether_a_letter_was_shown() -> None:
+    state: PuzzleState = PuzzleState(PHRASE)
+    assert state.reveal(0) is True
+    assert state.reveal(0) is False  # already shown
+    assert state.reveal(3) is False  # "."
+    assert state.reveal(4) is False  # " "
+    assert state.is_revealed(0)
+    assert state.remaining("M") == 0
+    assert state.is_letter_revealed("M")
+
+
+def test_reveal_letter_returns_only_newly_shown_positions() -> None:
+    state: PuzzleState = PuzzleState(PHRASE)
+    assert state.reveal_letter("g") == (7, 8)
+    assert state.reveal_letter("G") == ()
+    state.reveal(2)
+    assert state.reveal_letter("S") == (11,)
+    assert state.remaining("S") == 0
+    assert state.reveal_letter("Z") == ()
+
+
+def test_is_solved_before_and_after_reveal_all() -> None:
+    state: PuzzleState = PuzzleState(PHRASE)
+    assert not state.is_solved()
+    assert state.hidden_count == 13
+    state.reveal_all()
+    assert state.is_solved()
+    assert state.hidden_count == 0
+    assert state.remaining_letters() == []
+    assert state.pattern() == PHRASE
+
+
+def test_solved_by_revealing_every_letter() -> None:
+    state: PuzzleState = PuzzleState("A-BA")
+    for letter in "AB":
+        state.reveal_letter(letter)
+    assert state.is_solved()
+
+
+def test_remaining_consonants_and_vowels() -> None:
+    state: PuzzleState = PuzzleState(PHRASE)
+    assert state.remaining_consonants() == ["G", "M", "N", "P", "R", "S", "T", "Y"]
+    assert state.remaining_vowels() == ["A", "E", "I"]
+    state.reveal_letter("S")
+    state.reveal_letter("E")
+    assert "S" not in state.remaining_consonants()
+    assert state.remaining_vowels() == ["A", "I"]
+
+
+def test_pattern_keeps_spaces_and_punctuation() -> None:
+    state: PuzzleState = PuzzleState("it's a ten!")
+    assert state.pattern() == "__'_ _ ___!"
+    state.reveal_letter("t")
+    assert state.pattern() == "_T'_ _ T__!"
+    assert state.pattern(hidden="?") == "?T'? ? T??!"
+
+
+def test_hidden_positions_follow_reveals() -> None:
+    state: PuzzleState = PuzzleState("AB BA")
+    assert state.hidden_positions() == [0, 1, 3, 4]
+    state.reveal_letter("A")
+    assert state.hidden_positions() == [1, 3]
+
+
+def test_reset_hides_everything_again() -> None:
+    state: PuzzleState = PuzzleState(PHRASE)
+    state.reveal_all()
+    state.reset()
+    assert state.hidden_count == 13
+    assert state.pattern().count("_") == 13
+
+
+@pytest.mark.parametrize("pos", [-1, -100, len(PHRASE), len(PHRASE) + 5])
+def test_reveal_out_of_range_raises_index_error(pos: int) -> None:
+    state: PuzzleState = PuzzleState(PHRASE)
+    with pytest.raises(IndexError):
+        state.reveal(pos)
+    assert state.hidden_count == 13
+
+
+def test_empty_phrase_is_solved() -> None:
+    state: PuzzleState = PuzzleState("")
+    assert state.is_solved()
+    assert state.pattern() == ""
+    with pytest.raises(IndexError):
+        state.reveal(0)
@@ -0,0 +1,18 @@
+from data.puzzle_state import PuzzleState
+from data.solver import SolverSession, WordIndex
+
+WORDS: list[str] = ["DON'T", "DOING", "DONUT", "CAN'T", "CANTO"]
+
+
+def test_hidden_cells_never_match_an_apostrophe() -> None:
+    index: WordIndex = WordIndex(WORDS)
+    assert index.match("_____") == ["DOING", "DONUT", "CANTO"]
+    assert index.match("___'_") == ["DON'T", "CAN'T"]
+
+
+def test_session_keeps_apostrophe_words_out_of_letter_slots() -> None:
+    session: SolverSession = SolverSession(WordIndex(WORDS))
+    state: PuzzleState = PuzzleState("DONUT CAN'T")
+    session.start(state)
+    session.update(state)
+    assert session.candidates() == [["DOING", "DONUT", "CANTO"], ["DON'T", "CAN'T"]]
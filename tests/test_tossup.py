@@ -0,0 +1,28 @@
+from data.puzzle_state import PuzzleState
+from data.tossup import TossupSchedule, plan_tossup
+
+
+def test_delay_skips_positions_revealed_by_a_guess() -> None:
+    state: PuzzleState = PuzzleState("ABCD")
+    schedule: TossupSchedule = plan_tossup(
+        state,
+        seed=1,
+        interval_ms=100.0,
+        pacing=lambda step, total: step + 1.0,
+        min_interval_ms=0.0,
+    )
+    assert schedule.next_delay_ms(state) == 100.0
+    # a guessed letter shows the first two scheduled positions
+    state.reveal(schedule.order[0])
+    state.reveal(schedule.order[1])
+    assert schedule.next_delay_ms(state) == 300.0
+    assert schedule.next_position(state) == schedule.order[2]
+    assert schedule.next_delay_ms(state) == 400.0
+    assert schedule.next_position(state) == schedule.order[3]
+    assert schedule.next_delay_ms(state) is None
+    assert schedule.next_position(state) is None
+
+
+def test_same_seed_gives_same_order() -> None:
+    state: PuzzleState = PuzzleState("HELLO WORLD")
+    assert plan_tossup(state, seed=7).order == plan_tossup(state, seed=7).order
@@ -1,3 +1,6 @@
 from .utils import fmt_money
+from .frame_stats import FrameStats
+from .timeline import Timeline
+from .clock import Clock, VirtualClock
 
-__all__ = ["fmt_money"]
+__all__ = ["fmt_money", "FrameStats", "Timeline", "Clock", "VirtualClock"]
@@ -0,0 +1,173 @@
+"""
+Micro-benchmarks for Qt-free game state.
+
+Compares PuzzleState against the phrase rescans BoardWidget used to do for a
+guess (find positions, rebuild positions_for_letter per converted square) and for
+the solved check, on every puzzle in data/puzzles.json.
+
+--memory compares a list of Puzzle dataclasses with PuzzleColumns for banks of
+synthetic puzzles (the real ones with a serial number appended): traced memory
+and the time to filter by type and category.
+
+    python -m utils.benchmarks
+    python -m utils.benchmarks --repeat 200 --json
+    python -m utils.benchmarks --memory --sizes 10000 100000 1000000
+"""
+
+import argparse
+import json
+import sys
+from collections.abc import Callable, Iterator
+import time
+import timeit
+import tracemalloc
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.resolve()))
+
+from data import Puzzle, PuzzleColumns, Puzzles, PuzzleState
+
+
+def _scan_guess_all(phrase: str) -> bool:
+    # the old per-guess work: enumerate positions, then for each converted square
+    # rebuild that letter's positions and check them all
+    revealed: set[str] = set()
+    revealed_positions: set[int] = set()
+    correct: set[str] = set(ch.upper() for ch in phrase if ch.isalpha())
+    for letter in sorted(correct):
+        positions: list[int] = [i for i, c in enumerate(phrase) if c.upper() == letter]
+        for pos in positions:
+            revealed_positions.add(pos)
+            positions_for_letter = [
+                i for i, c in enumerate(phrase) if c.upper() == letter
+            ]
+            if all(p in revealed_positions for p in positions_for_letter):
+                revealed.add(letter)
+        # is_solved() after every guess
+        correct.issubset(revealed)
+    return correct.issubset(revealed)
+
+
+def _state_guess_all(phrase: str) -> bool:
+    state: PuzzleState = PuzzleState(phrase)
+    for letter in sorted(state.positions):
+        for pos in state.positions_of(letter):
+            state.reveal(pos)
+        state.is_solved()
+    return state.is_solved()
+
+
+def run(repeat: int = 50) -> dict[str, dict[str, float]]:
+    phrases: list[str] = [p.phrase for p in Puzzles().get_puzzles()]
+    # one long phrase to show how the rescans scale
+    phrases.append(" ".join(phrases)[:2000])
+
+    def per_call_us(fn) -> float:
+        seconds: float = timeit.timeit(
+            lambda: [fn(phrase) for phrase in phrases], number=repeat
+        )
+        return round(seconds / (repeat * len(phrases)) * 1e6, 2)
+
+    scan_us: float = per_call_us(_scan_guess_all)
+    state_us: float = per_call_us(_state_guess_all)
+    return {
+        "guess_all_letters": {
+            "scan_us": scan_us,
+            "puzzle_state_us": state_us,
+            "speedup": round(scan_us / state_us, 2) if state_us else 0.0,
+        }
+    }
+
+
+def _synthetic_puzzles(size: int) -> Iterator[Puzzle]:
+    base: list[Puzzle] = Puzzles().get_puzzles()
+    for i in range(size):
+        p: Puzzle = base[i % len(base)]
+        yield Puzzle(p.category, f"{p.phrase} {i}", p.type, p.prize_value)
+
+
+def _traced(build: Callable[[], object]) -> tuple[object, int]:
+    """Build something under tracemalloc; returns it and the bytes it holds."""
+    tracemalloc.start()
+    before: int = tracemalloc.get_traced_memory()[0]
+    built: object = build()
+    after: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return built, after - before
+
+
+def _best_ms(fn: Callable[[], object], repeat: int = 3) -> float:
+    best: float = float("inf")
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return round(best * 1000.0, 2)
+
+
+def run_memory(sizes: list[int]) -> dict[str, dict[str, float]]:
+    results: dict[str, dict[str, float]] = {}
+    for size in sizes:
+        puzzles, list_bytes = _traced(lambda: list(_synthetic_puzzles(size)))
+        columns, columns_bytes = _traced(
+            lambda: PuzzleColumns.from_puzzles(_synthetic_puzzles(size))
+        )
+        list_ms: float = _best_ms(
+            lambda: [
+                i
+                for i, p in enumerate(puzzles)
+                if p.type == "TOSS-UP" and p.category == "Quotes"
+            ]
+        )
+        columns_ms: float = _best_ms(lambda: columns.filter("TOSS-UP", "Quotes"))
+        results[f"{size:,} puzzles"] = {
+            "list_mb": round(list_bytes / 2**20, 1),
+            "columns_mb": round(columns_bytes / 2**20, 1),
+            "memory_ratio": round(list_bytes / columns_bytes, 1),
+            "list_filter_ms": list_ms,
+            "columns_filter_ms": columns_ms,
+            "filter_speedup": round(list_ms / columns_ms, 1) if columns_ms else 0.0,
+        }
+        del puzzles, columns
+    return results
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="PuzzleState micro-benchmarks")
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument(
+        "--memory", action="store_true", help="Puzzle list vs PuzzleColumns"
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--json", action="store_true", help="print raw JSON")
+    args = parser.parse_args(argv)
+
+    if args.memory:
+        memory: dict[str, dict[str, float]] = run_memory(args.sizes)
+        if args.json:
+            print(json.dumps(memory, indent=2))
+            return
+        for name, r in memory.items():
+            print(
+                f"{name:>17}  list {r['list_mb']:>7.1f} MB  "
+                f"columns {r['columns_mb']:>6.1f} MB  x{r['memory_ratio']:.1f}   "
+                f"filter {r['list_filter_ms']:>8.2f} ms -> "
+                f"{r['columns_filter_ms']:>7.2f} ms  x{r['filter_speedup']:.1f}"
+            )
+        return
+
+    results: dict[str, dict[str, float]] = run(args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for name, r in results.items():
+        print(
+            f"{name:<20} scan {r['scan_us']:>10.2f} us   "
+            f"PuzzleState {r['puzzle_state_us']:>8.2f} us   x{r['speedup']:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
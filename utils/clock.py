@@ -0,0 +1,128 @@
+import heapq
+import itertools
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+
+
+class Clock(ABC):
+    """
+    Time source and timer factory for game animations.
+
+    Widgets ask their clock for the current time and for timers instead of using
+    QElapsedTimer / QTimer directly, so a whole game can run against a
+    VirtualClock. Timers returned by timer() support the QTimer subset the game
+    uses: start([ms]), stop(), isActive(), setInterval(ms), interval().
+    """
+
+    @abstractmethod
+    def now_ms(self) -> float: ...
+
+    @abstractmethod
+    def timer(self, callback: Callable[[], None], single_shot: bool = False): ...
+
+    @abstractmethod
+    def single_shot(self, ms: float, callback: Callable[[], None]) -> None: ...
+
+
+class VirtualTimer:
+    """Timer on a VirtualClock; fires only when the clock is advanced."""
+
+    def __init__(
+        self, clock: "VirtualClock", callback: Callable[[], None], single_shot: bool
+    ) -> None:
+        self._clock: VirtualClock = clock
+        self._callback: Callable[[], None] = callback
+        self._single_shot: bool = single_shot
+        self._interval: float = 0.0
+        # bumped on every start/stop so stale queue entries are ignored
+        self._generation: int = 0
+        self._active: bool = False
+
+    def setInterval(self, ms: float) -> None:
+        self._interval = float(ms)
+
+    def interval(self) -> float:
+        return self._interval
+
+    def isActive(self) -> bool:
+        return self._active
+
+    def start(self, ms: float | None = None) -> None:
+        if ms is not None:
+            self._interval = float(ms)
+        self._generation += 1
+        self._active = True
+        self._clock._push(self._clock.now_ms() + self._interval, self, self._generation)
+
+    def stop(self) -> None:
+        self._generation += 1
+        self._active = False
+
+    def _fire(self, generation: int) -> bool:
+        if generation != self._generation or not self._active:
+            return False
+        if self._single_shot:
+            self._active = False
+        else:
+            # like QTimer, a zero interval still yields to other due events
+            self._clock._push(
+                self._clock.now_ms() + max(self._interval, 0.001), self, generation
+            )
+        self._callback()
+        return True
+
+
+class VirtualClock(Clock):
+    """
+    Clock whose time only moves when advance() is called. Due timers fire in time
+    order, with now_ms() set to each timer's due time while its callback runs, so a
+    scripted game is deterministic and runs as fast as the callbacks allow.
+    """
+
+    def __init__(self, start_ms: float = 0.0) -> None:
+        self._now: float = start_ms
+        self._queue: list[tuple[float, int, VirtualTimer, int]] = []
+        self._seq: itertools.count = itertools.count()
+
+    def now_ms(self) -> float:
+        return self._now
+
+    def timer(
+        self, callback: Callable[[], None], single_shot: bool = False
+    ) -> VirtualTimer:
+        return VirtualTimer(self, callback, single_shot)
+
+    def single_shot(self, ms: float, callback: Callable[[], None]) -> None:
+        self.timer(callback, single_shot=True).start(ms)
+
+    def _push(self, due: float, timer: VirtualTimer, generation: int) -> None:
+        heapq.heappush(self._queue, (due, next(self._seq), timer, generation))
+
+    def pending(self) -> int:
+        """Number of armed timers."""
+        armed: set[VirtualTimer] = {
+            timer
+            for _, _, timer, gen in self._queue
+            if timer._active and gen == timer._generation
+        }
+        return len(armed)
+
+    def advance(self, ms: float) -> int:
+        """Move time forward by `ms`, firing every timer due on the way."""
+        end: float = self._now + ms
+        fired: int = 0
+        while self._queue and self._queue[0][0] <= end:
+            due, _, timer, generation = heapq.heappop(self._queue)
+            self._now = max(self._now, due)
+            fired += timer._fire(generation)
+        self._now = end
+        return fired
+
+    def run_until_idle(
+        self, limit_ms: float = 3_600_000.0, step_ms: float = 1000.0
+    ) -> float:
+        """Advance until no timer is armed or `limit_ms` passes; returns ms advanced."""
+        start: float = self._now
+        while self.pending() and self._now - start < limit_ms:
+            self.advance(step_ms)
+        return self._now - start
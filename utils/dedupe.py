@@ -0,0 +1,338 @@
+"""
+Exact and near-duplicate finder for the puzzle library.
+
+Phrases are normalized (upper case, letters and digits only, single spaces) and
+cut into character shingles. Exact repeats are grouped by their normalized text;
+the remaining phrases get a MinHash signature, and LSH banding puts phrases with
+similar signatures in shared buckets, so only bucket-mates are ever compared.
+Candidate pairs are confirmed with the exact shingle Jaccard similarity and
+joined into clusters with union-find.
+
+    python -m utils.dedupe
+    python -m utils.dedupe --puzzles big_bank.json --threshold 0.5 --same-category
+    python -m utils.dedupe --json > duplicates.json   # {"clusters", "invalid"}
+"""
+
+import argparse
+import json
+import re
+import sys
+import warnings
+import zlib
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.resolve()))
+
+from data import Puzzle, Puzzles
+
+SHINGLE_SIZE: int = 4
+# signature = BANDS * ROWS MinHash values; a pair shares a bucket with probability
+# 1 - (1 - s**ROWS)**BANDS at Jaccard similarity s (about 0.91 at 0.6, 0.24 at 0.3)
+BANDS: int = 10
+ROWS: int = 3
+THRESHOLD: float = 0.6
+# buckets bigger than this are split by the members' other bands before pairwise
+# comparison; what is still bigger is linked to its first member (and reported)
+MAX_PAIRWISE_BUCKET: int = 32
+
+_NON_ALNUM: re.Pattern = re.compile(r"[\W_]+")
+_MASK32: int = (1 << 32) - 1
+_GOLDEN32: int = 0x9E3779B1
+
+
+def normalize_phrase(phrase: str) -> str:
+    """Upper-case, drop apostrophes, other non-alphanumeric runs become a space."""
+    return _NON_ALNUM.sub(" ", phrase.upper().replace("'", "")).strip()
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set[int]:
+    """Hashed character `size`-grams of `text` (the whole text if shorter)."""
+    data: bytes = text.encode("utf-8")
+    if len(data) <= size:
+        return {zlib.crc32(data)} if data else set()
+    return {zlib.crc32(data[i : i + size]) for i in range(len(data) - size + 1)}
+
+
+def jaccard(a: set[int], b: set[int]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def minhash(hashes: set[int], bins: int = BANDS * ROWS) -> list[int]:
+    """
+    One-permutation MinHash: the shingle hash itself is the permutation; it picks
+    one of `bins` bins and each bin keeps the smallest hash it sees. Empty bins
+    borrow from the previous filled bin (densification), so short phrases still
+    get a full signature. One hash per shingle instead of one per bin per shingle.
+    """
+    empty: int = 1 << 32
+    # descending, so each bin's smallest hash is the one left in the dict
+    lowest: dict[int, int] = {h % bins: h for h in sorted(hashes, reverse=True)}
+    sig: list[int] = [lowest.get(i, empty) for i in range(bins)]
+    filled: list[int] = [i for i, value in enumerate(sig) if value < empty]
+    if filled and len(filled) < bins:
+        # start from the last filled bin as a negative index, so the wrap-around
+        # run at the end of the list is filled too
+        prev: int = filled[-1] - bins
+        for j in filled:
+            for i in range(prev + 1, j):
+                # mix in the distance so a borrowed value differs from the donor's
+                sig[i] = (sig[prev] ^ (i - prev) * _GOLDEN32) & _MASK32
+            prev = j
+    return sig
+
+
+def _split_bucket(
+    bucket: list[int], sets: list[set[int]], band: int, bands: int, rows: int
+) -> list[list[int]]:
+    """
+    Cut an oversized bucket of `band` into groups that also share their other
+    bands, one band at a time, until every group is small enough to compare
+    pairwise or the bands run out. Signatures are recomputed for the members
+    only; they aren't kept for the whole library.
+    """
+    sigs: dict[int, list[int]] = {r: minhash(sets[r], bands * rows) for r in bucket}
+    groups: list[list[int]] = [bucket]
+    for step in range(1, bands):
+        other: int = (band + step) % bands
+        split: list[list[int]] = []
+        for group in groups:
+            if len(group) <= MAX_PAIRWISE_BUCKET:
+                split.append(group)
+                continue
+            by_key: dict[tuple[int, ...], list[int]] = {}
+            for r in group:
+                by_key.setdefault(tuple(sigs[r][other::bands]), []).append(r)
+            split.extend(g for g in by_key.values() if len(g) > 1)
+        groups = split
+    return groups
+
+
+def invalid_phrases(puzzles: list[Puzzle]) -> list[int]:
+    """Puzzles whose phrase has no letters or digits; find_duplicates skips them."""
+    return [i for i, p in enumerate(puzzles) if not normalize_phrase(p.phrase)]
+
+
+class _UnionFind:
+    def __init__(self, n: int) -> None:
+        self.parent: list[int] = list(range(n))
+
+    def find(self, x: int) -> int:
+        parent: list[int] = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> None:
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            self.parent[max(ra, rb)] = min(ra, rb)
+
+
+@dataclass
+class DuplicatePair:
+    a: int  # puzzle indices
+    b: int
+    similarity: float
+
+
+@dataclass
+class DuplicateCluster:
+    members: list[int]
+    pairs: list[DuplicatePair] = field(default_factory=list)
+    # every member has the same normalized phrase
+    exact: bool = False
+    # every member is in the same category
+    same_category: bool = False
+
+    @property
+    def similarity(self) -> float:
+        """Lowest confirmed similarity inside the cluster."""
+        return min((p.similarity for p in self.pairs), default=1.0)
+
+    def to_dict(self) -> dict:
+        data: dict = asdict(self)
+        data["similarity"] = self.similarity
+        return data
+
+
+def find_duplicates(
+    puzzles: list[Puzzle],
+    threshold: float = THRESHOLD,
+    shingle_size: int = SHINGLE_SIZE,
+    bands: int = BANDS,
+    rows: int = ROWS,
+    same_category: bool = False,
+) -> list[DuplicateCluster]:
+    """
+    Clusters of puzzles whose phrases are identical after normalization or have a
+    shingle Jaccard similarity of at least `threshold`. With `same_category`, only
+    puzzles in the same category are compared. Largest, closest clusters first.
+    Blank phrases (see invalid_phrases) are never duplicates of each other.
+    Emits a RuntimeWarning when an oversized bucket could only be compared against
+    its first member.
+    """
+    # exact repeats collapse to one representative before any hashing
+    exact: dict[tuple[str, str], list[int]] = {}
+    for i, puzzle in enumerate(puzzles):
+        text: str = normalize_phrase(puzzle.phrase)
+        if not text:
+            continue
+        scope: str = puzzle.category.strip().lower() if same_category else ""
+        exact.setdefault((scope, text), []).append(i)
+    reps: list[tuple[str, str, int]] = [
+        (scope, text, members[0]) for (scope, text), members in exact.items()
+    ]
+
+    uf: _UnionFind = _UnionFind(len(puzzles))
+    pairs: list[DuplicatePair] = []
+    for members in exact.values():
+        for other in members[1:]:
+            uf.union(members[0], other)
+            pairs.append(DuplicatePair(members[0], other, 1.0))
+
+    sets: list[set[int]] = [shingles(text, shingle_size) for _, text, _ in reps]
+    buckets: list[dict[tuple, list[int]]] = [{} for _ in range(bands)]
+    for r, hashes in enumerate(sets):
+        if not hashes:
+            continue
+        sig: list[int] = minhash(hashes, bands * rows)
+        scope = reps[r][0]
+        # strided bands (band i = bins i, i + bands, ...): densified bins copy
+        # their neighbours, so a band of adjacent bins could hold one shingle
+        strides: list[list[int]] = [
+            sig[i : i + bands] for i in range(0, bands * rows, bands)
+        ]
+        for band, key in enumerate(zip([scope] * bands, *strides)):
+            bucket: list[int] | None = buckets[band].get(key)
+            if bucket is None:
+                buckets[band][key] = [r]
+            else:
+                bucket.append(r)
+
+    checked: set[tuple[int, int]] = set()
+    truncated: int = 0
+    for band, band_buckets in enumerate(buckets):
+        groups: list[list[int]] = []
+        for bucket in band_buckets.values():
+            if len(bucket) > MAX_PAIRWISE_BUCKET:
+                groups.extend(_split_bucket(bucket, sets, band, bands, rows))
+            elif len(bucket) > 1:
+                groups.append(bucket)
+        for group in groups:
+            if len(group) <= MAX_PAIRWISE_BUCKET:
+                candidates = (
+                    (x, y) for i, x in enumerate(group) for y in group[i + 1 :]
+                )
+            else:
+                # identical signatures all the way through: near-certain matches
+                truncated += 1
+                candidates = ((group[0], y) for y in group[1:])
+            for x, y in candidates:
+                if (x, y) in checked:
+                    continue
+                checked.add((x, y))
+                score: float = jaccard(sets[x], sets[y])
+                if score >= threshold:
+                    a, b = reps[x][2], reps[y][2]
+                    uf.union(a, b)
+                    pairs.append(DuplicatePair(a, b, round(score, 4)))
+
+    if truncated:
+        warnings.warn(
+            f"{truncated} bucket(s) of identical signatures were compared against"
+            " their first member only; pairs among the rest may be missed",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+
+    grouped: dict[int, DuplicateCluster] = {}
+    for pair in pairs:
+        root: int = uf.find(pair.a)
+        cluster: DuplicateCluster | None = grouped.get(root)
+        if cluster is None:
+            cluster = grouped[root] = DuplicateCluster([])
+        cluster.pairs.append(pair)
+    for root, cluster in grouped.items():
+        members: set[int] = set()
+        for pair in cluster.pairs:
+            members.update((pair.a, pair.b))
+        cluster.members = sorted(members)
+        cluster.exact = all(p.similarity == 1.0 for p in cluster.pairs) and (
+            len({normalize_phrase(puzzles[i].phrase) for i in members}) == 1
+        )
+        cluster.same_category = (
+            len({puzzles[i].category.strip().lower() for i in members}) == 1
+        )
+    return sorted(
+        grouped.values(), key=lambda c: (-len(c.members), -c.similarity, c.members)
+    )
+
+
+def format_clusters(puzzles: list[Puzzle], clusters: list[DuplicateCluster]) -> str:
+    if not clusters:
+        return "No duplicates found."
+    lines: list[str] = [f"{len(clusters)} duplicate cluster(s)"]
+    for n, cluster in enumerate(clusters, 1):
+        kind: str = "exact" if cluster.exact else f"~{cluster.similarity:.2f}"
+        scope: str = "same category" if cluster.same_category else "across categories"
+        lines.append(f"\n#{n} {kind}, {len(cluster.members)} puzzles, {scope}")
+        for i in cluster.members:
+            p: Puzzle = puzzles[i]
+            lines.append(f"  [{i}] {p.type:<11} {p.category:<20} {p.phrase}")
+        for pair in cluster.pairs:
+            if pair.similarity < 1.0:
+                lines.append(f"    {pair.a} ~ {pair.b}: {pair.similarity:.2f}")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Find duplicate puzzles")
+    parser.add_argument(
+        "--puzzles", type=Path, help="puzzle JSON file (default: data/puzzles.json)"
+    )
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    parser.add_argument("--shingle", type=int, default=SHINGLE_SIZE)
+    parser.add_argument("--bands", type=int, default=BANDS)
+    parser.add_argument("--rows", type=int, default=ROWS)
+    parser.add_argument(
+        "--same-category",
+        action="store_true",
+        help="only compare puzzles within the same category",
+    )
+    parser.add_argument("--json", action="store_true", help="print clusters as JSON")
+    args = parser.parse_args(argv)
+
+    puzzles: list[Puzzle] = Puzzles(args.puzzles).get_puzzles()
+    invalid: list[int] = invalid_phrases(puzzles)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        clusters: list[DuplicateCluster] = find_duplicates(
+            puzzles,
+            threshold=args.threshold,
+            shingle_size=args.shingle,
+            bands=args.bands,
+            rows=args.rows,
+            same_category=args.same_category,
+        )
+    for warning in caught:
+        print(f"warning: {warning.message}", file=sys.stderr)
+    if args.json:
+        print(
+            json.dumps(
+                {"clusters": [c.to_dict() for c in clusters], "invalid": invalid},
+                indent=2,
+            )
+        )
+    else:
+        print(format_clusters(puzzles, clusters))
+        if invalid:
+            print(f"\n{len(invalid)} puzzle(s) with a blank phrase (not compared):")
+            print("  " + ", ".join(map(str, invalid)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+import json
+import tempfile
+import time
+from array import array
+from pathlib import Path
+
+# the install directory may be read-only; the temp directory is always writable
+FRAME_STATS_FILE: Path = Path(tempfile.gettempdir()) / "frame_stats.jsonl"
+
+
+class FrameStats:
+    """
+    Fixed-size ring buffer of paint timings for one widget.
+
+    Call begin() at the top of paintEvent and end() at the bottom. Each frame records
+    how long the paint took and the interval since the previous paint; intervals more
+    than `late_factor` x `target_ms` count as late frames. While disabled, begin() and
+    end() return immediately so the hooks can stay in the paint path.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        capacity: int = 512,
+        target_ms: float = 16.0,
+        late_factor: float = 1.5,
+    ) -> None:
+        self.name: str = name
+        self.capacity: int = capacity
+        self.target_ms: float = target_ms
+        self.late_factor: float = late_factor
+        self.enabled: bool = False
+        self.overlay: bool = False
+        self._paint_ms: array = array("d", [0.0]) * capacity
+        self._interval_ms: array = array("d", [0.0]) * capacity
+        self.reset()
+
+    def reset(self) -> None:
+        self._pos: int = 0
+        self._count: int = 0
+        self._intervals: int = 0
+        self.frames: int = 0
+        self.late_frames: int = 0
+        self._last_start: float | None = None
+        self._start: float = 0.0
+
+    def begin(self) -> None:
+        if not self.enabled:
+            return
+        self._start = time.perf_counter()
+
+    def end(self) -> None:
+        if not self.enabled or not self._start:
+            return
+        now: float = time.perf_counter()
+        pos: int = self._pos
+        self._paint_ms[pos] = (now - self._start) * 1000.0
+        if self._last_start is None:
+            self._interval_ms[pos] = 0.0
+        else:
+            interval: float = (self._start - self._last_start) * 1000.0
+            self._interval_ms[pos] = interval
+            self._intervals += 1
+            if interval > self.target_ms * self.late_factor:
+                self.late_frames += 1
+        self._last_start = self._start
+        self._start = 0.0
+        self._pos = (pos + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+        self.frames += 1
+
+    def _window(self, buf: array) -> list[float]:
+        # oldest -> newest slice of the ring
+        if self._count < self.capacity:
+            return list(buf[: self._count])
+        return list(buf[self._pos :]) + list(buf[: self._pos])
+
+    @staticmethod
+    def _describe(values: list[float]) -> dict[str, float]:
+        if not values:
+            return {"mean": 0.0, "p95": 0.0, "max": 0.0}
+        ordered: list[float] = sorted(values)
+        return {
+            "mean": round(sum(ordered) / len(ordered), 3),
+            "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+            "max": round(ordered[-1], 3),
+        }
+
+    def summary(self) -> dict:
+        intervals: list[float] = self._window(self._interval_ms)
+        # the first frame after a reset has no previous frame to measure against
+        if self._intervals < len(intervals):
+            intervals = intervals[len(intervals) - self._intervals :]
+        return {
+            "widget": self.name,
+            "frames": self.frames,
+            "late_frames": self.late_frames,
+            "target_ms": self.target_ms,
+            "paint_ms": self._describe(self._window(self._paint_ms)),
+            "interval_ms": self._describe(intervals),
+        }
+
+    def overlay_text(self) -> str:
+        s: dict = self.summary()
+        return (
+            f"{self.name}: {s['frames']} frames, {s['late_frames']} late\n"
+            f"paint {s['paint_ms']['mean']:.2f} / {s['paint_ms']['max']:.2f} ms\n"
+            f"interval {s['interval_ms']['mean']:.2f} / {s['interval_ms']['p95']:.2f}"
+            f" ms (target {self.target_ms:.1f})"
+        )
+
+    def dump(self, event: str, path: Path = FRAME_STATS_FILE, **extra) -> dict | None:
+        """
+        Append the current summary as one JSON line tagged with `event`. Returns
+        None when there is nothing to record or the file can't be written;
+        instrumentation must never take down a paint or timer callback.
+        """
+        if not self.enabled or not self.frames:
+            return None
+        record: dict = {"time": time.time(), "event": event, **self.summary(), **extra}
+        try:
+            with path.open("a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+        except OSError:
+            return None
+        return record
@@ -0,0 +1,444 @@
+"""
+Bulk puzzle importer: validates writers' CSV/TSV/JSONL files and writes a clean
+library plus an error report.
+
+Rows are read in chunks and validated across a process pool; chunks are written
+back in input order as they finish, with a bounded number in flight, so memory
+stays flat however large the input. Each problem becomes one JSON line in the
+report (input line, severity, field, code, message, the raw row). Rows with
+errors are left out of the library; rows with only warnings are kept (--strict
+drops them too).
+
+Checks: a phrase, a category and a known type (missing type means MAIN);
+letters the letter grid can select (A-Z) and only BOARD_PUNCTUATION besides;
+a numeric, non-negative prize value, required on TOSS-UP puzzles; and, as a
+warning, phrases that do not fit in BOARD_ROWS rows of BOARD_COLUMNS cells.
+Malformed CSV/TSV rows (bad quoting, fields over the csv module's size limit,
+more fields than the header, the sign of an unquoted delimiter) and phrases
+spanning lines, the usual sign of an unclosed quote, are reported as errors. A
+correctly quoted delimiter inside a phrase is fine.
+
+    python -m utils.importer writers.csv data/puzzles.jsonl
+    python -m utils.importer batch.tsv library.json --report batch_errors.jsonl
+    python -m utils.importer huge.jsonl clean.jsonl --workers 4 --strict --json
+"""
+
+import argparse
+import csv
+import json
+import math
+import os
+import sys
+from collections import Counter, deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import IO
+
+sys.path.append(str(Path(__file__).parent.parent.resolve()))
+
+from data import wrap_phrase
+from data.constants import BOARD_COLUMNS, BOARD_PUNCTUATION, BOARD_ROWS
+from data.engine import PHASE_BONUS, PHASE_FINAL_SPIN, PHASE_MAIN, PHASE_TOSSUP
+
+PUZZLE_TYPES: tuple[str, ...] = (
+    PHASE_TOSSUP,
+    PHASE_MAIN,
+    PHASE_FINAL_SPIN,
+    PHASE_BONUS,
+)
+# puzzle types that score from prize_value, so a missing one would air as 0.0
+PRIZE_TYPES: tuple[str, ...] = (PHASE_TOSSUP,)
+FIELDS: tuple[str, ...] = ("category", "phrase", "type", "prize_value")
+INPUT_FORMATS: tuple[str, ...] = ("csv", "tsv", "jsonl")
+# rows per chunk handed to a worker
+CHUNK_ROWS: int = 5_000
+
+ERROR: str = "error"
+WARNING: str = "warning"
+
+
+@dataclass
+class ImportIssue:
+    line: int  # 1-based line in the input file (CSV: where the row starts)
+    severity: str  # ERROR or WARNING
+    field: str
+    code: str
+    message: str
+    row: dict | list[str] | str | None = None
+
+
+# a row handed to a worker: CSV/TSV record, raw JSONL line, or an unreadable row
+Row = dict | str | ImportIssue
+
+
+@dataclass
+class ImportStats:
+    rows: int = 0
+    imported: int = 0
+    rejected: int = 0
+    # issue code -> count
+    issues: Counter = field(default_factory=Counter)
+
+    def to_dict(self) -> dict:
+        data: dict = asdict(self)
+        data["issues"] = dict(self.issues.most_common())
+        return data
+
+    def format(self) -> str:
+        lines: list[str] = [
+            f"{self.rows:,} rows: {self.imported:,} imported, "
+            f"{self.rejected:,} rejected"
+        ]
+        for code, count in self.issues.most_common():
+            lines.append(f"  {code:<20} {count:>10,}")
+        return "\n".join(lines)
+
+
+def board_lines(phrase: str) -> int:
+    """Rows `phrase` takes on a board BOARD_COLUMNS cells wide."""
+    return len(wrap_phrase(phrase, BOARD_COLUMNS))
+
+
+def _is_ascii_letter(ch: str) -> bool:
+    return "A" <= ch <= "Z" or "a" <= ch <= "z"
+
+
+def validate_record(
+    line: int, item: dict, strict: bool = False
+) -> tuple[dict | None, list[ImportIssue]]:
+    """
+    Check one input row; returns the cleaned puzzle (None if rejected) and the
+    problems found. Cleaning trims whitespace and upper-cases type and phrase.
+    """
+    issues: list[ImportIssue] = []
+
+    def issue(severity: str, name: str, code: str, message: str) -> None:
+        issues.append(ImportIssue(line, severity, name, code, message, item))
+
+    category: str = str(item.get("category") or "").strip()
+    if not category:
+        issue(ERROR, "category", "missing_category", "no category")
+
+    kind: str = str(item.get("type") or PHASE_MAIN).strip().upper()
+    if kind not in PUZZLE_TYPES:
+        issue(ERROR, "type", "unknown_type", f"unknown type {kind!r}")
+
+    raw_phrase: str = str(item.get("phrase") or "")
+    if "\n" in raw_phrase or "\r" in raw_phrase:
+        issue(ERROR, "phrase", "multiline_phrase", "spans lines (unclosed quote?)")
+    # checked before upper-casing, which can turn letters into A-Z ("ß" -> "SS")
+    text: str = " ".join(raw_phrase.split())
+    phrase: str = text.upper()
+    if not phrase:
+        issue(ERROR, "phrase", "missing_phrase", "no phrase")
+    else:
+        bad: list[str] = sorted(
+            {ch for ch in text if ch.isalpha() and not _is_ascii_letter(ch)}
+        )
+        if bad:
+            issue(
+                ERROR,
+                "phrase",
+                "unselectable_letter",
+                f"letters outside A-Z: {''.join(bad)}",
+            )
+        odd: list[str] = sorted(
+            {
+                ch
+                for ch in text
+                if not ch.isalpha() and ch not in BOARD_PUNCTUATION
+            }
+        )
+        if odd:
+            issue(
+                ERROR,
+                "phrase",
+                "unshowable_character",
+                f"characters the board can't show: {''.join(odd)!r}",
+            )
+        if not any(_is_ascii_letter(ch) for ch in text):
+            issue(ERROR, "phrase", "no_letters", "nothing to guess")
+        rows: int = board_lines(phrase)
+        if rows > BOARD_ROWS:
+            issue(
+                ERROR if strict else WARNING,
+                "phrase",
+                "too_long",
+                f"needs {rows} rows of {BOARD_COLUMNS} (board has {BOARD_ROWS})",
+            )
+
+    raw: object = item.get("prize_value")
+    prize: float = 0.0
+    if raw is None or str(raw).strip() == "":
+        if kind in PRIZE_TYPES:
+            issue(ERROR, "prize_value", "missing_prize", f"{kind} needs a prize_value")
+    else:
+        try:
+            prize = float(str(raw).strip())
+        except ValueError:
+            issue(ERROR, "prize_value", "bad_prize", f"not a number: {raw!r}")
+        else:
+            if not math.isfinite(prize) or prize < 0:
+                issue(ERROR, "prize_value", "bad_prize", f"out of range: {raw!r}")
+
+    if any(i.severity == ERROR for i in issues) or (strict and issues):
+        return None, issues
+    puzzle: dict = {"type": kind, "category": category, "phrase": phrase}
+    if raw is not None and str(raw).strip() != "":
+        puzzle["prize_value"] = prize
+    return puzzle, issues
+
+
+def _validate_chunk(
+    chunk: list[tuple[int, Row]], strict: bool
+) -> tuple[list[dict], list[ImportIssue]]:
+    """
+    Validate rows of (line, record, raw JSONL text, or the ImportIssue of a row
+    the reader couldn't parse); runs in a worker.
+    """
+    clean: list[dict] = []
+    issues: list[ImportIssue] = []
+    for line, row in chunk:
+        if isinstance(row, ImportIssue):
+            issues.append(row)
+            continue
+        if isinstance(row, str):
+            try:
+                item: object = json.loads(row)
+            except ValueError as exc:
+                issues.append(
+                    ImportIssue(line, ERROR, "", "bad_json", str(exc), row.strip())
+                )
+                continue
+            if not isinstance(item, dict):
+                issues.append(
+                    ImportIssue(
+                        line, ERROR, "", "bad_json", "not an object", row.strip()
+                    )
+                )
+                continue
+        else:
+            item = row
+        puzzle, found = validate_record(line, item, strict)
+        issues.extend(found)
+        if puzzle is not None:
+            clean.append(puzzle)
+    return clean, issues
+
+
+def input_format(path: Path, fmt: str | None = None) -> str:
+    fmt = fmt or path.suffix.lower().lstrip(".")
+    if fmt not in INPUT_FORMATS:
+        raise ValueError(f"{path}: unsupported input format {fmt!r} (csv, tsv, jsonl)")
+    return fmt
+
+
+def delimiter_of(fmt: str) -> str | None:
+    return {"csv": ",", "tsv": "\t"}.get(fmt)
+
+
+def read_rows(path: Path, fmt: str | None = None) -> Iterator[tuple[int, Row]]:
+    """
+    Stream (line number, row) from a CSV, TSV or JSONL file. Spreadsheet rows
+    come out as dicts keyed by lower-cased header; JSONL lines are left as text
+    so the workers parse them. A spreadsheet row the csv module rejects, or with
+    more fields than the header, comes out as its ImportIssue and reading goes on.
+    """
+    fmt = input_format(path, fmt)
+    with path.open(encoding="utf-8-sig", newline="") as fh:
+        if fmt == "jsonl":
+            for number, text in enumerate(fh, 1):
+                if text.strip():
+                    yield number, text
+            return
+        # strict: bad quoting raises csv.Error instead of being read leniently
+        reader = csv.reader(fh, delimiter=delimiter_of(fmt), strict=True)
+        try:
+            header: list[str] = [name.strip().lower() for name in next(reader, [])]
+        except csv.Error as exc:
+            raise ValueError(f"{path}: unreadable header: {exc}") from exc
+        if "phrase" not in header:
+            raise ValueError(f"{path}: no 'phrase' column in header {header}")
+        columns: list[tuple[int, str]] = [
+            (i, name) for i, name in enumerate(header) if name in FIELDS
+        ]
+        start: int = reader.line_num + 1
+        while True:
+            try:
+                values: list[str] = next(reader)
+            except StopIteration:
+                return
+            except csv.Error as exc:
+                yield start, ImportIssue(
+                    start,
+                    ERROR,
+                    "",
+                    "bad_csv",
+                    f"{exc} (read through line {reader.line_num})",
+                )
+            else:
+                if len(values) > len(header):
+                    yield start, ImportIssue(
+                        start,
+                        ERROR,
+                        "",
+                        "extra_fields",
+                        f"{len(values)} fields, header has {len(header)}"
+                        " (unquoted delimiter?)",
+                        values,
+                    )
+                elif any(v.strip() for v in values):
+                    yield start, {
+                        name: values[i] for i, name in columns if i < len(values)
+                    }
+            start = reader.line_num + 1
+
+
+class _LibraryWriter:
+    """Writes puzzles as JSONL or a JSON array to a temp file, swapped in on close."""
+
+    def __init__(self, path: Path) -> None:
+        self.path: Path = path
+        self.tmp: Path = path.with_name(path.name + ".tmp")
+        self.array: bool = path.suffix.lower() == ".json"
+        self.fh: IO[str] = self.tmp.open("w", encoding="utf-8")
+        self.count: int = 0
+        if self.array:
+            self.fh.write("[")
+
+    def write(self, puzzles: list[dict]) -> None:
+        if self.array:
+            for puzzle in puzzles:
+                self.fh.write(",\n  " if self.count else "\n  ")
+                self.fh.write(json.dumps(puzzle, ensure_ascii=False))
+                self.count += 1
+        else:
+            self.fh.writelines(
+                json.dumps(puzzle, ensure_ascii=False) + "\n" for puzzle in puzzles
+            )
+            self.count += len(puzzles)
+
+    def close(self, keep: bool = True) -> None:
+        if self.array:
+            self.fh.write("\n]\n")
+        self.fh.close()
+        if keep:
+            os.replace(self.tmp, self.path)
+        else:
+            self.tmp.unlink(missing_ok=True)
+
+
+def import_puzzles(
+    src: Path,
+    dst: Path,
+    report: Path,
+    fmt: str | None = None,
+    strict: bool = False,
+    workers: int | None = None,
+    progress: bool = False,
+) -> ImportStats:
+    """Validate `src` into the library `dst` (.jsonl or .json) and `report`."""
+    workers = workers or os.cpu_count() or 1
+    fmt = input_format(src, fmt)
+    rows: Iterator[tuple[int, Row]] = read_rows(src, fmt)
+    chunks: Iterator[list[tuple[int, Row]]] = iter(
+        lambda: list(islice(rows, CHUNK_ROWS)), []
+    )
+    validate = partial(_validate_chunk, strict=strict)
+    stats: ImportStats = ImportStats()
+    library: _LibraryWriter = _LibraryWriter(dst)
+    ok: bool = False
+    try:
+        with report.open("w", encoding="utf-8") as sink:
+
+            def collect(
+                size: int, clean: list[dict], issues: list[ImportIssue]
+            ) -> None:
+                library.write(clean)
+                sink.writelines(
+                    json.dumps(asdict(i), ensure_ascii=False) + "\n" for i in issues
+                )
+                stats.rows += size
+                stats.imported += len(clean)
+                stats.rejected = stats.rows - stats.imported
+                stats.issues.update(i.code for i in issues)
+                if progress:
+                    print(
+                        f"\r{stats.rows:,} rows, {stats.rejected:,} rejected",
+                        end="",
+                        file=sys.stderr,
+                    )
+
+            if workers == 1:
+                for chunk in chunks:
+                    collect(len(chunk), *validate(chunk))
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    # a bounded window of chunks in flight, collected in submission
+                    # order so the library keeps the input order
+                    pending: deque[tuple[int, Future]] = deque(
+                        (len(chunk), pool.submit(validate, chunk))
+                        for chunk in islice(chunks, 2 * workers)
+                    )
+                    while pending:
+                        size, future = pending.popleft()
+                        collect(size, *future.result())
+                        for chunk in islice(chunks, 1):
+                            future = pool.submit(validate, chunk)
+                            pending.append((len(chunk), future))
+        ok = True
+    finally:
+        library.close(keep=ok)
+        if progress:
+            print(file=sys.stderr)
+    return stats
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Validate and import puzzles")
+    parser.add_argument("source", type=Path, help="CSV, TSV or JSONL file")
+    parser.add_argument(
+        "library", type=Path, help="output library (.jsonl or .json)"
+    )
+    parser.add_argument(
+        "--report", type=Path, help="error report (default: <library>.errors.jsonl)"
+    )
+    parser.add_argument(
+        "--format", choices=INPUT_FORMATS, help="default: from the suffix"
+    )
+    parser.add_argument(
+        "--strict", action="store_true", help="reject rows with warnings too"
+    )
+    parser.add_argument("--workers", type=int, default=None, help="default: all cores")
+    parser.add_argument("--json", action="store_true", help="print summary as JSON")
+    args = parser.parse_args(argv)
+
+    report: Path = args.report or args.library.with_name(
+        args.library.stem + ".errors.jsonl"
+    )
+    try:
+        stats: ImportStats = import_puzzles(
+            args.source,
+            args.library,
+            report,
+            fmt=args.format,
+            strict=args.strict,
+            workers=args.workers,
+            progress=not args.json,
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    if args.json:
+        print(json.dumps({**stats.to_dict(), "report": str(report)}, indent=2))
+    else:
+        print(stats.format())
+        if stats.issues:
+            print(f"details: {report}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Build and query a SQLite puzzle library (see data.puzzle_source).
+
+The game plays a SQLite library with `python main.py --puzzles library.sqlite`:
+each show takes the least recently aired puzzle for every SHOW_FORMAT slot and
+records what aired.
+
+    python -m utils.puzzle_db import data/puzzles.json library.sqlite
+    python -m utils.puzzle_db next library.sqlite --type TOSS-UP --category Phrase
+    python -m utils.puzzle_db stats library.sqlite --json
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.resolve()))
+
+from data import Puzzle, Puzzles
+from data.puzzle_source import SqlitePuzzleSource, convert_to_sqlite
+
+
+def _next(args: argparse.Namespace) -> dict:
+    puzzles: Puzzles = Puzzles(args.library)
+    start: float = time.perf_counter()
+    idx: int | None = puzzles.next_unplayed(args.type, args.category)
+    elapsed_ms: float = (time.perf_counter() - start) * 1000.0
+    result: dict = {"index": idx, "query_ms": round(elapsed_ms, 3)}
+    if idx is not None:
+        puzzle: Puzzle = puzzles[idx]
+        result["puzzle"] = vars(puzzle)
+        if isinstance(puzzles.source, SqlitePuzzleSource):
+            result["last_played"] = puzzles.source.last_played(idx)
+        if args.mark:
+            puzzles.mark_played(idx)
+    puzzles.close()
+    return result
+
+
+def _stats(args: argparse.Namespace) -> dict:
+    puzzles: Puzzles = Puzzles(args.library)
+    result: dict = {"puzzles": len(puzzles), "types": puzzles.type_counts}
+    puzzles.close()
+    return result
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="SQLite puzzle library tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+    imp = sub.add_parser("import", help="build a library from a .json/.jsonl file")
+    imp.add_argument("source", type=Path)
+    imp.add_argument("library", type=Path)
+    nxt = sub.add_parser("next", help="next puzzle to air of a type")
+    nxt.add_argument("library", type=Path)
+    nxt.add_argument("--type", default="TOSS-UP")
+    nxt.add_argument("--category", default=None)
+    nxt.add_argument("--mark", action="store_true", help="record it as aired now")
+    stats = sub.add_parser("stats", help="puzzle counts per type")
+    stats.add_argument("library", type=Path)
+    for p in (imp, nxt, stats):
+        p.add_argument("--json", action="store_true", help="print raw JSON")
+    args = parser.parse_args(argv)
+
+    if args.command == "import":
+        result: dict = {"imported": convert_to_sqlite(args.source, args.library)}
+    elif args.command == "next":
+        result = _next(args)
+    else:
+        result = _stats(args)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        for key, value in result.items():
+            print(f"{key:>12}: {value}")
+
+
+if __name__ == "__main__":
+    main()
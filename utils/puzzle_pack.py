@@ -0,0 +1,68 @@
+"""
+Compile the puzzle library into a binary pack for near-instant startup.
+
+The pack is written beside the JSON (data/puzzles.json -> data/puzzles.pack) and
+Puzzles opens it with mmap whenever it is current; once the JSON is edited the
+pack is stale and the game reads the JSON again until the pack is recompiled.
+
+    python -m utils.puzzle_pack
+    python -m utils.puzzle_pack --source big_bank.json --out big_bank.pack
+    python -m utils.puzzle_pack --check --json
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.resolve()))
+
+from data.puzzle_source import PackError, PackPuzzleSource, compile_pack
+
+DEFAULT_SOURCE: Path = Path(__file__).parent.parent / "data" / "puzzles.json"
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Compile puzzles into a binary pack")
+    parser.add_argument("--source", type=Path, default=DEFAULT_SOURCE)
+    parser.add_argument("--out", type=Path, help="pack path (default: beside source)")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="only check that the pack is current and its checksum matches",
+    )
+    parser.add_argument("--json", action="store_true", help="print raw JSON")
+    args = parser.parse_args(argv)
+    out: Path = args.out or args.source.with_suffix(".pack")
+
+    result: dict = {"pack": str(out)}
+    try:
+        if not args.check:
+            start: float = time.perf_counter()
+            result["puzzles"] = compile_pack(args.source, out)
+            result["compile_ms"] = round((time.perf_counter() - start) * 1000.0, 1)
+        start = time.perf_counter()
+        pack: PackPuzzleSource = PackPuzzleSource(
+            out, source=args.source, verify=args.check
+        )
+        result["open_ms"] = round((time.perf_counter() - start) * 1000.0, 3)
+        result["puzzles"] = len(pack)
+        result["bytes"] = out.stat().st_size
+        result["current"] = True
+        pack.close()
+    except (OSError, PackError) as exc:
+        result["current"] = False
+        result["error"] = str(exc)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        for key, value in result.items():
+            print(f"{key:>11}: {value}")
+    if not result["current"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import heapq
+import itertools
+from collections.abc import Callable
+
+
+class Timeline:
+    """
+    Queue of timed actions on a pausable, scalable time line.
+
+    Actions are kept in a heap of (due, seq, action), with `due` in timeline
+    milliseconds; seq keeps equal due times in scheduling order. Timeline time runs
+    at `time_scale` x the wall clock given by `now` (milliseconds) and stands still
+    while paused. Nothing here owns a timer: the caller runs run_due() from a single
+    timer and re-arms it with next_delay_ms().
+    """
+
+    def __init__(self, now: Callable[[], float], time_scale: float = 1.0) -> None:
+        self._now: Callable[[], float] = now
+        self._queue: list[tuple[float, int, Callable[[], None]]] = []
+        self._seq: itertools.count = itertools.count()
+        self.time_scale: float = time_scale
+        self.paused: bool = False
+        # timeline time = _base + (now - _base_wall) * time_scale while running
+        self._base: float = 0.0
+        self._base_wall: float = now()
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def time(self) -> float:
+        if self.paused:
+            return self._base
+        return self._base + (self._now() - self._base_wall) * self.time_scale
+
+    def _rebase(self) -> None:
+        self._base = self.time()
+        self._base_wall = self._now()
+
+    def schedule(self, delay_ms: float, action: Callable[[], None]) -> None:
+        """Run `action` once `delay_ms` of timeline time has passed."""
+        heapq.heappush(self._queue, (self.time() + delay_ms, next(self._seq), action))
+
+    def pause(self) -> None:
+        if not self.paused:
+            self._rebase()
+            self.paused = True
+
+    def resume(self) -> None:
+        if self.paused:
+            self._base_wall = self._now()
+            self.paused = False
+
+    def set_time_scale(self, scale: float) -> None:
+        self._rebase()
+        self.time_scale = max(0.0, scale)
+
+    def next_delay_ms(self) -> float | None:
+        """Wall-clock ms until the next action is due; None if idle or paused."""
+        if not self._queue or self.paused or self.time_scale <= 0:
+            return None
+        return max(0.0, (self._queue[0][0] - self.time()) / self.time_scale)
+
+    def run_due(self) -> int:
+        """Run every action that is due, including ones they schedule; returns count."""
+        ran: int = 0
+        while self._queue and not self.paused and self._queue[0][0] <= self.time():
+            heapq.heappop(self._queue)[2]()
+            ran += 1
+        return ran
+
+    def fast_forward(self) -> int:
+        """Run everything still queued, in order, without waiting; returns count."""
+        ran: int = 0
+        while self._queue:
+            heapq.heappop(self._queue)[2]()
+            ran += 1
+        return ran
+
+    def clear(self) -> None:
+        self._queue.clear()
@@ -0,0 +1,576 @@
+"""
+Headless tournament simulator: bots play complete games on the real GameEngine.
+
+Each game draws one show (SHOW_FORMAT: toss-ups, main rounds, final spin, bonus)
+from the puzzle library with its own seeded rng and plays it with the wheel
+physics (data.spin) and a wedge layout, with one bot strategy per seat (games
+cycle through every seat order, so nobody keeps the first turn). Games run in
+chunks across a process pool; each chunk returns a fixed-size aggregate, so memory
+stays flat however many games are played. Per-game records can be streamed to a
+JSONL file as chunks finish.
+
+    python -m utils.tournament --games 100000
+    python -m utils.tournament --games 1000000 --strategies always_spin,solve_at:0.7
+    python -m utils.tournament --vowel-cost 0.5 --wedges layout.json --out games.jsonl
+    python -m utils.tournament --puzzles library.sqlite --games 50000
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+from collections import Counter
+from collections.abc import Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.resolve()))
+
+from data import DEFAULT_WEDGES, GameEngine, Puzzle, Puzzles, Wedge, WedgeLayout
+from data import plan_spin
+from data.constants import SHOW_FORMAT, VOWEL_COST
+from data.engine import PHASE_BONUS, PHASE_FINAL_SPIN, PHASE_MAIN, PHASE_TOSSUP
+from data.puzzle_state import PuzzleState
+from utils.utils import fmt_money
+
+# letters in the order a sensible contestant calls them
+CONSONANT_ORDER = "TNSHRDLCMWFGYPBVKJXQZ"
+VOWEL_ORDER = "EAOIU"
+BONUS_PICKS = "RSTLNEGDMA"
+# give up on a puzzle (and reveal it, with no winner) after this many turns
+MAX_TURNS = 500
+# fraction of the letters showing before a bot tries to solve, unless its
+# strategy sets one (solve_at:0.7)
+SOLVE_AT = 0.85
+# winnings histogram bucket width, in prize units
+WINNINGS_BUCKET = 0.5
+CHUNK_GAMES = 500
+
+
+@dataclass(frozen=True)
+class Strategy:
+    """How a bot plays: when it buys vowels and when it solves."""
+
+    name: str
+    # buy a vowel instead of calling a consonant once the round score reaches this
+    buy_vowels_above: float | None = None
+    # try to solve once this fraction of the letters is showing
+    solve_at: float = SOLVE_AT
+
+
+# same solve threshold everywhere, so the defaults compare spinning vs buying
+STRATEGIES: dict[str, Strategy] = {
+    "always_spin": Strategy("always_spin"),
+    "buy_vowels": Strategy("buy_vowels", buy_vowels_above=1.0),
+    "solve_at": Strategy("solve_at"),
+}
+
+
+def _solves(rng: random.Random, frac: float) -> bool:
+    # a solve attempt succeeds about as often as the board is revealed
+    return rng.random() < frac
+
+
+def parse_strategy(spec: str) -> Strategy:
+    """`name` or `name:value`, e.g. always_spin, buy_vowels:2.0, solve_at:0.7."""
+    name, _, value = spec.partition(":")
+    if name not in STRATEGIES:
+        raise ValueError(f"Unknown strategy: {name}")
+    base: Strategy = STRATEGIES[name]
+    if not value:
+        return base
+    if name == "buy_vowels":
+        return Strategy(spec, buy_vowels_above=float(value), solve_at=base.solve_at)
+    if name == "solve_at":
+        return Strategy(spec, base.buy_vowels_above, solve_at=float(value))
+    raise ValueError(f"Strategy {name} takes no value")
+
+
+def _revealed_fraction(state: PuzzleState, total: int) -> float:
+    return 1.0 - state.hidden_count / total if total else 1.0
+
+
+# bots don't peek at the answer: they go by letter frequency and skip letters
+# already called this puzzle
+
+
+def _vowel_to_buy(
+    engine: GameEngine, strategy: Strategy, called: set[str]
+) -> str | None:
+    """The vowel to buy instead of spinning, if the strategy wants one now."""
+    player = engine.current_player
+    if (
+        engine.phase != PHASE_MAIN
+        or strategy.buy_vowels_above is None
+        or player.round_score < strategy.buy_vowels_above
+    ):
+        return None
+    for letter in VOWEL_ORDER:
+        if letter not in called and engine.can_call(letter):
+            return letter
+    return None
+
+
+def _choose_letter(engine: GameEngine, called: set[str]) -> str | None:
+    """The letter to call after a money spin: consonants while any are left."""
+    for order in (CONSONANT_ORDER, VOWEL_ORDER):
+        for letter in order:
+            if letter not in called and engine.can_call(letter):
+                return letter
+    return None
+
+
+def _give_up(engine: GameEngine) -> None:
+    # nobody solved: show the answer and nobody banks the round
+    engine.state.reveal_all()
+    for p in engine.players:
+        p.round_score = 0.0
+
+
+def _seating(strategies: list[Strategy], game_id: int) -> list[Strategy]:
+    """
+    Seat order for a game: game ids cycle through every permutation, so each
+    strategy goes first, and follows each other strategy, equally often (the turn
+    passes after every letter, so who sits after whom matters).
+    """
+    pool: list[Strategy] = list(strategies)
+    k: int = game_id % math.factorial(len(pool))
+    seated: list[Strategy] = []
+    while pool:
+        i, k = divmod(k, math.factorial(len(pool) - 1))
+        seated.append(pool.pop(i))
+    return seated
+
+
+def show_pools(library: Puzzles) -> dict[str, list[int]]:
+    """Library indices per puzzle type used by SHOW_FORMAT."""
+    return {kind: library.filter(type=kind) for kind in set(SHOW_FORMAT)}
+
+
+def draw_show(pools: dict[str, list[int]], rng: random.Random) -> list[int]:
+    """
+    Library indices for one show: a distinct random puzzle per SHOW_FORMAT slot.
+    Slots whose type has run out of puzzles are skipped, like Puzzles.plan_show.
+    """
+    drawn: dict[str, list[int]] = {
+        kind: rng.sample(pools.get(kind, []), min(n, len(pools.get(kind, []))))
+        for kind, n in Counter(SHOW_FORMAT).items()
+    }
+    return [drawn[kind].pop() for kind in SHOW_FORMAT if drawn[kind]]
+
+
+def play_game(
+    game_id: int,
+    seed: int,
+    library: Sequence[Puzzle],
+    pools: dict[str, list[int]],
+    layout: WedgeLayout,
+    strategies: list[Strategy],
+    vowel_cost: float = VOWEL_COST,
+) -> dict:
+    """Play one show drawn from `library` and return its per-game record."""
+    rng: random.Random = random.Random(seed)
+    seats: int = len(strategies)
+    seated: list[Strategy] = _seating(strategies, game_id)
+    show: list[int] = draw_show(pools, rng)
+    engine: GameEngine = GameEngine(
+        [library[i] for i in show], [s.name for s in seated], vowel_cost=vowel_cost
+    )
+    rotation: float = rng.uniform(0.0, 360.0)
+    bankrupts: list[int] = [0] * seats
+    bankrupt_loss: list[float] = [0.0] * seats
+    round_turns: dict[str, list[int]] = {}
+    bonus_player: int | None = None
+    bonus_won: bool = False
+    # phases of the puzzles nobody won
+    unsolved: list[str] = []
+
+    for _ in show:
+        engine.tossup_seed = rng.getrandbits(32)
+        engine.next_puzzle()
+        state: PuzzleState = engine.state
+        total: int = state.hidden_count
+        phase: str = engine.phase
+        turns: int = 0
+        called: set[str] = set()
+
+        if phase == PHASE_TOSSUP:
+            # first bot past its threshold buzzes in; a miss locks that seat out
+            # and lets the reveal go on
+            locked: set[int] = set()
+            while True:
+                frac: float = _revealed_fraction(state, total)
+                ready: list[int] = [
+                    i
+                    for i, s in enumerate(seated)
+                    if frac >= s.solve_at and i not in locked
+                ]
+                if ready:
+                    engine.set_turn(rng.choice(ready))
+                    if _solves(rng, frac):
+                        engine.solve(True)
+                        break
+                    engine.solve(False)
+                    locked.add(engine.current_player_index)
+                    if len(locked) == seats:
+                        _give_up(engine)
+                        unsolved.append(phase)
+                        break
+                if engine.tossup_step() is None:
+                    open_seats: list[int] = [
+                        i for i in range(seats) if i not in locked
+                    ]
+                    engine.set_turn(rng.choice(open_seats))
+                    engine.solve(True)
+                    break
+                turns += 1
+
+        elif phase == PHASE_BONUS:
+            bonus_player = engine.current_player_index
+            for letter in BONUS_PICKS:
+                engine.call_letter(letter)
+            engine.set_turn(bonus_player)
+            bonus_won = _solves(rng, _revealed_fraction(state, total))
+            engine.solve(bonus_won)
+            turns = len(BONUS_PICKS)
+
+        else:
+            capped: bool = False
+            while turns < MAX_TURNS:
+                idx: int = engine.current_player_index
+                strategy: Strategy = seated[idx]
+                frac = _revealed_fraction(state, total)
+                if state.is_solved():
+                    break
+                if frac >= strategy.solve_at:
+                    if _solves(rng, frac):
+                        break
+                    # a wrong solve passes the turn
+                    engine.solve(False)
+                    turns += 1
+                    continue
+                vowel: str | None = _vowel_to_buy(engine, strategy, called)
+                if vowel is not None:
+                    # buying a vowel takes the turn instead of a spin
+                    called.add(vowel)
+                    engine.call_letter(vowel)
+                    turns += 1
+                    continue
+                rotation = plan_spin(rotation, rng=rng).final_rotation
+                value = layout.values[layout.index_at(rotation)]
+                if value == "BANKRUPT" and phase != PHASE_FINAL_SPIN:
+                    bankrupts[idx] += 1
+                    bankrupt_loss[idx] += engine.players[idx].round_score
+                engine.spin_result(value)
+                turns += 1
+                if engine.last_spin_value is None:
+                    continue
+                letter: str | None = _choose_letter(engine, called)
+                if letter is None:
+                    break
+                called.add(letter)
+                engine.call_letter(letter)
+            else:
+                # out of turns
+                _give_up(engine)
+                unsolved.append(phase)
+                capped = True
+            if not capped:
+                engine.solve(True)
+
+        round_turns.setdefault(phase, []).append(turns)
+
+    totals: list[float] = [p.total_score for p in engine.players]
+    return {
+        "game": game_id,
+        "seed": seed,
+        "show": show,
+        "strategies": [s.name for s in seated],
+        "totals": totals,
+        "winner": max(range(seats), key=totals.__getitem__),
+        "bonus_player": bonus_player,
+        "bonus_won": bonus_won,
+        "bankrupts": bankrupts,
+        "bankrupt_loss": bankrupt_loss,
+        "turns": round_turns,
+        "unsolved": unsolved,
+    }
+
+
+@dataclass
+class StrategyStats:
+    games: int = 0
+    wins: int = 0
+    bonus_rounds: int = 0
+    bonus_wins: int = 0
+    bankrupts: int = 0
+    bankrupt_loss: float = 0.0
+    winnings: float = 0.0
+    winnings_sq: float = 0.0
+    # bucket index (WINNINGS_BUCKET wide) -> seat-games
+    histogram: Counter = field(default_factory=Counter)
+
+    def merge(self, other: "StrategyStats") -> None:
+        self.games += other.games
+        self.wins += other.wins
+        self.bonus_rounds += other.bonus_rounds
+        self.bonus_wins += other.bonus_wins
+        self.bankrupts += other.bankrupts
+        self.bankrupt_loss += other.bankrupt_loss
+        self.winnings += other.winnings
+        self.winnings_sq += other.winnings_sq
+        self.histogram.update(other.histogram)
+
+    def percentile(self, q: float) -> float:
+        target: float = q * self.games
+        seen: int = 0
+        for bucket in sorted(self.histogram):
+            seen += self.histogram[bucket]
+            if seen >= target:
+                return bucket * WINNINGS_BUCKET
+        return 0.0
+
+
+@dataclass
+class TournamentStats:
+    """Fixed-size running aggregate of many games; chunks merge() together."""
+
+    games: int = 0
+    strategies: dict[str, StrategyStats] = field(default_factory=dict)
+    # phase -> histogram of turns per puzzle
+    turns: dict[str, Counter] = field(default_factory=dict)
+    # phase -> puzzles nobody won (turn cap hit, or every seat locked out)
+    unsolved: Counter = field(default_factory=Counter)
+
+    def add(self, record: dict) -> None:
+        self.games += 1
+        for seat, name in enumerate(record["strategies"]):
+            s: StrategyStats = self.strategies.setdefault(name, StrategyStats())
+            total: float = record["totals"][seat]
+            s.games += 1
+            s.wins += record["winner"] == seat
+            if record["bonus_player"] == seat:
+                s.bonus_rounds += 1
+                s.bonus_wins += record["bonus_won"]
+            s.bankrupts += record["bankrupts"][seat]
+            s.bankrupt_loss += record["bankrupt_loss"][seat]
+            s.winnings += total
+            s.winnings_sq += total * total
+            s.histogram[int(total // WINNINGS_BUCKET)] += 1
+        for phase, counts in record["turns"].items():
+            self.turns.setdefault(phase, Counter()).update(counts)
+        self.unsolved.update(record["unsolved"])
+
+    def merge(self, other: "TournamentStats") -> None:
+        self.games += other.games
+        for name, s in other.strategies.items():
+            self.strategies.setdefault(name, StrategyStats()).merge(s)
+        for phase, counts in other.turns.items():
+            self.turns.setdefault(phase, Counter()).update(counts)
+        self.unsolved.update(other.unsolved)
+
+    def to_dict(self) -> dict:
+        strategies: dict[str, dict] = {}
+        for name, s in sorted(self.strategies.items()):
+            mean: float = s.winnings / s.games if s.games else 0.0
+            var: float = s.winnings_sq / s.games - mean * mean if s.games else 0.0
+            strategies[name] = {
+                "seat_games": s.games,
+                "win_rate": round(s.wins / s.games, 4) if s.games else 0.0,
+                "bonus_rate": round(s.bonus_rounds / s.games, 4) if s.games else 0.0,
+                "bonus_win_rate": (
+                    round(s.bonus_wins / s.bonus_rounds, 4) if s.bonus_rounds else 0.0
+                ),
+                "mean_winnings": round(mean, 4),
+                "stdev_winnings": round(math.sqrt(max(0.0, var)), 4),
+                "p50_winnings": s.percentile(0.5),
+                "p90_winnings": s.percentile(0.9),
+                "bankrupts_per_game": (
+                    round(s.bankrupts / s.games, 4) if s.games else 0.0
+                ),
+                "bankrupt_loss_per_game": (
+                    round(s.bankrupt_loss / s.games, 4) if s.games else 0.0
+                ),
+            }
+        turns: dict[str, dict] = {}
+        for phase, counts in sorted(self.turns.items()):
+            n: int = sum(counts.values())
+            turns[phase] = {
+                "puzzles": n,
+                "mean_turns": round(sum(t * c for t, c in counts.items()) / n, 2),
+                "max_turns": max(counts),
+                "unsolved": self.unsolved[phase],
+            }
+        return {"games": self.games, "strategies": strategies, "turns": turns}
+
+    def format(self) -> str:
+        d: dict = self.to_dict()
+        lines: list[str] = [f"{d['games']:,} games", ""]
+        lines.append(
+            f"{'strategy':<18}{'win%':>7}{'bonus%':>8}{'mean':>10}{'p50':>10}"
+            f"{'p90':>10}{'BR/game':>9}{'BR loss':>10}"
+        )
+        for name, s in d["strategies"].items():
+            lines.append(
+                f"{name:<18}{s['win_rate']:>7.1%}{s['bonus_rate']:>8.1%}"
+                f"{fmt_money(s['mean_winnings']):>10}{fmt_money(s['p50_winnings']):>10}"
+                f"{fmt_money(s['p90_winnings']):>10}{s['bankrupts_per_game']:>9.2f}"
+                f"{fmt_money(s['bankrupt_loss_per_game']):>10}"
+            )
+        lines.append("")
+        for phase, t in d["turns"].items():
+            lines.append(
+                f"{phase:<12} {t['mean_turns']:>6.1f} turns/puzzle"
+                f" (max {t['max_turns']}), {t['unsolved']:,} unsolved"
+            )
+        return "\n".join(lines)
+
+
+# per-worker game setup, built once by _init_worker instead of pickled per chunk
+_WORKER: dict = {}
+
+
+def _init_worker(
+    puzzles_path: Path | None,
+    wedges: list[float | str | Wedge],
+    strategies: list[Strategy],
+    vowel_cost: float,
+) -> None:
+    library: Puzzles = Puzzles(puzzles_path)
+    _WORKER["library"] = library
+    _WORKER["pools"] = show_pools(library)
+    _WORKER["layout"] = WedgeLayout(wedges)
+    _WORKER["strategies"] = strategies
+    _WORKER["vowel_cost"] = vowel_cost
+
+
+def _run_chunk(args: tuple[int, int, int, bool]) -> tuple[TournamentStats, list[dict]]:
+    first, count, seed, keep_records = args
+    stats: TournamentStats = TournamentStats()
+    records: list[dict] = []
+    for game_id in range(first, first + count):
+        record: dict = play_game(
+            game_id,
+            seed * 1_000_003 + game_id,
+            _WORKER["library"],
+            _WORKER["pools"],
+            _WORKER["layout"],
+            _WORKER["strategies"],
+            _WORKER["vowel_cost"],
+        )
+        stats.add(record)
+        if keep_records:
+            records.append(record)
+    return stats, records
+
+
+def run_tournament(
+    games: int,
+    strategies: list[Strategy],
+    wedges: list[float | str | Wedge] | None = None,
+    vowel_cost: float = VOWEL_COST,
+    seed: int = 0,
+    workers: int | None = None,
+    out: Path | None = None,
+    progress: bool = False,
+    puzzles_path: Path | None = None,
+) -> TournamentStats:
+    """
+    Play `games` games across `workers` processes (1 = in-process), each a show
+    drawn from the library at `puzzles_path` (default: the bundled puzzles).
+    """
+    wedges = DEFAULT_WEDGES if wedges is None else wedges
+    workers = workers or os.cpu_count() or 1
+    chunks = (
+        (first, min(CHUNK_GAMES, games - first), seed, out is not None)
+        for first in range(0, games, CHUNK_GAMES)
+    )
+    stats: TournamentStats = TournamentStats()
+    sink = out.open("w", encoding="utf-8") if out is not None else None
+    try:
+
+        def collect(chunk_stats: TournamentStats, records: list[dict]) -> None:
+            stats.merge(chunk_stats)
+            if sink is not None:
+                sink.writelines(json.dumps(r) + "\n" for r in records)
+            if progress:
+                print(f"\r{stats.games:,}/{games:,} games", end="", file=sys.stderr)
+
+        if workers == 1:
+            _init_worker(puzzles_path, wedges, strategies, vowel_cost)
+            for chunk in chunks:
+                collect(*_run_chunk(chunk))
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(puzzles_path, wedges, strategies, vowel_cost),
+            ) as pool:
+                # keep a bounded number of chunks in flight so finished results
+                # never pile up; aggregates merge in any order
+                pending: set[Future] = {
+                    pool.submit(_run_chunk, chunk)
+                    for chunk in islice(chunks, 2 * workers)
+                }
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        collect(*future.result())
+                        for chunk in islice(chunks, 1):
+                            pending.add(pool.submit(_run_chunk, chunk))
+    finally:
+        if sink is not None:
+            sink.close()
+        if progress:
+            print(file=sys.stderr)
+    return stats
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Bot tournament simulator")
+    parser.add_argument("--games", type=int, default=10_000)
+    parser.add_argument(
+        "--strategies",
+        default="always_spin,buy_vowels,solve_at",
+        help="comma-separated seat strategies, e.g. always_spin,solve_at:0.7",
+    )
+    parser.add_argument("--vowel-cost", type=float, default=VOWEL_COST)
+    parser.add_argument(
+        "--wedges", type=Path, help="JSON wedge list (default: DEFAULT_WEDGES)"
+    )
+    parser.add_argument(
+        "--puzzles", type=Path, help="puzzle library (default: bundled puzzles.json)"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="default: all cores")
+    parser.add_argument("--out", type=Path, help="stream per-game records (JSONL)")
+    parser.add_argument("--json", action="store_true", help="print report as JSON")
+    args = parser.parse_args(argv)
+
+    wedges = None
+    if args.wedges:
+        # entries are values, or [value, width] pairs for custom-width wedges
+        wedges = [
+            Wedge(*w) if isinstance(w, list) else w
+            for w in json.loads(args.wedges.read_text(encoding="utf-8"))
+        ]
+    stats: TournamentStats = run_tournament(
+        args.games,
+        [parse_strategy(s) for s in args.strategies.split(",")],
+        wedges=wedges,
+        vowel_cost=args.vowel_cost,
+        seed=args.seed,
+        workers=args.workers,
+        out=args.out,
+        progress=not args.json,
+        puzzles_path=args.puzzles,
+    )
+    print(json.dumps(stats.to_dict(), indent=2) if args.json else stats.format())
+
+
+if __name__ == "__main__":
+    main()
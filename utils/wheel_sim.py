@@ -0,0 +1,196 @@
+"""
+Headless Monte Carlo simulator for wheel layouts.
+
+Reproduces WheelWidget's spin physics (see data.spin) and pointer -> wedge mapping
+for millions of spins, then reports landing probabilities, BANKRUPT / LOSE A TURN
+rates, the expected cash value of a spin and a chi-square check against a fair
+wheel. Uses NumPy when it is installed (`pip install .[sim]`) and falls back to
+a slower pure-Python loop otherwise.
+
+    python -m utils.wheel_sim --spins 2000000 --seed 7
+    python -m utils.wheel_sim --wedges my_layout.json --json
+"""
+
+import argparse
+import json
+import math
+import random
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent.resolve()))
+
+from data import DEFAULT_WEDGES, Wedge, WedgeLayout, plan_spin
+from data.constants import (
+    SPIN_FRICTION_RANGE,
+    SPIN_STOP_VELOCITY,
+    SPIN_VELOCITY_RANGE,
+)
+from utils.utils import fmt_money
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# spins generated per vectorized batch; bounds memory for very large runs
+CHUNK_SIZE: int = 1_000_000
+
+
+@dataclass
+class SpinReport:
+    wedges: list[float | str]
+    spins: int
+    counts: list[int]
+    probabilities: list[float]
+    expected_probabilities: list[float]
+    bankrupt_rate: float
+    lose_turn_rate: float
+    expected_value: float
+    chi_square: float
+    degrees_of_freedom: int
+    p_value: float
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    def format(self) -> str:
+        lines: list[str] = [f"Spins: {self.spins:,}"]
+        for i, wedge in enumerate(self.wedges):
+            label: str = str(wedge) if isinstance(wedge, str) else fmt_money(wedge)
+            lines.append(
+                f"{i:>3}  {label:<12} {self.probabilities[i]:8.4%}"
+                f"  (fair {self.expected_probabilities[i]:.4%})"
+            )
+        lines.append(f"BANKRUPT rate:    {self.bankrupt_rate:.4%}")
+        lines.append(f"LOSE A TURN rate: {self.lose_turn_rate:.4%}")
+        lines.append(f"Expected value:   {fmt_money(self.expected_value)}")
+        lines.append(
+            f"Chi-square:       {self.chi_square:.2f}"
+            f" (df={self.degrees_of_freedom}, p={self.p_value:.4f})"
+        )
+        return "\n".join(lines)
+
+
+def _chi_square_p_value(x: float, dof: int) -> float:
+    """Upper tail of the chi-square distribution (Wilson-Hilferty approximation)."""
+    if dof <= 0:
+        return 1.0
+    h: float = 2.0 / (9.0 * dof)
+    z: float = ((x / dof) ** (1.0 / 3.0) - (1.0 - h)) / math.sqrt(h)
+    return 0.5 * math.erfc(z / math.sqrt(2.0))
+
+
+def _landing_counts_numpy(
+    layout: WedgeLayout, spins: int, start: float, seed: int | None
+) -> list[int]:
+    rng = np.random.default_rng(seed)
+    count: int = len(layout)
+    starts = np.asarray(layout.starts)
+    totals = np.zeros(count, dtype=np.int64)
+    rotation: float = start
+    remaining: int = spins
+    while remaining > 0:
+        n: int = min(CHUNK_SIZE, remaining)
+        velocity = rng.uniform(*SPIN_VELOCITY_RANGE, n)
+        friction = rng.uniform(*SPIN_FRICTION_RANGE, n)
+        steps = np.log(SPIN_STOP_VELOCITY / velocity) / np.log(friction)
+        steps = np.maximum(np.floor(steps) + 1, 1)
+        distance = velocity * (1.0 - friction**steps) / (1.0 - friction)
+        # each spin starts where the previous one stopped, like the real widget
+        final = (rotation + np.cumsum(distance % 360.0)) % 360.0
+        rotation = float(final[-1])
+        s = (-final - 90.0) % 360.0
+        idx = np.clip(np.searchsorted(starts, s, side="right") - 1, 0, count - 1)
+        totals += np.bincount(idx, minlength=count)
+        remaining -= n
+    return [int(c) for c in totals]
+
+
+def _landing_counts_python(
+    layout: WedgeLayout, spins: int, start: float, seed: int | None
+) -> list[int]:
+    rng: random.Random = random.Random(seed)
+    totals: list[int] = [0] * len(layout)
+    rotation: float = start
+    for _ in range(spins):
+        rotation = plan_spin(rotation, rng=rng).final_rotation
+        totals[layout.index_at(rotation)] += 1
+    return totals
+
+
+def simulate_spins(
+    wedges: list[float | str | Wedge] | None = None,
+    spins: int = 1_000_000,
+    seed: int | None = None,
+    start: float = 0.0,
+) -> SpinReport:
+    """
+    Spin a wheel with the given wedge list `spins` times and summarize the outcome.
+    Expected ("fair") probabilities are each wedge's share of the circle.
+    """
+    layout: WedgeLayout = WedgeLayout(DEFAULT_WEDGES if wedges is None else wedges)
+    wedges = layout.values
+    n: int = len(layout)
+    if n == 0 or spins <= 0:
+        raise ValueError("need at least one wedge and one spin")
+
+    if np is not None:
+        counts: list[int] = _landing_counts_numpy(layout, spins, start, seed)
+    else:
+        counts = _landing_counts_python(layout, spins, start, seed)
+
+    probabilities: list[float] = [c / spins for c in counts]
+    expected: list[float] = [sweep / 360.0 for sweep in layout.sweeps]
+    chi_square: float = sum(
+        (c - spins * e) ** 2 / (spins * e) for c, e in zip(counts, expected)
+    )
+    expected_value: float = sum(
+        p * float(w)
+        for p, w in zip(probabilities, wedges)
+        if not isinstance(w, str)
+    )
+
+    return SpinReport(
+        wedges=wedges,
+        spins=spins,
+        counts=counts,
+        probabilities=probabilities,
+        expected_probabilities=expected,
+        bankrupt_rate=sum(
+            p for p, w in zip(probabilities, wedges) if w == "BANKRUPT"
+        ),
+        lose_turn_rate=sum(
+            p for p, w in zip(probabilities, wedges) if w == "LOSE A TURN"
+        ),
+        expected_value=expected_value,
+        chi_square=chi_square,
+        degrees_of_freedom=n - 1,
+        p_value=_chi_square_p_value(chi_square, n - 1),
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Monte Carlo wheel fairness report")
+    parser.add_argument("--spins", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument(
+        "--wedges", type=Path, help="JSON wedge list (default: DEFAULT_WEDGES)"
+    )
+    parser.add_argument("--json", action="store_true", help="print report as JSON")
+    args = parser.parse_args(argv)
+
+    wedges = None
+    if args.wedges:
+        # entries are values, or [value, width] pairs for custom-width wedges
+        wedges = [
+            Wedge(*w) if isinstance(w, list) else w
+            for w in json.loads(args.wedges.read_text(encoding="utf-8"))
+        ]
+    report: SpinReport = simulate_spins(wedges, spins=args.spins, seed=args.seed)
+    print(json.dumps(report.to_dict(), indent=2) if args.json else report.format())
+
+
+if __name__ == "__main__":
+    main()
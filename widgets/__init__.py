@@ -1,6 +1,19 @@
+from .clock import QtClock
 from .board import BoardWidget
 from .wheel import WheelWidget
 from .sounds import SoundsManager
+from .host_assist import HostAssistPanel
+from .quick import QuickBoardWidget, QuickWheelWidget, use_software_scenegraph
 from .window import GameWindow
 
-__all__ = ["BoardWidget", "SoundsManager", "WheelWidget", "GameWindow"]
+__all__ = [
+    "QtClock",
+    "BoardWidget",
+    "SoundsManager",
+    "WheelWidget",
+    "HostAssistPanel",
+    "QuickBoardWidget",
+    "QuickWheelWidget",
+    "use_software_scenegraph",
+    "GameWindow",
+]
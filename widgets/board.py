@@ -1,6 +1,22 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import partial
 from PySide6 import QtWidgets, QtGui, QtCore
-from data import Puzzle
+from data import Puzzle, PuzzleState, wrap_phrase
+from data.constants import BOARD_COLUMNS, BOARD_ROWS
 from widgets.sounds import SoundsManager
+from widgets.tiles import CELL_BLANK, CELL_BLUE, CELL_LETTER, CELL_TEXT
+from widgets.tiles import CELL_UNDERSCORE, TileCache
+from utils import Clock, FrameStats, Timeline
+from widgets.clock import QtClock
+
+
+@dataclass(slots=True)
+class BoardCell:
+    index: int  # position in the phrase
+    ch: str
+    rect: QtCore.QRectF
+    line: int
 
 
 class BoardWidget(QtWidgets.QWidget):
@@ -26,147 +42,72 @@ class BoardWidget(QtWidgets.QWidget):
             return QtCore.QSize(200, 100)
 
         def paintEvent(self, event: QtGui.QPaintEvent) -> None:
+            self.owner.frame_stats.begin()
             painter: QtGui.QPainter = QtGui.QPainter(self)
-            painter.setRenderHint(QtGui.QPainter.Antialiasing)
             painter.setRenderHint(QtGui.QPainter.TextAntialiasing)
 
             # Background (transparent so parent controls background)
             painter.fillRect(event.rect(), self.palette().window())
 
-            widget_w: int = self.width()
-            widget_h: int = self.height()
-            fm: QtGui.QFontMetrics = QtGui.QFontMetrics(self.owner._display_font)
-
-            # Use line spacing with a tiny bit of extra vertical padding
-            line_height: int = fm.lineSpacing() + 6
-            x_margin: int = 12
-            y_margin: int = 8
-
-            phrase: str = self.owner.puzzle.phrase if self.owner.puzzle else ""
-            # For monospace fonts, using the width of "M" is reliable for cell width
-            cell_w: int = max(
-                fm.horizontalAdvance("M"), fm.horizontalAdvance("_")
-            ) + int(fm.averageCharWidth() * 0.6)
-            gap: int = int(cell_w * 0.15)
-
-            # --- Determine wrapping: produce list of lines, each line is list of (index, char) ---
-            lines: list[list[tuple[int, str]]] = []
-            current_line: list[tuple[int, str]] = []
-            cur_x = x_margin
-
-            for i, ch in enumerate(phrase):
-                # if next cell would overflow, push current line and start a new one
-                if cur_x + cell_w + x_margin > widget_w and current_line:
-                    lines.append(current_line)
-                    current_line: list[tuple[int, str]] = []
-                    cur_x = x_margin
-
-                current_line.append((i, ch))
-                cur_x += cell_w + gap
-
-            if current_line:
-                lines.append(current_line)
-
-            # compute vertical centering
-            line_count: int = max(1, len(lines))
-            total_height: int = line_count * line_height
-            start_top: float = max(y_margin, (widget_h - total_height) / 2)
-
-            # draw each line
-            for line_idx, line in enumerate(lines):
-                y: float = start_top + line_idx * line_height + fm.ascent()
-                x = x_margin
-
-                for index, ch in line:
-                    rect: QtCore.QRectF = QtCore.QRectF(
-                        x, y - fm.ascent(), cell_w, fm.height()
-                    )
-
-                    if not ch.isalpha():
-                        # draw non-alpha characters directly (like spaces, punctuation)
-                        painter.setFont(self.owner._display_font)
-                        painter.setPen(self.owner._text_pen)
-                        painter.drawText(rect, QtCore.Qt.AlignCenter, ch)
-                    else:
-                        # overlay (blue rectangle) takes precedence
-                        if index in self.owner._overlay_positions:
-                            # draw rounded blue rectangle
-                            painter.setBrush(self.owner._blue_brush)
-                            painter.setPen(QtCore.Qt.NoPen)
-                            # shrink rect a bit for padding
-                            r: QtCore.QRectF = rect.adjusted(3, 3, -3, -5)
-                            painter.drawRoundedRect(r, 6, 6)
-                        # DRAW BY POSITION: only draw the revealed letter for this specific index
-                        elif index in self.owner._revealed_positions:
-                            painter.setFont(self.owner._display_font)
-                            painter.setPen(self.owner._text_pen)
-                            painter.drawText(rect, QtCore.Qt.AlignCenter, ch.upper())
-                        # fallback: if letter is present in revealed-letters set (older logic),
-                        # show it when finalized — keeps backwards compatibility
-                        elif (
-                            ch.upper() in self.owner.revealed
-                            and self.owner._finalize_flag
-                        ):
-                            painter.setFont(self.owner._display_font)
-                            painter.setPen(self.owner._text_pen)
-                            painter.drawText(rect, QtCore.Qt.AlignCenter, ch.upper())
-                        else:
-                            # decide whether to draw underscore or blank space depending on animation state
-                            if (
-                                self.owner._anim_active
-                                and index >= self.owner._anim_index
-                                and not self.owner._finalize_flag
-                            ):
-                                # blank space to keep spacing while animating (draw nothing)
-                                pass
-                            else:
-                                # show underscore (unrevealed)
-                                painter.setFont(self.owner._display_font)
-                                painter.setPen(self.owner._text_pen)
-                                # draw a small underscore centered horizontally near the bottom of rect
-                                underscore_y: float = rect.bottom() - 5
-                                us_w: float = max(10, cell_w * 0.65)
-                                us_x: float = rect.x() + (cell_w - us_w) / 2
-                                painter.drawLine(
-                                    QtCore.QPointF(us_x, underscore_y),
-                                    QtCore.QPointF(us_x + us_w, underscore_y),
-                                )
-
-                    x += cell_w + gap
+            owner: BoardWidget = self.owner
+            dirty: QtCore.QRect = event.rect()
+            dirty_f: QtCore.QRectF = QtCore.QRectF(dirty)
+            dpr: float = self.devicePixelRatioF()
+            owner.repainted_pixels += int(dirty.width() * dirty.height() * dpr * dpr)
+            tiles: TileCache = owner.tiles
+            for cell in owner.cell_layout(self.width(), self.height()):
+                # only cells inside the invalidated area need painting
+                if not cell.rect.intersects(dirty_f):
+                    continue
+                state: str = owner.cell_state(cell.index, cell.ch)
+                tile: QtGui.QPixmap | None = tiles.tile(
+                    cell.ch, state, cell.rect.size(), dpr
+                )
+                if tile is not None:
+                    painter.drawPixmap(cell.rect.topLeft(), tile)
+
+            if self.owner.frame_stats.overlay:
+                painter.setFont(self.owner._category_font)
+                painter.setPen(QtGui.QPen(QtGui.QColor(120, 220, 120)))
+                painter.drawText(
+                    self.rect().adjusted(4, 4, -4, -4),
+                    QtCore.Qt.AlignRight | QtCore.Qt.AlignTop,
+                    self.owner.frame_stats.overlay_text(),
+                )
 
             painter.end()
+            self.owner.frame_stats.end()
 
     def __init__(self, parent) -> None:
         super().__init__(parent)
         self.puzzle: Puzzle | None = None
-        self.revealed: set[str] = set()
-        self.correct_letters: set[str] = set()
-
-        # track revealed *positions* (indexes) separately from revealed letters
-        self._revealed_positions: set[int] = set()
+        # revealed positions / letters of the current puzzle; the board only draws it
+        self.state: PuzzleState = PuzzleState()
 
         self.parent = parent
         self.sounds: SoundsManager = getattr(self.parent, "sounds", None)
+        # time source for every animation; a VirtualClock makes them scriptable
+        self.clock: Clock = getattr(self.parent, "clock", None) or QtClock()
 
         # Animation and reveal timers
-        self._anim_timer: QtCore.QTimer = QtCore.QTimer(self)
-        self._anim_timer.timeout.connect(self._animate_step)
+        self._anim_timer = self.clock.timer(self._animate_step)
         self._anim_index: int = 0
         self._anim_delay_ms: int = 100  # ms between showing each placeholder
         self._anim_active: bool = False
         self._finalize_flag: bool = False  # used by display to emulate finalize param
 
-        # blue-square placement timer (cadence for when blue squares appear)
-        self._blue_timer: QtCore.QTimer = QtCore.QTimer(self)
-        self._blue_timer.timeout.connect(self._place_next_blue)
-
-        # positions waiting to have their blue squares placed (queue)
-        self._positions_to_place: list[int] = []
-        # map pos -> single-shot timer converting blue->letter (so we can cancel if needed)
-        self._blue_to_letter_timers: dict[int, QtCore.QTimer] = {}
+        # reveal animation: every blue placement / blue->letter conversion is an
+        # event on one timeline, driven by a single timer re-armed for the next event
+        self._timeline: Timeline = Timeline(self.clock.now_ms)
+        self._reveal_timer = self.clock.timer(self._on_reveal_timer, single_shot=True)
+        # positions of the running reveal; True while finalize drains the timeline
+        self._reveal_positions: list[int] = []
+        self._draining: bool = False
 
         # Internal overlay positions (integers) representing positions currently showing blue rectangle
         self._overlay_positions: set[int] = set()
+        # True from start_reveal_animation until the reveal is finalized
+        self._reveal_active: bool = False
 
         # Visual resources
         # Use a monospace/fixed-pitch font for perfectly even cells.
@@ -184,6 +125,24 @@ class BoardWidget(QtWidgets.QWidget):
         self._text_pen: QtGui.QPen = QtGui.QPen(QtGui.QColor(255, 255, 255))
         self._blue_brush: QtGui.QBrush = QtGui.QBrush(QtGui.QColor("#2A6FB8"))
 
+        # cached result of cell_layout()
+        self._layout_key: tuple | None = None
+        self._layout_cells: list[BoardCell] = []
+        self._layout_index: dict[int, BoardCell] = {}
+        # device pixels repainted on the display; reset at the start of each reveal
+        self.repainted_pixels: int = 0
+
+        # pre-rendered letter / underscore / blue-square pixmaps for BoardDisplay
+        self.tiles: TileCache = TileCache(
+            self._display_font, self._text_pen, self._blue_brush
+        )
+
+        # paint timing instrumentation for BoardDisplay (no-op until enabled); the
+        # target follows the animation cadence, not the screen refresh rate
+        self.frame_stats: FrameStats = FrameStats(
+            "BoardDisplay", target_ms=self._anim_delay_ms
+        )
+
         self._init_ui()
 
     def _init_ui(self) -> None:
@@ -198,7 +157,7 @@ class BoardWidget(QtWidgets.QWidget):
         )
         self.category_label.setPalette(palette)
 
-        self.display: BoardWidget.BoardDisplay = BoardWidget.BoardDisplay(self)
+        self.display: QtWidgets.QWidget = self._create_display()
         self.display.setFont(self._display_font)
 
         layout: QtWidgets.QVBoxLayout = QtWidgets.QVBoxLayout()
@@ -209,27 +168,117 @@ class BoardWidget(QtWidgets.QWidget):
         self.setLayout(layout)
         self.setMinimumHeight(160)
 
+    @property
+    def revealed(self) -> set[str]:
+        """Letters whose every position is shown."""
+        return self.state.revealed_letters
+
+    @property
+    def correct_letters(self) -> frozenset[str]:
+        """Letters that need to be revealed to solve."""
+        return self.state.letters
+
+    def _create_display(self) -> QtWidgets.QWidget:
+        # display backends override this; they must repaint on update()
+        return BoardWidget.BoardDisplay(self)
+
+    # ----- layout / cell state shared by every display backend -----
+    def cell_layout(self, widget_w: int, widget_h: int) -> list[BoardCell]:
+        """
+        Word-wrap the phrase for a display of the given size and return one BoardCell
+        per visible character, in phrase order. The result is cached per
+        (phrase, size, font), so repaints only recompute it after a resize or
+        load_puzzle.
+        """
+        phrase: str = self.puzzle.phrase if self.puzzle else ""
+        key: tuple = (phrase, widget_w, widget_h, self._display_font.key())
+        if key == self._layout_key:
+            return self._layout_cells
+
+        fm: QtGui.QFontMetrics = QtGui.QFontMetrics(self._display_font)
+
+        # Use line spacing with a tiny bit of extra vertical padding
+        line_height: int = fm.lineSpacing() + 6
+        x_margin: int = 12
+        y_margin: int = 8
+
+        # For monospace fonts, using the width of "M" is reliable for cell width
+        cell_w: int = max(fm.horizontalAdvance("M"), fm.horizontalAdvance("_")) + int(
+            fm.averageCharWidth() * 0.6
+        )
+        gap: int = int(cell_w * 0.15)
+
+        # like the show's board: at most BOARD_COLUMNS per row when the phrase fits
+        # in BOARD_ROWS rows, otherwise use the full width so long quotes still fit
+        fit_columns: int = max(1, (widget_w - 2 * x_margin + gap) // (cell_w + gap))
+        lines: list[list[int]] = wrap_phrase(phrase, min(fit_columns, BOARD_COLUMNS))
+        if len(lines) > BOARD_ROWS and fit_columns > BOARD_COLUMNS:
+            lines = wrap_phrase(phrase, fit_columns)
+
+        # compute vertical centering
+        line_count: int = max(1, len(lines))
+        total_height: int = line_count * line_height
+        start_top: float = max(y_margin, (widget_h - total_height) / 2)
+
+        cells: list[BoardCell] = []
+        for line_idx, line in enumerate(lines):
+            top: float = start_top + line_idx * line_height
+            # center each line horizontally
+            line_w: int = len(line) * (cell_w + gap) - gap
+            x: float = max(x_margin, (widget_w - line_w) / 2)
+            for index in line:
+                rect: QtCore.QRectF = QtCore.QRectF(x, top, cell_w, fm.height())
+                cells.append(BoardCell(index, phrase[index], rect, line_idx))
+                x += cell_w + gap
+
+        self._layout_key = key
+        self._layout_cells = cells
+        self._layout_index = {cell.index: cell for cell in cells}
+        return cells
+
+    def cell_state(self, index: int, ch: str) -> str:
+        """What a display should show for the cell at phrase position `index`."""
+        if not ch.isalpha():
+            # non-alpha characters are shown directly (spaces, punctuation)
+            return CELL_TEXT
+        # overlay (blue rectangle) takes precedence
+        if index in self._overlay_positions:
+            return CELL_BLUE
+        # DRAW BY POSITION: only draw the revealed letter for this specific index
+        if self.state.is_revealed(index):
+            return CELL_LETTER
+        # blank space to keep spacing while the entrance animation runs
+        if self._anim_active and index >= self._anim_index and not self._finalize_flag:
+            return CELL_BLANK
+        return CELL_UNDERSCORE
+
+    def _prewarm_tiles(self) -> None:
+        """Render the tiles the current puzzle needs before its entrance animation."""
+        cells: list[BoardCell] = self.cell_layout(
+            self.display.width(), self.display.height()
+        )
+        if self.puzzle and cells:
+            self.tiles.prewarm(
+                self.puzzle.phrase,
+                cells[0].rect.size(),
+                self.display.devicePixelRatioF(),
+            )
+
     # ----- API-compatible methods (keep same signatures where possible) -----
     def load_puzzle(self, puzzle: Puzzle) -> None:
         self.puzzle = puzzle
-        self.revealed.clear()
-        # clear per-position reveals
-        self._revealed_positions.clear()
-
-        # set of letters that need to be revealed to solve
-        self.correct_letters = set(ch.upper() for ch in puzzle.phrase if ch.isalpha())
+        self.state = PuzzleState(puzzle.phrase)
 
         self._overlay_positions.clear()
-        # stop any in-flight blue placement or conversion timers
-        self._stop_all_reveal_timers()
-
-        self._positions_to_place = []
-        self._reveal_index: int = 0
-        self._reveal_phase: int = 0
+        # drop any in-flight blue placements or conversions
+        self._stop_reveal()
+        self._reveal_positions = []
 
         self._anim_index = 0
         self._anim_active = True
         self._finalize_flag = False
+        self.frame_stats.reset()
+        self.frame_stats.target_ms = self._anim_delay_ms
 
         if self._anim_timer.isActive():
             self._anim_timer.stop()
@@ -242,6 +291,7 @@ class BoardWidget(QtWidgets.QWidget):
                 pass
 
         self.category_label.setText(f"Category: {self.puzzle.category}")
+        self._prewarm_tiles()
         self._render_display()
 
     def guess_letter(self, ch: str) -> int:
@@ -253,15 +303,13 @@ class BoardWidget(QtWidgets.QWidget):
             self._render_display(finalize=True)
 
         # if a reveal animation is running, finalize it
-        if self._blue_timer.isActive() or self._blue_to_letter_timers:
+        if self._timeline:
             # finalize current animation first so guesses behave deterministically
             self._finalize_reveal_animation()
 
         ch: str = ch.upper()
-        if ch in self.correct_letters and ch not in self.revealed:
-            positions: list[int] = [
-                i for i, c in enumerate(self.puzzle.phrase) if c.upper() == ch
-            ]
+        if ch in self.state.positions and not self.state.is_letter_revealed(ch):
+            positions: list[int] = list(self.state.positions_of(ch))
             count: int = len(positions)
             # use default timing values; callers may override parameters if desired
             self.start_reveal_animation(
@@ -275,13 +323,13 @@ class BoardWidget(QtWidgets.QWidget):
         return 0
 
     def is_solved(self) -> bool:
-        return self.correct_letters.issubset(self.revealed)
+        return self.state.is_solved()
 
     def update_display(self) -> None:
         if self._anim_timer.isActive():
             self._anim_timer.stop()
             self._anim_active = False
-        if self._blue_timer.isActive() or self._blue_to_letter_timers:
+        if self._timeline:
             self._finalize_reveal_animation()
         if not self.puzzle:
             self.category_label.setText("")
@@ -290,15 +338,58 @@ class BoardWidget(QtWidgets.QWidget):
         self._finalize_flag = True
         self._render_display(finalize=True)
 
-    def _render_display(self, finalize: bool = False) -> None:
+    def _render_display(
+        self, finalize: bool = False, positions: Iterable[int] | None = None
+    ) -> None:
         """
         Trigger repaint of the display. finalize=True will cause underscores to be shown for
         unrevealed letters (used when an animation is interrupted or finished).
+
+        With `positions`, only those cells (plus any cell whose state flips along with
+        the finalize flag) are invalidated; without it the whole board repaints.
         """
-        self._finalize_flag = bool(finalize)
-        if self.puzzle:
-            self.category_label.setText(f"Category: {self.puzzle.category}")
-        self.display.update()
+        finalize = bool(finalize)
+        if positions is None:
+            self._finalize_flag = finalize
+            self.display.update()
+            return
+
+        cells: list[BoardCell] = self.cell_layout(
+            self.display.width(), self.display.height()
+        )
+        dirty: set[int] = set(positions)
+        if finalize != self._finalize_flag:
+            before: list[str] = [self.cell_state(c.index, c.ch) for c in cells]
+            self._finalize_flag = finalize
+            dirty.update(
+                c.index
+                for c, state in zip(cells, before)
+                if self.cell_state(c.index, c.ch) != state
+            )
+        self._update_cells(dirty)
+
+    def _update_cells(self, positions: set[int]) -> None:
+        """Invalidate just the rects of the given phrase positions."""
+        if not positions:
+            return
+        region: QtGui.QRegion = QtGui.QRegion()
+        for pos in positions:
+            cell: BoardCell | None = self._layout_index.get(pos)
+            if cell is not None:
+                # grow by a pixel so antialiased edges are repainted too
+                region += cell.rect.toAlignedRect().adjusted(-1, -1, 1, 1)
+        if not region.isEmpty():
+            self.display.update(region)
+
+    def reveal_position(self, pos: int) -> bool:
+        """Show the letter at a single position and repaint just that cell."""
+        if self._anim_timer.isActive():
+            self._anim_timer.stop()
+            self._anim_active = False
+        if not self.state.reveal(pos):
+            return False
+        self._render_display(finalize=True, positions=(pos,))
+        return True
 
     def reveal_all(self) -> None:
         if not self.puzzle:
@@ -306,14 +397,9 @@ class BoardWidget(QtWidgets.QWidget):
         if self._anim_timer.isActive():
             self._anim_timer.stop()
             self._anim_active = False
-        if self._blue_timer.isActive() or self._blue_to_letter_timers:
+        if self._timeline:
             self._finalize_reveal_animation()
-        # reveal letters (keeps other code that expects letter-set working)
-        self.revealed = set(ch.upper() for ch in self.puzzle.phrase if ch.isalpha())
-        # NEW: reveal all positions too
-        self._revealed_positions = set(
-            i for i, ch in enumerate(self.puzzle.phrase) if ch.isalpha()
-        )
+        self.state.reveal_all()
         self._render_display(finalize=True)
 
     def start_reveal_animation(
@@ -330,140 +416,107 @@ class BoardWidget(QtWidgets.QWidget):
           - initial_delay_ms: how long before the first blue square is placed.
                               If None, defaults to 1000 ms.
           - per_step_ms: how long between placing successive blue squares (cadence).
-          - blue_to_letter_ms: how long after a blue square is placed that it converts to the letter.
+          - blue_to_letter_ms: how long after a blue square is placed that it converts
+                               to the letter. If None, defaults to per_step_ms.
 
-        Important: conversion of a given blue square to its letter is independent of when
-        other blue squares are placed. Each blue square schedules its own single-shot
-        timer to convert after blue_to_letter_ms.
+        The whole sequence is scheduled up front on the reveal timeline, so the
+        conversion of a blue square is independent of when others are placed.
         """
         if not positions:
             return
+        if initial_delay_ms is None:
+            initial_delay_ms = 1000
+        if blue_to_letter_ms is None:
+            blue_to_letter_ms = per_step_ms
 
-        # sort positions left->right
-        self._positions_to_place: list[int] = sorted(positions)
-        # clear any previous state for overlays / scheduled conversions
+        # clear any previous state for overlays / scheduled events
         self._overlay_positions.clear()
-        self._stop_all_reveal_timers()
-
-        # store these timing values so other methods can reference them if needed
-        self._current_per_step_ms: int = per_step_ms
-        self._current_blue_to_letter_ms: int = blue_to_letter_ms
-
-        # prepare blue placement timer but don't start it yet
-        self._blue_timer.setInterval(per_step_ms)
-
-        # Start the sequence after initial_delay_ms. We place the first blue immediately when the initial delay fires,
-        # then the _blue_timer will keep placing more at `per_step_ms`.
-        def _begin_sequence() -> None:
-            # place first blue immediately
-            self._place_next_blue()
-            # if there are still positions remaining, start repeating timer for subsequent placements
-            if self._positions_to_place:
-                # start regular cadence for remaining placements
-                self._blue_timer.start(per_step_ms)
-
-        # Use singleShot for the initial delay so placement cadence is independent
-        if initial_delay_ms <= 0:
-            _begin_sequence()
-        else:
-            QtCore.QTimer.singleShot(initial_delay_ms, _begin_sequence)
+        self._stop_reveal()
+
+        self._reveal_active = True
+        self.frame_stats.reset()
+        self.frame_stats.target_ms = per_step_ms
+        self.repainted_pixels = 0
+
+        # sort positions left->right
+        self._reveal_positions = sorted(positions)
+        for step, pos in enumerate(self._reveal_positions):
+            placed_at: int = max(0, initial_delay_ms) + step * per_step_ms
+            self._timeline.schedule(placed_at, partial(self._place_blue, pos))
+            self._timeline.schedule(
+                placed_at + blue_to_letter_ms,
+                partial(self._convert_blue_to_letter, pos),
+            )
+        self._on_reveal_timer()
 
         # initial render so the UI can show the impending animation
-        self._render_display()
+        self._render_display(positions=())
 
-    # ----- blue placement & conversion helpers -----
-    def _place_next_blue(self) -> None:
-        """
-        Place a blue rectangle at the next position in the queue and schedule its conversion
-        to the letter after `_current_blue_to_letter_ms`. This is called by the repeating
-        _blue_timer (and once immediately after the initial delay).
-        """
-        if not self._positions_to_place:
-            # nothing left to place; stop the cadence timer
-            if self._blue_timer.isActive():
-                self._blue_timer.stop()
-            return
+    # ----- reveal timeline control -----
+    def pause_reveal(self) -> None:
+        self._timeline.pause()
+        self._reveal_timer.stop()
+
+    def resume_reveal(self) -> None:
+        self._timeline.resume()
+        self._arm_reveal_timer()
 
-        pos: int = self._positions_to_place.pop(0)
+    def set_reveal_time_scale(self, scale: float) -> None:
+        """Speed up (>1) or slow down (<1) every pending reveal step."""
+        self._timeline.set_time_scale(scale)
+        self._arm_reveal_timer()
+
+    def fast_forward_reveal(self) -> None:
+        """Jump the running reveal to its end."""
+        if self._timeline:
+            self._finalize_reveal_animation()
+
+    def _on_reveal_timer(self) -> None:
+        self._timeline.run_due()
+        self._arm_reveal_timer()
+
+    def _arm_reveal_timer(self) -> None:
+        delay: float | None = self._timeline.next_delay_ms()
+        if delay is None:
+            self._reveal_timer.stop()
+        else:
+            self._reveal_timer.start(int(delay + 0.999))
+
+    def _stop_reveal(self) -> None:
+        """Drop every pending reveal event and stop the timer."""
+        self._reveal_timer.stop()
+        self._timeline.clear()
+
+    # ----- blue placement & conversion steps -----
+    def _place_blue(self, pos: int) -> None:
+        """Timeline event: show a blue rectangle at `pos`."""
         self._overlay_positions.add(pos)
+        if self._draining:
+            return
         # play sound for blue pop
         if self.sounds:
             try:
                 self.sounds.play("LETTER_REVEAL")
             except Exception:
                 pass
-        self._render_display()
-
-        # schedule conversion of this blue -> letter after configured delay
-        conv_timer: QtCore.QTimer = QtCore.QTimer(self)
-        conv_timer.setSingleShot(True)
-
-        # use a bound method to capture pos in closure
-        conv_timer.timeout.connect(lambda p=pos: self._convert_blue_to_letter(p))
-        conv_timer.start(self._current_blue_to_letter_ms)
-        # track it so we can cancel if needed
-        self._blue_to_letter_timers[pos] = conv_timer
-
-        # if we've just placed the last blue, stop the cadence timer (it may already be stopped)
-        if not self._positions_to_place and self._blue_timer.isActive():
-            self._blue_timer.stop()
+        self._render_display(positions=(pos,))
 
     def _convert_blue_to_letter(self, pos: int) -> None:
-        """
-        Convert a blue overlay at position `pos` into the revealed letter.
-        This method is called by each conversion timer when it fires.
-        """
+        """Timeline event: turn the blue overlay at `pos` into the revealed letter."""
         if not self.puzzle:
             return
 
-        # mark that position revealed
-        self._revealed_positions.add(pos)
-        # remove overlay if present
-        if pos in self._overlay_positions:
-            self._overlay_positions.remove(pos)
-
-        # cleanup and remove the conversion timer entry if it exists
-        timer: QtCore.QTimer | None = self._blue_to_letter_timers.pop(pos, None)
-        if timer and timer.isActive():
-            timer.stop()
-
-        # Also, if all positions for this particular letter are now revealed, add the letter
-        ch: str = self.puzzle.phrase[pos]
-        letter: str = ch.upper()
-        positions_for_letter = [
-            i for i, c in enumerate(self.puzzle.phrase) if c.upper() == letter
-        ]
-        if all(p in self._revealed_positions for p in positions_for_letter):
-            self.revealed.add(letter)
-
-        self._render_display()
+        # mark that position revealed (also marks the letter once all are shown)
+        self.state.reveal(pos)
+        self._overlay_positions.discard(pos)
+        if self._draining:
+            return
+        self._render_display(positions=(pos,))
 
-        # if no more active overlays/conversions and no positions queued, finalize automatically
-        if (
-            not self._overlay_positions
-            and not self._positions_to_place
-            and not self._blue_to_letter_timers
-        ):
+        # once the last event has run, finalize automatically
+        if not self._timeline:
             self._finalize_reveal_animation()
 
-    def _stop_all_reveal_timers(self) -> None:
-        """
-        Stop and clear any active timers used in the reveal pipeline:
-         - repeating blue placement timer
-         - per-position conversion timers
-        """
-        if self._blue_timer.isActive():
-            self._blue_timer.stop()
-
-        # stop and delete all single-shot timers
-        for t in list(self._blue_to_letter_timers.values()):
-            try:
-                if t.isActive():
-                    t.stop()
-            except Exception:
-                pass
-        self._blue_to_letter_timers.clear()
-
     # ----- timers callbacks -----
     def _animate_step(self) -> None:
         """
@@ -480,50 +533,36 @@ class BoardWidget(QtWidgets.QWidget):
         if self._anim_index < len(phrase):
             self._anim_index += 1
 
-        # Re-render according to animation progress
-        self._render_display()
+        # Re-render according to animation progress (only the cell that just appeared)
+        self._render_display(positions=(self._anim_index - 1,))
 
         # If we've animated across the entire phrase, stop and finalize the display
         if self._anim_index >= len(phrase):
             self._anim_timer.stop()
             self._anim_active = False
-            self._finalize_flag = True
-            self._render_display(finalize=True)
-
-    # legacy method retained but not used with new flow
-    def _reveal_step(self) -> None:
-        # kept for backward compatibility; no-op in new system (we use _place_next_blue/_convert_blue_to_letter)
-        return
+            self._render_display(finalize=True, positions=())
+            self.frame_stats.dump("entrance", phrase_length=len(phrase))
+            self.frame_stats.reset()
 
     def _finalize_reveal_animation(self) -> None:
         """
-        Immediately finalize/abort any running reveal animation:
-          - stop cadence timer
-          - stop and clear conversion timers
-          - reveal all positions that were queued/overlayed so the board shows letters
+        Immediately finalize any running reveal animation: drain the timeline so every
+        queued placement and conversion takes effect at once (silently), then repaint
+        the affected cells.
         """
-        # stop cadence and per-position timers
-        self._stop_all_reveal_timers()
-
-        # convert any overlayed positions to revealed positions immediately
-        # and also convert any queued positions (not yet overlayed) so finalize shows them
-        all_positions: set[int] = set(self._overlay_positions) | set(
-            self._positions_to_place
-        )
-        # also include any conversion timers' keys just in case
-        all_positions |= set(self._blue_to_letter_timers.keys())
-
-        if self.puzzle:
-            for pos in all_positions:
-                # don't call _convert_blue_to_letter (it manipulates timers); just mark revealed
-                self._revealed_positions.add(pos)
-
-        # clear overlays and queues
+        self._reveal_timer.stop()
+        self._draining = True
+        try:
+            self._timeline.fast_forward()
+        finally:
+            self._draining = False
         self._overlay_positions.clear()
-        self._positions_to_place = []
-        self._blue_to_letter_timers.clear()
 
-        self._reveal_index = 0
-        self._reveal_phase = 0
-        self._finalize_flag = True
-        self._render_display(finalize=True)
+        self._render_display(finalize=True, positions=self._reveal_positions)
+        self._reveal_positions = []
+        if self._reveal_active:
+            self._reveal_active = False
+            self.frame_stats.dump(
+                "reveal", repainted_pixels=self.repainted_pixels, **self.tiles.stats()
+            )
+            self.frame_stats.reset()
@@ -0,0 +1,27 @@
+from collections.abc import Callable
+from PySide6 import QtCore
+
+from utils import Clock
+
+
+class QtClock(Clock):
+    """Real-time Clock: a monotonic QElapsedTimer and precise QTimers."""
+
+    def __init__(self) -> None:
+        self._elapsed: QtCore.QElapsedTimer = QtCore.QElapsedTimer()
+        self._elapsed.start()
+
+    def now_ms(self) -> float:
+        return self._elapsed.nsecsElapsed() / 1_000_000.0
+
+    def timer(
+        self, callback: Callable[[], None], single_shot: bool = False
+    ) -> QtCore.QTimer:
+        timer: QtCore.QTimer = QtCore.QTimer()
+        timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
+        timer.setSingleShot(single_shot)
+        timer.timeout.connect(callback)
+        return timer
+
+    def single_shot(self, ms: float, callback: Callable[[], None]) -> None:
+        QtCore.QTimer.singleShot(int(ms), callback)
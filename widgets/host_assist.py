@@ -0,0 +1,122 @@
+from collections.abc import Iterable
+from PySide6 import QtCore, QtGui, QtWidgets
+
+from data import PuzzleState, SolverSession, WordIndex
+from data.constants import SOLVER_WORDLISTS
+
+# words shown per puzzle word, consonants shown in the ranking
+HOST_ASSIST_WORDS: int = 8
+HOST_ASSIST_CONSONANTS: int = 6
+
+
+class WordIndexLoader(QtCore.QThread):
+    """Builds the WordIndex off the GUI thread; `ready` fires once it is usable."""
+
+    ready: QtCore.Signal = QtCore.Signal()
+
+    def __init__(
+        self, paths: Iterable[str], parent: QtCore.QObject | None = None
+    ) -> None:
+        super().__init__(parent)
+        self.paths: list[str] = list(paths)
+        self.index: WordIndex | None = None
+
+    def run(self) -> None:
+        self.index = WordIndex.from_files(self.paths)
+        self.ready.emit()
+
+
+class HostAssistPanel(QtWidgets.QGroupBox):
+    """
+    Host-only side panel: words from a local word list that fit each word of the
+    board, and the unknown consonants ranked by expected hits.
+
+    The window calls start() when a puzzle loads and refresh() after every reveal;
+    the SolverSession behind it only applies what changed since the last refresh.
+    """
+
+    def __init__(
+        self,
+        paths: Iterable[str] = SOLVER_WORDLISTS,
+        parent: QtWidgets.QWidget | None = None,
+    ) -> None:
+        super().__init__("Host Assist", parent)
+        self.session: SolverSession | None = None
+        self._state: PuzzleState | None = None
+        self._category: str = ""
+        self._called: set[str] = set()
+
+        layout: QtWidgets.QVBoxLayout = QtWidgets.QVBoxLayout()
+        self.consonants_label: QtWidgets.QLabel = QtWidgets.QLabel("")
+        self.consonants_label.setWordWrap(True)
+        layout.addWidget(self.consonants_label)
+        self.words_view: QtWidgets.QPlainTextEdit = QtWidgets.QPlainTextEdit()
+        self.words_view.setReadOnly(True)
+        self.words_view.setFont(
+            QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.FixedFont)
+        )
+        layout.addWidget(self.words_view)
+        self.setLayout(layout)
+
+        self.words_view.setPlainText("Loading word list...")
+        self._loader: WordIndexLoader = WordIndexLoader(paths, self)
+        self._loader.ready.connect(self._on_index_ready)
+        self._loader.start(QtCore.QThread.Priority.LowPriority)
+        app = QtWidgets.QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+
+    def _on_index_ready(self) -> None:
+        index: WordIndex | None = self._loader.index
+        if not index:
+            self.words_view.setPlainText("No word list found.")
+            return
+        self.session = SolverSession(index)
+        if self._state is not None:
+            # start() clears the called letters; keep the ones called while loading
+            called: set[str] = set(self._called)
+            self.start(self._state, self._category)
+            self.refresh(self._state, called)
+        else:
+            self.words_view.setPlainText(f"{len(index):,} words indexed.")
+
+    def start(self, state: PuzzleState, category: str = "") -> None:
+        self._state = state
+        self._category = category
+        self._called = set()
+        if self.session is not None:
+            self.session.start(state, category)
+            self.refresh(state)
+
+    def refresh(self, state: PuzzleState, called: Iterable[str] = ()) -> None:
+        self._state = state
+        self._called = set(called)
+        if self.session is None:
+            return
+        self.session.update(state, self._called)
+
+        ranked: list[tuple[str, float]] = self.session.rank_consonants(state)
+        self.consonants_label.setText(
+            "Best consonants: "
+            + "  ".join(
+                f"{letter} {hits:.1f}"
+                for letter, hits in ranked[:HOST_ASSIST_CONSONANTS]
+            )
+        )
+        lines: list[str] = []
+        for slot, words in zip(
+            self.session.slots, self.session.candidates(HOST_ASSIST_WORDS)
+        ):
+            shown: str = "".join(
+                "_" if state.phrase[pos].isalpha() and not state.is_revealed(pos)
+                else state.phrase[pos].upper()
+                for pos in slot.positions
+            )
+            extra: int = slot.count - len(words)
+            more: str = f" (+{extra:,})" if extra > 0 else ""
+            lines.append(f"{shown}: {', '.join(words) or '-'}{more}")
+        self.words_view.setPlainText("\n".join(lines))
+
+    def shutdown(self) -> None:
+        """Wait for the word-list loader so the thread isn't destroyed mid-run."""
+        self._loader.wait()
@@ -0,0 +1,294 @@
+import shiboken6
+from PySide6 import QtCore, QtGui, QtQuick, QtQuickWidgets, QtWidgets
+
+from widgets.board import BoardCell, BoardWidget
+from widgets.tiles import CELL_BLUE, CELL_LETTER, CELL_TEXT, CELL_UNDERSCORE
+from widgets.tiles import underscore_line
+from widgets.wheel import WheelWidget
+
+
+def use_software_scenegraph() -> None:
+    """
+    Force the software scene-graph adaptor for machines without a usable GPU.
+    Must be called before the first Quick window is created.
+    """
+    QtQuick.QQuickWindow.setGraphicsApi(
+        QtQuick.QSGRendererInterface.GraphicsApi.Software
+    )
+
+
+class WheelItem(QtQuick.QQuickItem):
+    """
+    Scene-graph wheel: the pre-rendered wheel sprite sits under a transform node and
+    the rim/pointer layer on top of it. A spin only changes the transform matrix;
+    textures are re-uploaded only when the sprite itself changes.
+
+    The wedges and their labels are deliberately one texture node, not a node per
+    wedge: the Python bindings have no public scene-graph text node, so labels
+    would be textures anyway, and reusing WheelWidget's cached sprite keeps both
+    backends pixel-identical. What is retained is the whole wheel, so a spin still
+    costs one matrix update and no repaint.
+    """
+
+    def __init__(self, parent: QtQuick.QQuickItem | None = None) -> None:
+        super().__init__(parent)
+        self.setFlag(QtQuick.QQuickItem.Flag.ItemHasContents, True)
+        self.wheel_rotation: float = 0.0
+        self._sprite: QtGui.QImage | None = None
+        self._overlay: QtGui.QImage | None = None
+        self._images_dirty: bool = False
+        self._transform: QtQuick.QSGTransformNode | None = None
+        self._wheel_node: QtQuick.QSGSimpleTextureNode | None = None
+        self._overlay_node: QtQuick.QSGSimpleTextureNode | None = None
+        # python refs keep the textures alive while their nodes use them
+        self._textures: list[QtQuick.QSGTexture] = []
+
+    def set_images(self, sprite: QtGui.QImage, overlay: QtGui.QImage) -> None:
+        if sprite is self._sprite and overlay is self._overlay:
+            return
+        self._sprite = sprite
+        self._overlay = overlay
+        self._images_dirty = True
+        self.update()
+
+    def set_wheel_rotation(self, rotation: float) -> None:
+        self.wheel_rotation = rotation
+        self.update()
+
+    def updatePaintNode(
+        self, old: QtQuick.QSGNode | None, data
+    ) -> QtQuick.QSGNode | None:
+        if self._sprite is None or self._overlay is None:
+            return old
+
+        root: QtQuick.QSGNode | None = old
+        if root is None:
+            root = QtQuick.QSGNode()
+            self._transform = QtQuick.QSGTransformNode()
+            self._wheel_node = QtQuick.QSGSimpleTextureNode()
+            self._overlay_node = QtQuick.QSGSimpleTextureNode()
+            self._wheel_node.setOwnsTexture(False)
+            self._overlay_node.setOwnsTexture(False)
+            self._transform.appendChildNode(self._wheel_node)
+            root.appendChildNode(self._transform)
+            root.appendChildNode(self._overlay_node)
+            self._images_dirty = True
+
+        cx: float = self.width() / 2.0
+        cy: float = self.height() / 2.0
+        if self._images_dirty:
+            window: QtQuick.QQuickWindow = self.window()
+            wheel_tex = window.createTextureFromImage(self._sprite)
+            overlay_tex = window.createTextureFromImage(self._overlay)
+            dpr: float = self._sprite.devicePixelRatio()
+            half: float = self._sprite.width() / dpr / 2.0
+            self._wheel_node.setTexture(wheel_tex)
+            self._wheel_node.setRect(
+                QtCore.QRectF(cx - half, cy - half, 2 * half, 2 * half)
+            )
+            self._overlay_node.setTexture(overlay_tex)
+            self._overlay_node.setRect(
+                QtCore.QRectF(
+                    0,
+                    0,
+                    self._overlay.width() / self._overlay.devicePixelRatio(),
+                    self._overlay.height() / self._overlay.devicePixelRatio(),
+                )
+            )
+            self._textures = [wheel_tex, overlay_tex]
+            self._images_dirty = False
+
+        # rotate around the wheel center; same direction as QPainter.rotate
+        matrix: QtGui.QMatrix4x4 = QtGui.QMatrix4x4()
+        matrix.translate(cx, cy)
+        matrix.rotate(self.wheel_rotation, 0.0, 0.0, 1.0)
+        matrix.translate(-cx, -cy)
+        self._transform.setMatrix(matrix)
+        return root
+
+
+class QuickWheelWidget(WheelWidget):
+    """
+    WheelWidget drawn through QtQuick's retained scene graph instead of paintEvent.
+    Spin physics, sprites and the spin_finished signal are inherited unchanged.
+    The atlas and worker-thread renderers don't apply and stay disabled.
+    """
+
+    def __init__(self, parent) -> None:
+        super().__init__(parent)
+        self._view: QtQuickWidgets.QQuickWidget = QtQuickWidgets.QQuickWidget(self)
+        self._view.setClearColor(self.palette().window().color())
+        self._item: WheelItem = WheelItem()
+        self._item.setParentItem(self._view.quickWindow().contentItem())
+
+        layout: QtWidgets.QVBoxLayout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self._view)
+
+    def paintEvent(self, event) -> None:
+        # the scene graph draws everything
+        return
+
+    def update(self, *args) -> None:
+        self._sync_rotation()
+        self._item.set_images(self._wheel_sprite(), self._overlay_sprite())
+        self._item.set_wheel_rotation(self.rotation)
+
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
+        super().resizeEvent(event)
+        self._item.setSize(QtCore.QSizeF(self.size()))
+        self.update()
+
+    def set_threaded_rendering(self, enabled: bool) -> None:
+        self.threaded_render = False
+
+    def set_atlas_enabled(self, enabled: bool, *args, **kwargs) -> None:
+        self.atlas_enabled = False
+
+
+class BoardItem(QtQuick.QQuickItem):
+    """
+    Scene-graph board. Each cell owns a container node whose single child (glyph
+    texture, blue square or underscore) is swapped only when that cell's state
+    changes; the whole tree is rebuilt only when the layout does.
+    """
+
+    def __init__(
+        self, owner: BoardWidget, parent: QtQuick.QQuickItem | None = None
+    ) -> None:
+        super().__init__(parent)
+        self.setFlag(QtQuick.QQuickItem.Flag.ItemHasContents, True)
+        self.owner: BoardWidget = owner
+        self._layout_key: tuple | None = None
+        self._cells: list[BoardCell] = []
+        self._cell_nodes: list[QtQuick.QSGNode] = []
+        self._cell_states: list[str | None] = []
+        self._glyphs: dict[str, QtQuick.QSGTexture] = {}
+
+    def _glyph(self, ch: str, rect: QtCore.QRectF) -> QtQuick.QSGTexture:
+        key: str = f"{ch}:{rect.width()}x{rect.height()}"
+        tex: QtQuick.QSGTexture | None = self._glyphs.get(key)
+        if tex is None:
+            dpr: float = self.window().effectiveDevicePixelRatio()
+            image: QtGui.QImage = QtGui.QImage(
+                int(rect.width() * dpr) + 1,
+                int(rect.height() * dpr) + 1,
+                QtGui.QImage.Format.Format_ARGB32_Premultiplied,
+            )
+            image.setDevicePixelRatio(dpr)
+            image.fill(QtCore.Qt.GlobalColor.transparent)
+            painter: QtGui.QPainter = QtGui.QPainter(image)
+            painter.setRenderHint(QtGui.QPainter.RenderHint.TextAntialiasing)
+            painter.setFont(self.owner._display_font)
+            painter.setPen(self.owner._text_pen)
+            painter.drawText(
+                QtCore.QRectF(0, 0, rect.width(), rect.height()),
+                QtCore.Qt.AlignmentFlag.AlignCenter,
+                ch,
+            )
+            painter.end()
+            tex = self.window().createTextureFromImage(image)
+            self._glyphs[key] = tex
+        return tex
+
+    def _content_node(
+        self, state: str, ch: str, rect: QtCore.QRectF
+    ) -> QtQuick.QSGNode | None:
+        if state in (CELL_TEXT, CELL_LETTER):
+            if not ch.strip():
+                return None
+            node = QtQuick.QSGSimpleTextureNode()
+            node.setOwnsTexture(False)
+            node.setTexture(self._glyph(ch.upper(), rect))
+            node.setRect(rect)
+            return node
+        if state == CELL_BLUE:
+            return QtQuick.QSGSimpleRectNode(
+                rect.adjusted(3, 3, -3, -5), self.owner._blue_brush.color()
+            )
+        if state == CELL_UNDERSCORE:
+            line: QtCore.QLineF = underscore_line(rect)
+            return QtQuick.QSGSimpleRectNode(
+                QtCore.QRectF(line.x1(), line.y1() - 1, line.dx(), 2),
+                self.owner._text_pen.color(),
+            )
+        return None
+
+    def updatePaintNode(
+        self, old: QtQuick.QSGNode | None, data
+    ) -> QtQuick.QSGNode | None:
+        owner: BoardWidget = self.owner
+        phrase: str = owner.puzzle.phrase if owner.puzzle else ""
+        key: tuple = (phrase, self.width(), self.height())
+
+        root: QtQuick.QSGNode | None = old
+        if root is None:
+            # new scene-graph context: textures from the old one are gone
+            root = QtQuick.QSGNode()
+            self._glyphs.clear()
+            self._layout_key = None
+
+        if key != self._layout_key:
+            for node in self._cell_nodes:
+                root.removeChildNode(node)
+                shiboken6.delete(node)
+            self._cells = owner.cell_layout(int(self.width()), int(self.height()))
+            self._cell_nodes = []
+            for _ in self._cells:
+                node: QtQuick.QSGNode = QtQuick.QSGNode()
+                root.appendChildNode(node)
+                self._cell_nodes.append(node)
+            self._cell_states = [None] * len(self._cells)
+            self._layout_key = key
+
+        for i, cell in enumerate(self._cells):
+            state: str = owner.cell_state(cell.index, cell.ch)
+            if state == self._cell_states[i]:
+                continue
+            container: QtQuick.QSGNode = self._cell_nodes[i]
+            while container.childCount():
+                child: QtQuick.QSGNode = container.firstChild()
+                container.removeChildNode(child)
+                shiboken6.delete(child)
+            content: QtQuick.QSGNode | None = self._content_node(
+                state, cell.ch, cell.rect
+            )
+            if content is not None:
+                container.appendChildNode(content)
+            self._cell_states[i] = state
+        return root
+
+
+class QuickBoardDisplay(QtQuickWidgets.QQuickWidget):
+    """Drop-in replacement for BoardWidget.BoardDisplay backed by BoardItem."""
+
+    def __init__(self, owner: BoardWidget, parent=None) -> None:
+        super().__init__(parent)
+        self.owner: BoardWidget = owner
+        self.setSizePolicy(
+            QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding
+        )
+        self.setClearColor(self.palette().window().color())
+        self._item: BoardItem = BoardItem(owner)
+        self._item.setParentItem(self.quickWindow().contentItem())
+
+    def sizeHint(self) -> QtCore.QSize:
+        return QtCore.QSize(600, 160)
+
+    def minimumSizeHint(self) -> QtCore.QSize:
+        return QtCore.QSize(200, 100)
+
+    def update(self, *args) -> None:
+        # BoardWidget repaints via display.update(); schedule a scene-graph sync
+        self._item.update()
+
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
+        super().resizeEvent(event)
+        self._item.setSize(QtCore.QSizeF(self.size()))
+
+
+class QuickBoardWidget(BoardWidget):
+    """BoardWidget with the same public API, drawn through the QtQuick scene graph."""
+
+    def _create_display(self) -> QtWidgets.QWidget:
+        return QuickBoardDisplay(self)
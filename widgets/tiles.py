@@ -0,0 +1,108 @@
+import math
+from PySide6 import QtCore, QtGui
+
+# what a board cell shows; see BoardWidget.cell_state
+CELL_TEXT = "text"
+CELL_BLUE = "blue"
+CELL_LETTER = "letter"
+CELL_UNDERSCORE = "underscore"
+CELL_BLANK = "blank"
+
+
+def underscore_line(rect: QtCore.QRectF) -> QtCore.QLineF:
+    # a small underscore centered horizontally near the bottom of the cell
+    underscore_y: float = rect.bottom() - 5
+    us_w: float = max(10, rect.width() * 0.65)
+    us_x: float = rect.x() + (rect.width() - us_w) / 2
+    return QtCore.QLineF(us_x, underscore_y, us_x + us_w, underscore_y)
+
+
+class TileCache:
+    """
+    Pre-rendered board tiles: one pixmap per (character, state, cell size, DPR), so
+    painting the board is a series of pixmap blits instead of text shaping, line and
+    rounded-rect rasterization on every paint. Tiles are built on first use (or by
+    prewarm()) and kept until clear().
+    """
+
+    def __init__(self, font: QtGui.QFont, pen: QtGui.QPen, blue: QtGui.QBrush) -> None:
+        self.font: QtGui.QFont = font
+        self.pen: QtGui.QPen = pen
+        self.blue: QtGui.QBrush = blue
+        self._tiles: dict[tuple, QtGui.QPixmap | None] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def clear(self) -> None:
+        self._tiles.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, float]:
+        lookups: int = self.hits + self.misses
+        return {
+            "tiles": len(self._tiles),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+    def tile(
+        self, ch: str, state: str, size: QtCore.QSizeF, dpr: float
+    ) -> QtGui.QPixmap | None:
+        """Pixmap for a cell, or None for cells that draw nothing (blanks, spaces)."""
+        # only text tiles depend on the character
+        glyph: str = ch.upper() if state in (CELL_TEXT, CELL_LETTER) else ""
+        key: tuple = (glyph, state, size.width(), size.height(), dpr)
+        try:
+            pixmap: QtGui.QPixmap | None = self._tiles[key]
+            self.hits += 1
+            return pixmap
+        except KeyError:
+            self.misses += 1
+        pixmap = self._render(glyph, state, size, dpr)
+        self._tiles[key] = pixmap
+        return pixmap
+
+    def prewarm(self, phrase: str, size: QtCore.QSizeF, dpr: float) -> None:
+        """Build every tile a phrase can need at the given cell size up front."""
+        for ch in set(phrase):
+            if ch.isalpha():
+                self.tile(ch, CELL_LETTER, size, dpr)
+            else:
+                self.tile(ch, CELL_TEXT, size, dpr)
+        self.tile("", CELL_BLUE, size, dpr)
+        self.tile("", CELL_UNDERSCORE, size, dpr)
+
+    def _render(
+        self, glyph: str, state: str, size: QtCore.QSizeF, dpr: float
+    ) -> QtGui.QPixmap | None:
+        if state == CELL_BLANK:
+            return None
+        if state in (CELL_TEXT, CELL_LETTER) and not glyph.strip():
+            return None
+
+        pixmap: QtGui.QPixmap = QtGui.QPixmap(
+            max(1, math.ceil(size.width() * dpr)),
+            max(1, math.ceil(size.height() * dpr)),
+        )
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+        rect: QtCore.QRectF = QtCore.QRectF(QtCore.QPointF(0, 0), size)
+
+        painter: QtGui.QPainter = QtGui.QPainter(pixmap)
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QtGui.QPainter.RenderHint.TextAntialiasing)
+        if state == CELL_BLUE:
+            painter.setBrush(self.blue)
+            painter.setPen(QtCore.Qt.PenStyle.NoPen)
+            painter.drawRoundedRect(rect.adjusted(3, 3, -3, -5), 6, 6)
+        elif state == CELL_UNDERSCORE:
+            painter.setPen(self.pen)
+            painter.drawLine(underscore_line(rect))
+        else:
+            painter.setFont(self.font)
+            painter.setPen(self.pen)
+            painter.drawText(rect, QtCore.Qt.AlignmentFlag.AlignCenter, glyph)
+        painter.end()
+        return pixmap
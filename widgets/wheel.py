@@ -2,73 +2,302 @@ import math
 import random
 from PySide6 import QtCore, QtGui, QtWidgets
 
-from utils import fmt_money
-from data import DEFAULT_WEDGES
+from utils import Clock, FrameStats, fmt_money
+from data import DEFAULT_WEDGES, SpinPlan, Wedge, WedgeLayout, plan_spin
+from widgets.clock import QtClock
+from widgets.wheel_atlas import ATLAS_BUDGET_BYTES, ATLAS_STEPS, WheelAtlas
+from widgets.wheel_renderer import WheelRenderThread
 
 
 class WheelWidget(QtWidgets.QWidget):
     spin_finished: QtCore.Signal = QtCore.Signal(object)
+    atlas_ready: QtCore.Signal = QtCore.Signal()
 
     def __init__(self, parent) -> None:
         super().__init__(parent)
         self.parent = parent
         self.sounds = self.parent.sounds
-        self.wedges: list[float | str] = DEFAULT_WEDGES[:]
-        self._angle_per: float = 360.0 / max(1, len(self.wedges))
+        # time source for the spin; a VirtualClock makes it scriptable
+        self.clock: Clock = getattr(self.parent, "clock", None) or QtClock()
+        # spin randomness; the window's seeded Random makes spins reproducible
+        self.rng: random.Random = getattr(self.parent, "rng", None) or random.Random()
+        self.wedge_layout: WedgeLayout = WedgeLayout(DEFAULT_WEDGES)
+        self.wedges: list[float | str] = self.wedge_layout.values
         self.rotation: float = 0.0
-        self._anim_timer: QtCore.QTimer = QtCore.QTimer()
+        # frame pacing timer; interval follows the refresh rate of the current screen
+        self._anim_timer = self.clock.timer(self._on_animate)
         self._anim_timer.setInterval(16)
-        self._anim_timer.timeout.connect(self._on_animate)
+        self._tracked_screen: QtGui.QScreen | None = None
+        self._tracked_window: QtGui.QWindow | None = None
         self.velocity: float = 0.0
         self.friction: float = 0.988
+        # current spin (None when idle) and the clock time it started at
+        self._plan: SpinPlan | None = None
+        self._spin_started_ms: float = 0.0
+
+        # Use a monospace font for the wedges (built once, not per paint)
+        self._font: QtGui.QFont = QtGui.QFont("monospace")
+        self._font.setStyleHint(QtGui.QFont.StyleHint.TypeWriter)
+        self._font.setPointSize(15)
+
+        # pre-rendered layers; rebuilt lazily when size / DPR / wedges change
+        self._sprite: QtGui.QImage | None = None
+        self._sprite_key: tuple | None = None
+        self._overlay: QtGui.QImage | None = None
+        self._overlay_key: tuple | None = None
+        # one path per wedge for the sprite renderer; results come from wedge_layout
+        self._wedge_paths: list[QtGui.QPainterPath] = []
+        self._paths_key: tuple | None = None
+
+        # optional pre-rotated frame atlas, (re)built in the background after the
+        # size settles so a window drag doesn't restart it on every resize event
+        self.atlas_enabled: bool = False
+        self.atlas_steps: int = ATLAS_STEPS
+        self.atlas_budget_bytes: int = ATLAS_BUDGET_BYTES
+        self._atlas: WheelAtlas | None = None
+        self._atlas_debounce: QtCore.QTimer = QtCore.QTimer(self)
+        self._atlas_debounce.setSingleShot(True)
+        self._atlas_debounce.setInterval(250)
+        self._atlas_debounce.timeout.connect(self._start_atlas)
+        # paint timing instrumentation (no-op until enabled)
+        self.frame_stats: FrameStats = FrameStats("WheelWidget")
+
+        # optional worker-thread renderer, switchable at runtime
+        self.threaded_render: bool = False
+        self._renderer: WheelRenderThread | None = None
+        app: QtCore.QCoreApplication | None = QtWidgets.QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
         self.setMinimumSize(420, 420)
 
     def paintEvent(self, event) -> None:
+        self.frame_stats.begin()
+        self._sync_rotation()
         painter: QtGui.QPainter = QtGui.QPainter(self)
         painter.setRenderHints(
             QtGui.QPainter.RenderHint.Antialiasing
-            | QtGui.QPainter.RenderHint.TextAntialiasing
+            | QtGui.QPainter.RenderHint.SmoothPixmapTransform
         )
 
-        # Use a monospace font for the wedges
-        font: QtGui.QFont = QtGui.QFont("monospace")
-        font.setStyleHint(QtGui.QFont.StyleHint.TypeWriter)
-        font.setPointSize(15)
-        painter.setFont(font)
+        sprite: QtGui.QImage = self._wheel_sprite()
+        overlay: QtGui.QImage = self._overlay_sprite()
+        center: QtCore.QPointF = QtCore.QRectF(self.rect()).center()
+        half: float = sprite.width() / sprite.devicePixelRatio() / 2.0
 
-        rect: QtCore.QRect = self.rect()
-        size: int = min(rect.width(), rect.height()) - 20
-        radius: float = size / 2
-        center: QtCore.QPoint = rect.center()
+        frame: QtGui.QImage | None = (
+            self._atlas.frame_for(self.rotation) if self._atlas else None
+        )
+        if (
+            self._renderer is not None
+            and self._plan is not None
+            and self._renderer.present(painter, center)
+        ):
+            # --- Worker thread: its most recent finished frame was blitted ---
+            pass
+        elif frame is not None:
+            # --- Atlas: nearest pre-rotated frame, no transform ---
+            painter.drawImage(
+                QtCore.QRectF(center.x() - half, center.y() - half, 2 * half, 2 * half),
+                frame,
+            )
+        else:
+            # --- Blit the cached wheel rotated around the widget center ---
+            painter.save()
+            painter.translate(center)
+            painter.rotate(self.rotation)
+            painter.drawImage(QtCore.QPointF(-half, -half), sprite)
+            painter.restore()
 
-        # --- Draw the wheel (rotate painter so wedges move together) ---
-        painter.save()
-        painter.translate(center)
-        painter.rotate(self.rotation)
+        # --- Static rim + pointer layer (never rotates) ---
+        painter.drawImage(QtCore.QPointF(0, 0), overlay)
 
-        wheel_rect: QtCore.QRectF = QtCore.QRectF(-radius, -radius, size, size)
+        if self.frame_stats.overlay:
+            painter.setPen(QtGui.QPen(QtCore.Qt.GlobalColor.darkGreen))
+            painter.drawText(
+                self.rect().adjusted(6, 6, -6, -6),
+                QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignTop,
+                self.frame_stats.overlay_text(),
+            )
+        painter.end()
+        self.frame_stats.end()
+
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:
+        self.shutdown()
+        super().closeEvent(event)
+
+    def shutdown(self) -> None:
+        """Stop background threads (render worker, atlas builder)."""
+        self._stop_renderer()
+        self._stop_atlas()
+
+    def set_threaded_rendering(self, enabled: bool) -> None:
+        """
+        Switch between painting on the GUI thread and blitting frames rendered ahead
+        by a worker thread.
+        """
+        self.threaded_render = enabled
+        if enabled and self._renderer is None:
+            self._renderer = WheelRenderThread(self)
+            self._renderer.set_sprite(self._wheel_sprite())
+            self._renderer.frame_ready.connect(self.update)
+            self._renderer.start()
+        elif not enabled:
+            self._stop_renderer()
+        self.update()
 
-        painter.setPen(QtGui.QPen(QtCore.Qt.GlobalColor.black, 2))
-        painter.setBrush(QtGui.QBrush(QtGui.QColor(240, 240, 240)))
-        painter.drawEllipse(wheel_rect)
+    def _stop_renderer(self) -> None:
+        if self._renderer is None:
+            return
+        self._renderer.stop()
+        self._renderer.deleteLater()
+        self._renderer = None
+
+    def showEvent(self, event: QtGui.QShowEvent) -> None:
+        super().showEvent(event)
+        handle: QtGui.QWindow | None = self.window().windowHandle()
+        # showEvent fires again after every hide/show; only connect once per window
+        if handle is not None and handle is not self._tracked_window:
+            handle.screenChanged.connect(self._on_screen_changed)
+            self._tracked_window = handle
+        self._on_screen_changed(self.screen())
+
+    def _on_screen_changed(self, screen: QtGui.QScreen | None) -> None:
+        if screen is self._tracked_screen:
+            return
+        if self._tracked_screen is not None:
+            try:
+                self._tracked_screen.refreshRateChanged.disconnect(
+                    self._apply_refresh_rate
+                )
+            except (RuntimeError, TypeError):
+                pass
+        self._tracked_screen = screen
+        if screen is not None:
+            screen.refreshRateChanged.connect(self._apply_refresh_rate)
+        self._apply_refresh_rate()
+
+    def _apply_refresh_rate(self, *_) -> None:
+        """Pace the animation timer to one tick per display refresh."""
+        screen: QtGui.QScreen | None = self._tracked_screen or self.screen()
+        rate: float = screen.refreshRate() if screen is not None else 0.0
+        if rate <= 1.0:
+            rate = 60.0
+        interval_ms: float = 1000.0 / rate
+        self._anim_timer.setInterval(max(1, round(interval_ms)))
+        self.frame_stats.target_ms = interval_ms
+
+    def resizeEvent(self, event: QtGui.QResizeEvent) -> None:
+        self.invalidate_cache()
+        super().resizeEvent(event)
+
+    def set_wedges(self, wedges: list[float | str | Wedge]) -> None:
+        self.wedge_layout = WedgeLayout(wedges)
+        self.wedges = self.wedge_layout.values
+        self.invalidate_cache()
+        self.update()
 
-        n: int = len(self.wedges)
-        if n == 0:
-            painter.restore()
-            painter.end()
+    def invalidate_cache(self) -> None:
+        self._sprite = None
+        self._sprite_key = None
+        self._overlay = None
+        self._overlay_key = None
+        self._wedge_paths = []
+        self._paths_key = None
+        self._stop_atlas()
+        if self.atlas_enabled:
+            self._atlas_debounce.start()
+
+    def set_atlas_enabled(
+        self,
+        enabled: bool,
+        steps: int = ATLAS_STEPS,
+        budget_bytes: int = ATLAS_BUDGET_BYTES,
+    ) -> None:
+        """
+        Toggle the pre-rotated frame atlas. `budget_bytes` caps its memory; the atlas
+        lowers its angular resolution and then its frame size to stay under it.
+        """
+        self.atlas_enabled = enabled
+        self.atlas_steps = steps
+        self.atlas_budget_bytes = budget_bytes
+        self._stop_atlas()
+        if enabled:
+            self._atlas_debounce.start()
+        self.update()
+
+    def atlas_memory_bytes(self) -> int:
+        return self._atlas.memory_bytes() if self._atlas else 0
+
+    def atlas_status(self) -> str:
+        if not self.atlas_enabled:
+            return "off"
+        if self._atlas is None or not self._atlas.is_ready():
+            return "building"
+        return self._atlas.describe()
+
+    def _start_atlas(self) -> None:
+        if not self.atlas_enabled:
             return
+        self._stop_atlas()
+        self._atlas = WheelAtlas(
+            self._wheel_sprite(), self.atlas_steps, self.atlas_budget_bytes, self
+        )
+        self._atlas.ready.connect(self.update)
+        self._atlas.ready.connect(self.atlas_ready)
+        self._atlas.start(QtCore.QThread.Priority.LowPriority)
 
-        # font metrics (we'll use these to size the stacked characters)
-        fm: QtGui.QFontMetrics = painter.fontMetrics()
-        char_height: int = fm.height()
-        char_spacing: int = max(1, int(char_height * 0.05))
-        step: int = char_height + char_spacing
+    def _stop_atlas(self) -> None:
+        self._atlas_debounce.stop()
+        if self._atlas is None:
+            return
+        self._atlas.requestInterruption()
+        self._atlas.wait()
+        self._atlas.deleteLater()
+        self._atlas = None
 
-        for i, wedge in enumerate(self.wedges):
-            start_angle: float = (
-                i * self._angle_per
-            )  # local angle for the wedge (degrees)
+    def _geometry(self) -> tuple[int, float]:
+        rect: QtCore.QRect = self.rect()
+        size: int = max(1, min(rect.width(), rect.height()) - 20)
+        return size, size / 2.0
+
+    def _new_image(self, width: int, height: int) -> QtGui.QImage:
+        dpr: float = self.devicePixelRatioF()
+        image: QtGui.QImage = QtGui.QImage(
+            max(1, math.ceil(width * dpr)),
+            max(1, math.ceil(height * dpr)),
+            QtGui.QImage.Format.Format_ARGB32_Premultiplied,
+        )
+        image.setDevicePixelRatio(dpr)
+        image.fill(QtCore.Qt.GlobalColor.transparent)
+        return image
+
+    def _wheel_sprite(self) -> QtGui.QImage:
+        """
+        Return the wedges + labels rendered once at rotation 0. The cache is keyed by
+        wheel size, device pixel ratio and the wedge list so any change rebuilds it.
+        """
+        size, radius = self._geometry()
+        key: tuple = (size, self.devicePixelRatioF(), self.wedge_layout.key)
+        if self._sprite is not None and self._sprite_key == key:
+            return self._sprite
+
+        # pad by a couple of pixels so the antialiased edge isn't clipped
+        side: int = size + 4
+        image: QtGui.QImage = self._new_image(side, side)
+        painter: QtGui.QPainter = QtGui.QPainter(image)
+        painter.setRenderHints(
+            QtGui.QPainter.RenderHint.Antialiasing
+            | QtGui.QPainter.RenderHint.TextAntialiasing
+        )
+        painter.translate(side / 2.0, side / 2.0)
+
+        wheel_rect: QtCore.QRectF = QtCore.QRectF(-radius, -radius, size, size)
+        painter.setPen(QtGui.QPen(QtCore.Qt.GlobalColor.black, 2))
+        painter.setBrush(QtGui.QBrush(QtGui.QColor(240, 240, 240)))
+        painter.drawEllipse(wheel_rect)
 
+        n: int = len(self.wedges)
+        for i, (wedge, path) in enumerate(zip(self.wedges, self._paths())):
             # choose color and text color
             if wedge == "BANKRUPT":
                 color: QtGui.QColor = QtGui.QColor(0, 0, 0)
@@ -79,32 +308,24 @@ class WheelWidget(QtWidgets.QWidget):
                     int((i * 360 / n) % 360), 200, 220
                 )
             painter.setBrush(QtGui.QBrush(color))
-            path: QtGui.QPainterPath = QtGui.QPainterPath()
-            path.moveTo(0, 0)
-            path.arcTo(wheel_rect, -start_angle, -self._angle_per)
-            path.closeSubpath()
             painter.drawPath(path)
 
-        painter.restore()  # done drawing the colored wedges
+        # Use a monospace font for the wedges
+        painter.setFont(self._font)
+        fm: QtGui.QFontMetrics = painter.fontMetrics()
+        char_height: int = fm.height()
+        char_spacing: int = max(1, int(char_height * 0.05))
+        step: int = char_height + char_spacing
 
-        # --- Draw stacked labels: compute screen positions and draw each stack in device coords ---
-        # Doing it after restoring means we can compute absolute screen positions
+        # --- Draw stacked labels in wheel coords (rotation 0) ---
         for i, wedge in enumerate(self.wedges):
-            start_angle: float = i * self._angle_per
-
-            mid_angle_total: float = (
-                -self.rotation - (start_angle + self._angle_per / 2.0)
-            ) % 360.0
-            mid_rad: float = math.radians(mid_angle_total)
+            mid_angle: float = (-self.wedge_layout.mid_angle(i)) % 360.0
+            mid_rad: float = math.radians(mid_angle)
 
-            # outward unit vector (screen coords)
-            ux: float = math.cos(mid_rad)
-            uy: float = -math.sin(mid_rad)
-
-            # outermost character location (screen coords)
+            # outermost character location relative to the wheel center
             label_radius: float = radius * 0.82
-            px: float = center.x() + ux * label_radius
-            py: float = center.y() + uy * label_radius
+            px: float = math.cos(mid_rad) * label_radius
+            py: float = -math.sin(mid_rad) * label_radius
 
             # prepare the label text
             if wedge == "BANKRUPT":
@@ -121,93 +342,134 @@ class WheelWidget(QtWidgets.QWidget):
                     label_text: str = str(wedge)
                     text_color: QtGui.QColor = QtGui.QColor(0, 0, 0)
 
-            chars: list[str] = list(label_text)
-
-            # compute rotation so local +Y points toward center:
-            rot: float = -mid_angle_total + 90.0
-
-            # draw characters in device coordinates: translate to px,py, rotate by rot,
-            # and draw characters stacked along local +Y (outer -> inner)
+            # rotate so local +Y points toward the center, then stack characters
+            # along local +Y (outer -> inner)
             painter.save()
-            painter.resetTransform()  # draw in widget/device coords now
             painter.translate(px, py)
-            painter.rotate(rot)
-
+            painter.rotate(-mid_angle + 90.0)
             painter.setPen(QtGui.QPen(text_color))
-            # draw each character centered at (0, j*step) where j=0 is outermost
-            for j, ch in enumerate(chars):
+            for j, ch in enumerate(label_text):
                 y: int = j * step
                 w: int = max(fm.horizontalAdvance(ch), char_height) + 6
                 h: int = char_height + 4
                 rect_char: QtCore.QRectF = QtCore.QRectF(-w / 2.0, y - h / 2.0, w, h)
                 painter.drawText(rect_char, QtCore.Qt.AlignmentFlag.AlignCenter, ch)
-
             painter.restore()
-            pointer: QtGui.QPolygonF = QtGui.QPolygonF(
-                [
-                    QtCore.QPointF(center.x(), center.y() - radius + 12),
-                    QtCore.QPointF(center.x() - 24, center.y() - radius - 36),
-                    QtCore.QPointF(center.x() + 24, center.y() - radius - 36),
-                ]
-            )
-            painter.setBrush(QtGui.QBrush(QtCore.Qt.GlobalColor.red))
-            painter.drawPolygon(pointer)
-
-    def spin(self) -> None:
-        # random initial angular velocity (degrees per frame step baseline)
-        # choose a random velocity within a wider range for noticeable variance
-        self.velocity = random.uniform(30.0, 140.0)
-        # random friction factor (closer to 1.0 -> longer spin)
-        self.friction = random.uniform(0.980, 0.994)
-        # small random jitter in timer interval (keeps visual variance subtle)
-        jitter: float = random.uniform(-2, 2)
-        base_interval = 16
-        self._anim_timer.setInterval(max(8, int(base_interval + jitter)))
+
+        painter.end()
+        self._sprite = image
+        self._sprite_key = key
+        if self._renderer is not None:
+            self._renderer.set_sprite(image)
+        return image
+
+    def _paths(self) -> list[QtGui.QPainterPath]:
+        """
+        Wedge outlines in wheel-local coordinates (rotation 0), built from the layout's
+        cumulative start angles once per size / layout.
+        """
+        size, radius = self._geometry()
+        key: tuple = (size, self.wedge_layout.key)
+        if self._paths_key == key:
+            return self._wedge_paths
+
+        wheel_rect: QtCore.QRectF = QtCore.QRectF(-radius, -radius, size, size)
+        paths: list[QtGui.QPainterPath] = []
+        for start, sweep in zip(self.wedge_layout.starts, self.wedge_layout.sweeps):
+            path: QtGui.QPainterPath = QtGui.QPainterPath()
+            path.moveTo(0, 0)
+            path.arcTo(wheel_rect, -start, -sweep)
+            path.closeSubpath()
+            paths.append(path)
+        self._wedge_paths = paths
+        self._paths_key = key
+        return paths
+
+    def _overlay_sprite(self) -> QtGui.QImage:
+        """
+        Return the static layer drawn on top of the spinning wheel: the rim outline
+        (keeps the edge crisp over the rotated sprite) and the red pointer.
+        """
+        key: tuple = (self.width(), self.height(), self.devicePixelRatioF())
+        if self._overlay is not None and self._overlay_key == key:
+            return self._overlay
+
+        size, radius = self._geometry()
+        center: QtCore.QPointF = QtCore.QRectF(self.rect()).center()
+        image: QtGui.QImage = self._new_image(self.width(), self.height())
+        painter: QtGui.QPainter = QtGui.QPainter(image)
+        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+
+        painter.setPen(QtGui.QPen(QtCore.Qt.GlobalColor.black, 2))
+        painter.setBrush(QtCore.Qt.BrushStyle.NoBrush)
+        painter.drawEllipse(center, radius, radius)
+
+        pointer: QtGui.QPolygonF = QtGui.QPolygonF(
+            [
+                QtCore.QPointF(center.x(), center.y() - radius + 12),
+                QtCore.QPointF(center.x() - 24, center.y() - radius - 36),
+                QtCore.QPointF(center.x() + 24, center.y() - radius - 36),
+            ]
+        )
+        painter.setBrush(QtGui.QBrush(QtCore.Qt.GlobalColor.red))
+        painter.drawPolygon(pointer)
+        painter.end()
+
+        self._overlay = image
+        self._overlay_key = key
+        return image
+
+    def spin(self, target_index: int | None = None) -> None:
+        """
+        Start a spin. The landing spot is computed up front from the closed-form
+        friction series; the animation just replays it against wall-clock time.
+        Pass `target_index` to force the wheel to land on a given wedge.
+        """
+        self._plan = plan_spin(
+            self.rotation, self.wedge_layout, target_index, rng=self.rng
+        )
+        self.velocity = self._plan.velocity
+        self.friction = self._plan.friction
+        self._apply_refresh_rate()
+        self.frame_stats.reset()
+        self._spin_started_ms = self.clock.now_ms()
         self._anim_timer.start()
 
-    def _on_animate(self) -> None:
-        self.rotation = (self.rotation + self.velocity) % 360.0
+    def _elapsed_ms(self) -> float:
+        return self.clock.now_ms() - self._spin_started_ms
 
-        self.velocity *= self.friction
-        # stop threshold chosen small so some spins last longer
-        if abs(self.velocity) < 0.04:
+    def _sync_rotation(self) -> None:
+        # interpolate to the moment this frame is actually painted, not the tick
+        if self._plan is not None:
+            self.rotation = self._plan.rotation_at(self._elapsed_ms())
+
+    def _on_animate(self) -> None:
+        if self._plan is None:
             self._anim_timer.stop()
+            return
+        elapsed: float = self._elapsed_ms()
+        self.rotation = self._plan.rotation_at(elapsed)
+        if self._plan.finished(elapsed):
+            self._anim_timer.stop()
+            self.rotation = self._plan.final_rotation
+            self._plan = None
             selected: dict[str, float | str | None] = self._wedge_at_angle()
+            self.frame_stats.dump("spin", wedge=selected["value"])
             self.spin_finished.emit(selected)
-        self.update()
 
-    def _wedge_at_angle(self) -> dict[str, float | str | None]:
-        n: int = len(self.wedges)
-        if n == 0:
+        if self._renderer is not None and self._plan is not None:
+            # render one tick ahead; the worker's frame_ready triggers the repaint
+            ahead: float = elapsed + self._anim_timer.interval()
+            self._renderer.request(self._plan.rotation_at(ahead))
+        else:
+            self.update()
+
+    def _wedge_at_angle(
+        self, rotation: float | None = None
+    ) -> dict[str, float | str | None]:
+        idx: int | None = self.wedge_layout.index_at(
+            self.rotation if rotation is None else rotation
+        )
+        if idx is None:
             return {"index": None, "value": None}
-
-        # reproduce the same geometry calculations used in paintEvent
-        rect: QtCore.QRect = self.rect()
-        size: int = min(rect.width(), rect.height()) - 20
-        radius: float = size / 2.0
-        center: QtCore.QPoint = rect.center()
-
-        # pointer first point (same as in paintEvent)
-        ptr_x: float = center.x()
-        ptr_y: float = center.y() - radius + 12
-        # vector from center to pointer point (screen coordinates)
-        vx: float = ptr_x - center.x()  # always 0 here, kept general
-        vy: float = ptr_y - center.y()
-
-        # convert vector to the same angle convention used in paintEvent:
-        # mid_rad = atan2(-vy, vx) -> mid_angle_total degrees
-        mid_rad: float = math.atan2(-vy, vx)
-        mid_angle_total: float = (math.degrees(mid_rad)) % 360.0
-
-        # Using the same relation as in paintEvent:
-        # mid_angle_total = (-rotation - (start_angle + angle_per/2)) % 360
-        # so s = ( -rotation - mid_angle_total ) % 360  == start_angle + angle_per/2
-        s: float = (-self.rotation - mid_angle_total) % 360.0
-
-        # start_angle = (s - angle_per/2) % 360
-        start_angle: float = s % 360.0
-
-        # index = floor(start_angle / angle_per)
-        idx: int = int(math.floor(start_angle / self._angle_per)) % n
-
         return {"index": idx, "value": self.wedges[idx]}
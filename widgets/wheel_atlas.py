@@ -0,0 +1,109 @@
+import math
+from PySide6 import QtCore, QtGui
+
+# half-degree resolution by default
+ATLAS_STEPS: int = 720
+# never drop below 2 degrees per frame; shrink the frames instead
+ATLAS_MIN_STEPS: int = 180
+ATLAS_BUDGET_BYTES: int = 512 * 1024 * 1024
+
+
+def plan_atlas(
+    side_px: int, steps: int, budget_bytes: int, min_steps: int = ATLAS_MIN_STEPS
+) -> tuple[int, float]:
+    """
+    Pick (steps, scale) so that `steps` ARGB32 frames of side `side_px * scale` fit in
+    `budget_bytes`. Angular resolution is halved first (down to `min_steps`), then
+    the frames are scaled down.
+    """
+    frame_bytes: int = side_px * side_px * 4
+    while steps > min_steps and steps * frame_bytes > budget_bytes:
+        steps //= 2
+    steps = max(1, steps)
+    scale: float = 1.0
+    if steps * frame_bytes > budget_bytes:
+        scale = math.sqrt(budget_bytes / (steps * frame_bytes))
+    return steps, scale
+
+
+class WheelAtlas(QtCore.QThread):
+    """
+    Background renderer for a sprite atlas of the wheel pre-rotated at `steps`
+    discrete angles, so painting a frame is a plain blit with no transform.
+
+    Frames are QImages (safe to build off the GUI thread). The atlas is usable once
+    `ready` fires; until then frame_for() returns None and callers fall back to
+    rotating the sprite themselves.
+    """
+
+    ready: QtCore.Signal = QtCore.Signal()
+
+    def __init__(
+        self,
+        sprite: QtGui.QImage,
+        steps: int = ATLAS_STEPS,
+        budget_bytes: int = ATLAS_BUDGET_BYTES,
+        parent: QtCore.QObject | None = None,
+    ) -> None:
+        super().__init__(parent)
+        self._sprite: QtGui.QImage = QtGui.QImage(sprite)
+        self._dpr: float = sprite.devicePixelRatio()
+        self.requested_steps: int = steps
+        self.budget_bytes: int = budget_bytes
+        self.steps, self.scale = plan_atlas(sprite.width(), steps, budget_bytes)
+        self._frames: list[QtGui.QImage] = []
+        self._complete: bool = False
+
+    def run(self) -> None:
+        src: QtGui.QImage = QtGui.QImage(self._sprite)
+        src.setDevicePixelRatio(1.0)
+        side: int = max(1, round(src.width() * self.scale))
+        frames: list[QtGui.QImage] = []
+
+        for k in range(self.steps):
+            if self.isInterruptionRequested():
+                return
+            frame: QtGui.QImage = QtGui.QImage(
+                side, side, QtGui.QImage.Format.Format_ARGB32_Premultiplied
+            )
+            frame.fill(QtCore.Qt.GlobalColor.transparent)
+            painter: QtGui.QPainter = QtGui.QPainter(frame)
+            painter.setRenderHints(
+                QtGui.QPainter.RenderHint.Antialiasing
+                | QtGui.QPainter.RenderHint.SmoothPixmapTransform
+            )
+            painter.translate(side / 2.0, side / 2.0)
+            painter.rotate(k * 360.0 / self.steps)
+            painter.scale(self.scale, self.scale)
+            painter.drawImage(
+                QtCore.QPointF(-src.width() / 2.0, -src.height() / 2.0), src
+            )
+            painter.end()
+            # draws at the sprite's logical size even when scaled down to fit
+            frame.setDevicePixelRatio(self._dpr * self.scale)
+            frames.append(frame)
+
+        self._frames = frames
+        self._complete = True
+        self.ready.emit()
+
+    def is_ready(self) -> bool:
+        return self._complete
+
+    def frame_for(self, rotation: float) -> QtGui.QImage | None:
+        """Nearest pre-rotated frame for `rotation` degrees, or None if not built."""
+        if not self._complete:
+            return None
+        k: int = round((rotation % 360.0) * self.steps / 360.0) % self.steps
+        return self._frames[k]
+
+    def memory_bytes(self) -> int:
+        if not self._complete:
+            return 0
+        return sum(frame.sizeInBytes() for frame in self._frames)
+
+    def describe(self) -> str:
+        return (
+            f"{self.steps} frames @ {360.0 / self.steps:.2f}°, "
+            f"scale {self.scale:.2f}, {self.memory_bytes() / (1024 * 1024):.1f} MB"
+        )
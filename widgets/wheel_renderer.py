@@ -0,0 +1,96 @@
+import threading
+from PySide6 import QtCore, QtGui
+
+
+class WheelRenderThread(QtCore.QThread):
+    """
+    Worker thread that renders rotated wheel frames into QImages off the GUI thread.
+
+    The GUI thread calls request() with the rotation it wants shown on the *next*
+    frame; the worker renders it into the back buffer and swaps it with the front
+    buffer under a lock. present() blits the most recent finished frame, so the GUI
+    thread never waits on a transform even if it was busy when the frame was due.
+    Only the latest request is kept; stale ones are dropped.
+    """
+
+    frame_ready: QtCore.Signal = QtCore.Signal()
+
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        super().__init__(parent)
+        self._cond: threading.Condition = threading.Condition()
+        self._sprite: QtGui.QImage | None = None
+        self._pending: float | None = None
+        self._stopping: bool = False
+        # double buffer: the worker only ever writes to _back
+        self._front: QtGui.QImage | None = None
+        self._back: QtGui.QImage | None = None
+
+    def set_sprite(self, sprite: QtGui.QImage) -> None:
+        with self._cond:
+            self._sprite = sprite
+            # frames of the old sprite are no longer valid
+            self._front = None
+            self._back = None
+
+    def request(self, rotation: float) -> None:
+        with self._cond:
+            self._pending = rotation
+            self._cond.notify()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        self.wait()
+
+    def present(self, painter: QtGui.QPainter, center: QtCore.QPointF) -> bool:
+        """Blit the latest finished frame centered on `center`; False if none yet."""
+        with self._cond:
+            frame: QtGui.QImage | None = self._front
+            if frame is None:
+                return False
+            half: float = frame.width() / frame.devicePixelRatio() / 2.0
+            painter.drawImage(
+                QtCore.QPointF(center.x() - half, center.y() - half), frame
+            )
+            return True
+
+    def run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._stopping and self._pending is None:
+                    self._cond.wait()
+                if self._stopping:
+                    return
+                rotation: float = self._pending
+                self._pending = None
+                sprite: QtGui.QImage | None = self._sprite
+                back: QtGui.QImage | None = self._back
+            if sprite is None:
+                continue
+
+            if back is None or back.size() != sprite.size():
+                back = QtGui.QImage(
+                    sprite.size(), QtGui.QImage.Format.Format_ARGB32_Premultiplied
+                )
+                back.setDevicePixelRatio(sprite.devicePixelRatio())
+            back.fill(QtCore.Qt.GlobalColor.transparent)
+
+            half: float = sprite.width() / sprite.devicePixelRatio() / 2.0
+            painter: QtGui.QPainter = QtGui.QPainter(back)
+            painter.setRenderHints(
+                QtGui.QPainter.RenderHint.Antialiasing
+                | QtGui.QPainter.RenderHint.SmoothPixmapTransform
+            )
+            painter.translate(half, half)
+            painter.rotate(rotation)
+            painter.drawImage(QtCore.QPointF(-half, -half), sprite)
+            painter.end()
+
+            with self._cond:
+                if self._sprite is not sprite:
+                    # sprite was replaced mid-render; drop this frame
+                    continue
+                self._back = self._front
+                self._front = back
+            self.frame_ready.emit()
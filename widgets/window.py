@@ -1,20 +1,39 @@
-import sys
 import random
+import sys
+from collections import Counter
+from collections.abc import Callable, Sequence
 from pathlib import Path
 from PySide6 import QtCore, QtGui, QtWidgets
 
 sys.path.append(str(Path(__file__).parent.parent.resolve()))
 
-from widgets import WheelWidget, BoardWidget
-from data import Puzzles, Players
-from utils import fmt_money
+from widgets import WheelWidget, BoardWidget, QuickWheelWidget, QuickBoardWidget
+from widgets import HostAssistPanel
+from data import GameEngine, GameEvent, Puzzles, TossupSchedule
+from data import engine as ev
+from utils import Clock, fmt_money
+from widgets.clock import QtClock
 
-from data import VOWEL_COST, Puzzle, Player, PRESENTER_KEY_DOWN, PRESENTER_KEY_UP
+from data import Player, Puzzle, PRESENTER_KEY_DOWN, PRESENTER_KEY_UP
 
 
 class GameWindow(QtWidgets.QMainWindow):
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        backend: str = "widgets",
+        clock: Clock | None = None,
+        puzzles_path: str | Path | None = None,
+        rng: random.Random | None = None,
+    ) -> None:
         super().__init__()
+        # display backend for wheel + board: "widgets" (QPainter) or "quick" (QtQuick)
+        if backend not in {"widgets", "quick"}:
+            raise ValueError(f"Unknown display backend: {backend}")
+        self.backend: str = backend
+        # shared by the wheel and board; pass a VirtualClock to script a whole game
+        self.clock: Clock = clock or QtClock()
+        # randomness for wheel spins; pass a seeded Random to replay the same spins
+        self.rng: random.Random = rng or random.Random()
         self.setWindowTitle("Wheel of Fortune")
         self.resize(1200, 720)
 
@@ -23,23 +42,46 @@ class GameWindow(QtWidgets.QMainWindow):
 
         self.sounds: SoundsManager = SoundsManager()
 
-        # Puzzles & game state
-        self.puzzle_class: Puzzles = Puzzles()
-        self.puzzles: list[Puzzle] = self.puzzle_class.get_puzzles()
-        self.current_puzzle_index: int = -1
-        self.current_player_index: int = -1
-        self.round_number: int = -1
-        self.main_rounds_total: int = len([x for x in self.puzzles if x.type == "MAIN"])
-        self.tossups: int = len([x for x in self.puzzles if x.type == "TOSS-UP"])
-        self.current_phase: str = "SETUP"
-
-        # last spin wedge monetary value for use by letter selection
-        self.last_spin_value: float | None = None
-
-        # toss-up reveal timer + paused flag (interval settable)
-        self._tossup_timer: QtCore.QTimer = QtCore.QTimer()
-        self._tossup_timer.setInterval(1500)  # default 1500 ms
-        self._tossup_timer.timeout.connect(self.tossup_reveal_step)
+        # Puzzles & game state; puzzles are parsed lazily as the game reaches them.
+        # A library with air history (SQLite) plays one SHOW_FORMAT show of the
+        # least recently aired puzzles instead of walking the whole file.
+        self.puzzle_class: Puzzles = Puzzles(puzzles_path)
+        if self.puzzle_class.tracks_history:
+            self.show_indices: Sequence[int] = self.puzzle_class.plan_show()
+            self.puzzles: Sequence[Puzzle] = [
+                self.puzzle_class[i] for i in self.show_indices
+            ]
+            self.puzzle_types: dict[str, int] = Counter(p.type for p in self.puzzles)
+        else:
+            self.show_indices = range(len(self.puzzle_class))
+            self.puzzles = self.puzzle_class
+            self.puzzle_types = self.puzzle_class.type_counts
+        self.main_rounds_total: int = self.puzzle_types.get("MAIN", 0)
+        self.tossups: int = self.puzzle_types.get("TOSS-UP", 0)
+
+        # all rules live in the engine; this window sends it commands and redraws
+        # from the events it emits
+        self.engine: GameEngine = GameEngine(self.puzzles)
+        self._event_handlers: dict[str, Callable[[GameEvent], None]] = {
+            ev.EVENT_PUZZLE_LOADED: self._on_puzzle_loaded,
+            ev.EVENT_TURN_CHANGED: self._on_turn_changed,
+            ev.EVENT_SPIN_VALUE: self._on_spin_value,
+            ev.EVENT_BANKRUPT: self._on_bankrupt,
+            ev.EVENT_LOSE_TURN: self._on_lose_turn,
+            ev.EVENT_LETTER_CALLED: self._on_letter_called,
+            ev.EVENT_POSITION_REVEALED: self._on_position_revealed,
+            ev.EVENT_BONUS_LETTERS_CHOSEN: self._on_bonus_letters_chosen,
+            ev.EVENT_SOLVED: self._on_solved,
+            ev.EVENT_SCORES_CHANGED: lambda event: self._update_player_scores_ui(),
+            ev.EVENT_GAME_OVER: self._on_game_over,
+        }
+        self.engine.subscribe(self._on_engine_event)
+
+        # toss-up reveal timer + paused flag; each tick re-arms it with the
+        # schedule's next delay
+        self._tossup_timer = self.clock.timer(
+            self.tossup_reveal_step, single_shot=True
+        )
         self.tossup_paused: bool = False
 
         self._up_shortcut = QtGui.QShortcut(QtGui.QKeySequence(QtCore.Qt.Key_Up), self)
@@ -52,8 +94,26 @@ class GameWindow(QtWidgets.QMainWindow):
         self._down_shortcut.setContext(QtCore.Qt.ApplicationShortcut)
         self._down_shortcut.activated.connect(lambda: self._handle_presenter_key(False))
 
-        # Bonus round selection flag / counters
-        self._bonus_letters: set[str] = set()
+        # F3: toggle frame-timing instrumentation + overlay for wheel and board
+        self._stats_shortcut = QtGui.QShortcut(
+            QtGui.QKeySequence(QtCore.Qt.Key_F3), self
+        )
+        self._stats_shortcut.setContext(QtCore.Qt.ApplicationShortcut)
+        self._stats_shortcut.activated.connect(self.toggle_frame_stats)
+
+        # F7: toggle rendering wheel frames on a worker thread
+        self._render_shortcut = QtGui.QShortcut(
+            QtGui.QKeySequence(QtCore.Qt.Key_F7), self
+        )
+        self._render_shortcut.setContext(QtCore.Qt.ApplicationShortcut)
+        self._render_shortcut.activated.connect(self.toggle_threaded_render)
+
+        # F6: toggle the wheel's pre-rotated frame atlas (for 4K projectors)
+        self._atlas_shortcut = QtGui.QShortcut(
+            QtGui.QKeySequence(QtCore.Qt.Key_F6), self
+        )
+        self._atlas_shortcut.setContext(QtCore.Qt.ApplicationShortcut)
+        self._atlas_shortcut.activated.connect(self.toggle_wheel_atlas)
 
         # Flag set while COUNTDOWN sound is playing and awaiting final decision
         self._countdown_active: bool = False
@@ -63,9 +123,48 @@ class GameWindow(QtWidgets.QMainWindow):
         app = QtWidgets.QApplication.instance()
         if app is not None:
             app.installEventFilter(self)
+            # commit queued air-history writes before exiting
+            app.aboutToQuit.connect(self.puzzle_class.close)
 
         self.show_setup_dialog()
 
+    # -------------------------
+    # Engine state (read-only views)
+    # -------------------------
+    @property
+    def players(self) -> list[Player]:
+        return self.engine.players
+
+    @property
+    def current_phase(self) -> str:
+        return self.engine.phase
+
+    @property
+    def current_player_index(self) -> int:
+        return self.engine.current_player_index
+
+    @property
+    def current_puzzle_index(self) -> int:
+        return self.engine.current_puzzle_index
+
+    @property
+    def round_number(self) -> int:
+        return self.engine.round_number
+
+    @property
+    def last_spin_value(self) -> float | None:
+        return self.engine.last_spin_value
+
+    @property
+    def tossup_schedule(self) -> TossupSchedule | None:
+        # reveal order / pacing of the current toss-up, planned at puzzle load
+        return self.engine.tossup_schedule
+
+    def _on_engine_event(self, event: GameEvent) -> None:
+        handler = self._event_handlers.get(event.kind)
+        if handler is not None:
+            handler(event)
+
     # -------------------------
     # Event filter for Up/Down
     # -------------------------
@@ -202,8 +301,14 @@ class GameWindow(QtWidgets.QMainWindow):
         central.setLayout(h)
 
         # Left: wheel and controls
-        self.wheel: WheelWidget = WheelWidget(self)
+        wheel_cls = QuickWheelWidget if self.backend == "quick" else WheelWidget
+        self.wheel: WheelWidget = wheel_cls(self)
         self.wheel.spin_finished.connect(self.on_wheel_result)
+        self.wheel.atlas_ready.connect(
+            lambda: self.status_label.setText(
+                f"Wheel atlas: {self.wheel.atlas_status()}"
+            )
+        )
         left_v: QtWidgets.QVBoxLayout = QtWidgets.QVBoxLayout()
         left_v.addWidget(self.wheel)
         self.spin_btn: QtWidgets.QPushButton = QtWidgets.QPushButton("Spin")
@@ -215,7 +320,8 @@ class GameWindow(QtWidgets.QMainWindow):
 
         # Center: board and letter-grid inputs
         center_v: QtWidgets.QVBoxLayout = QtWidgets.QVBoxLayout()
-        self.board: BoardWidget = BoardWidget(self)
+        board_cls = QuickBoardWidget if self.backend == "quick" else BoardWidget
+        self.board: BoardWidget = board_cls(self)
         center_v.addWidget(self.board)
 
         # Letter grid (A-Z) for host selection
@@ -291,6 +397,10 @@ class GameWindow(QtWidgets.QMainWindow):
         self.status_label: QtWidgets.QLabel = QtWidgets.QLabel("Status: Setup")
         right_v.addWidget(self.status_label)
 
+        # Host assist: fitting words + best consonants for the current board
+        self.host_assist: HostAssistPanel = HostAssistPanel(parent=self)
+        right_v.addWidget(self.host_assist)
+
         right_v.addStretch()
         right_w: QtWidgets.QWidget = QtWidgets.QWidget()
         right_w.setLayout(right_v)
@@ -321,19 +431,11 @@ class GameWindow(QtWidgets.QMainWindow):
         layout.addRow("Toss-Ups:", tossups_spin)
 
         final_spin: QtWidgets.QLabel = QtWidgets.QLabel()
-        final_spin.setText(
-            "True"
-            if any([True if x.type == "FINAL SPIN" else False for x in self.puzzles])
-            else "False"
-        )
+        final_spin.setText(str(self.puzzle_types.get("FINAL SPIN", 0) > 0))
         layout.addRow("Final Spin:", final_spin)
 
         bonus_round: QtWidgets.QLabel = QtWidgets.QLabel()
-        bonus_round.setText(
-            "True"
-            if any([True if x.type == "BONUS ROUND" else False for x in self.puzzles])
-            else "False"
-        )
+        bonus_round.setText(str(self.puzzle_types.get("BONUS ROUND", 0) > 0))
         layout.addRow("Bonus Round:", bonus_round)
 
         # Create a dedicated container (widget + vbox layout) to hold dynamic name fields.
@@ -382,8 +484,7 @@ class GameWindow(QtWidgets.QMainWindow):
             for i, le in enumerate(name_edits):
                 name = le.text().strip() or f"Player {i + 1}"
                 players.append(name)
-            self.players_class: Players = Players(players)
-            self.players: list[Player] = self.players_class.get_players()
+            self.engine.set_players(players)
             self.main_rounds_total = int(rounds_spin.text())
             self.tossups = int(tossups_spin.text())
             self._rebuild_players_panel()
@@ -473,25 +574,24 @@ class GameWindow(QtWidgets.QMainWindow):
         self._next_phase()
 
     def _next_phase(self) -> None:
-        self.board.load_puzzle(puzzle=self._pop_next_puzzle())
         self.spin_btn.setEnabled(False)
         self.next_puzzle_btn.setEnabled(False)
         self.solve_btn.setEnabled(False)
+        self.engine.next_puzzle()
 
         if self.current_phase == "TOSS-UP":
-            self.current_player_index = -1
             self.go_to_tossup()
-        else:
-            self.round_number += 1
-            self.current_player_index = self.round_number % len(self.players)
-            if self.current_phase == "MAIN":
-                self._start_main_round()
-            elif self.current_phase == "FINAL SPIN":
-                self._start_final_spin()
-            elif self.current_phase == "BONUS ROUND":
-                top: Player = max(self.players, key=lambda x: x.total_score)
-                self.current_player_index = self.players.index(top)
-                self._start_bonus_round()
+        elif self.current_phase == "MAIN":
+            self._start_main_round()
+        elif self.current_phase == "FINAL SPIN":
+            self._start_final_spin()
+        elif self.current_phase == "BONUS ROUND":
+            self._start_bonus_round()
+
+    def _on_puzzle_loaded(self, event: GameEvent) -> None:
+        self.board.load_puzzle(puzzle=event.data["puzzle"])
+        self.host_assist.start(self.engine.state, event.data["puzzle"].category)
+        self.puzzle_class.mark_played(self.show_indices[self.current_puzzle_index])
 
     def go_to_tossup(self) -> None:
         self.tossup_dlg: QtWidgets.QDialog = QtWidgets.QDialog(self)
@@ -511,17 +611,7 @@ class GameWindow(QtWidgets.QMainWindow):
         [x.setEnabled(False) for x in self.letter_buttons.values()]
         self.sounds.play("TOSS-UP", loop=True)
         self.tossup_paused = False
-        if self._tossup_timer.isActive():
-            self._tossup_timer.stop()
-        self._tossup_timer.start()
-
-    def _pop_next_puzzle(self) -> Puzzle:
-        if not self.puzzles:
-            raise RuntimeError("No puzzles")
-        self.current_puzzle_index = (self.current_puzzle_index + 1) % len(self.puzzles)
-        p: Puzzle = self.puzzles[self.current_puzzle_index]
-        self.current_phase = p.type
-        return p
+        self._arm_tossup_timer()
 
     def _start_main_round(self) -> None:
         self.spin_btn.setEnabled(True)
@@ -529,9 +619,6 @@ class GameWindow(QtWidgets.QMainWindow):
         self.status_label.setText(
             f"Turn: {self.players[self.current_player_index].name}"
         )
-        for p in self.players:
-            p.round_score = 0.0
-        self._update_player_scores_ui()
 
     def _start_final_spin(self) -> None:
         self.spin_btn.setEnabled(True)
@@ -542,29 +629,27 @@ class GameWindow(QtWidgets.QMainWindow):
         [x.setEnabled(True) for x in self.letter_buttons.values()]
 
     def tossup_reveal_step(self) -> None:
-        # reveal a random unrevealed letter *position* (if any)
-        if not self.board.puzzle:
+        # reveal the next position of the precomputed toss-up order (if any)
+        if not self.board.puzzle or self.engine.tossup_step() is None:
+            # nothing left to reveal
             self._tossup_timer.stop()
             return
+        self._arm_tossup_timer()
 
-        # build list of indices that are letters and not yet revealed
-        remaining_indices: list[int] = [
-            i
-            for i, ch in enumerate(self.board.correct_letters)
-            if ch.isalpha() and i not in self.board._revealed_positions
-            # don't check ch in self.board.revealed here because we want
-            # tossup reveals to be per-instance even if the same letter already guessed
-        ]
+    def _on_position_revealed(self, event: GameEvent) -> None:
+        self.board.reveal_position(event.data["position"])
+        self.host_assist.refresh(self.engine.state, self.engine.called_letters)
 
-        if not remaining_indices:
-            # nothing left to reveal
+    def _arm_tossup_timer(self) -> None:
+        delay: float | None = (
+            self.tossup_schedule.next_delay_ms(self.engine.state)
+            if self.tossup_schedule
+            else None
+        )
+        if delay is None:
             self._tossup_timer.stop()
-            return
-
-        # reveal exactly one random position
-        idx: int = random.choice(remaining_indices)
-        self.board._revealed_positions.add(idx)
-        self.board.update_display()
+        else:
+            self._tossup_timer.start(int(delay))
 
     def pause_tossup(self) -> None:
         self.sounds.play("LETTER_REVEAL")
@@ -578,12 +663,8 @@ class GameWindow(QtWidgets.QMainWindow):
         self.pause_dlg.setWindowTitle("Solve?")
         self.players_list: QtWidgets.QComboBox = QtWidgets.QComboBox()
         self.players_list.addItems([p.name for p in self.players])
-        self.current_player_index = self.players_list.currentIndex()
-        self.players_list.currentIndexChanged.connect(
-            lambda _: setattr(
-                self, "current_player_index", self.players_list.currentIndex()
-            )
-        )
+        self.engine.set_turn(self.players_list.currentIndex())
+        self.players_list.currentIndexChanged.connect(self.engine.set_turn)
         correct_tossup_btn: QtWidgets.QPushButton = QtWidgets.QPushButton("Correct")
         incorrect_tossup_btn: QtWidgets.QPushButton = QtWidgets.QPushButton("Incorrect")
         layout.addWidget(self.players_list)
@@ -597,108 +678,71 @@ class GameWindow(QtWidgets.QMainWindow):
 
     def do_spin(self) -> None:
         # Host initiates a spin on behalf of current player
-        if not self.players[self.current_player_index].has_spun:
+        if self.engine.can_spin():
             self.spin_btn.setEnabled(False)
             self.solve_btn.setEnabled(False)
             [x.setEnabled(False) for x in self.letter_buttons.values()]
             self.wheel.spin()
 
     def on_wheel_result(self, result) -> None:
-        wedge: str = result["value"]
-        # reset last_spin_value by default
-        self.last_spin_value = None
-
-        # handle wedge outcomes
-        if wedge == "BANKRUPT" and not self.current_phase == "FINAL SPIN":
-            self.players[self.current_player_index].set_bankrupt()
-            self.sounds.play("BANKRUPT")
-            self.status_label.setText(
-                f"{self.players[self.current_player_index].name}: BANKRUPT! :("
-            )
-            self._advance_turn()
-        elif wedge == "LOSE A TURN" and not self.current_phase == "FINAL SPIN":
-            self.sounds.play("INCORRECT")
-            self.status_label.setText(
-                f"{self.players[self.current_player_index].name}: LOST A TURN! :("
-            )
-            self._advance_turn()
-        else:
-            # monetary wedge: set last_spin_value and instruct host to pick a consonant
-            try:
-                amount = float(wedge)
-            except Exception:
-                amount = 0.0
-            self.last_spin_value = amount
-            self.status_label.setText(
-                f"{self.players[self.current_player_index].name}: {fmt_money(amount)}"
-            )
-            self.solve_btn.setEnabled(True)
-            # Enable letter buttons that are not revealed
-            for ch, btn in self.letter_buttons.items():
-                if ch not in self.board.revealed:
-                    if ch not in "AEIOU" or self.current_phase == "FINAL SPIN":
-                        btn.setEnabled(True)
-                    else:
-                        if (
-                            self.players[self.current_player_index].round_score
-                            > VOWEL_COST
-                        ):
-                            btn.setEnabled(True)
-            if self.current_phase == "FINAL SPIN":
-                self.sounds.play("SPEED_UP")
-        self._update_player_scores_ui()
+        self.engine.spin_result(result["value"])
+
+    def _on_bankrupt(self, event: GameEvent) -> None:
+        self.sounds.play("BANKRUPT")
+        self.status_label.setText(f"{self.players[event.player].name}: BANKRUPT! :(")
+
+    def _on_lose_turn(self, event: GameEvent) -> None:
+        self.sounds.play("INCORRECT")
+        self.status_label.setText(f"{self.players[event.player].name}: LOST A TURN! :(")
+
+    def _on_spin_value(self, event: GameEvent) -> None:
+        # monetary wedge: instruct host to pick a letter
+        amount: float = event.data["amount"]
+        self.status_label.setText(
+            f"{self.players[event.player].name}: {fmt_money(amount)}"
+        )
+        self.solve_btn.setEnabled(True)
+        # Enable letter buttons the player may call (not revealed, vowels affordable)
+        for ch, btn in self.letter_buttons.items():
+            if self.engine.can_call(ch):
+                btn.setEnabled(True)
+        if self.current_phase == "FINAL SPIN":
+            self.sounds.play("SPEED_UP")
 
-    def _advance_turn(self) -> None:
-        self.current_player_index = (self.current_player_index + 1) % len(self.players)
+    def _on_turn_changed(self, event: GameEvent) -> None:
         if self.current_phase == "MAIN":
             self.spin_btn.setEnabled(True)
             self.solve_btn.setEnabled(False)
-        self.status_label.setText(
-            f"Turn: {self.players[self.current_player_index].name}"
-        )
+        self.status_label.setText(f"Turn: {self.players[event.player].name}")
 
     def on_letter_selected(self, ch: str) -> None:
         if ch in self.letter_buttons:
             self.letter_buttons[ch].setEnabled(False)
-
-        count: int = self.board.guess_letter(ch)
-        if not self.current_phase == "BONUS ROUND":
-            if count > 0:
-                if ch in "AEIOU":
-                    self.players[self.current_player_index].round_score -= VOWEL_COST
-                else:
-                    gained: float = self.last_spin_value * count
-                    self.players[self.current_player_index].add_money(gained)
-
-        else:
-            self._bonus_letters.add(ch)
-            if len(self._bonus_letters) >= 10:
-                # store dialog and its button on self so key handling can find them
-                self.start_dlg = QtWidgets.QDialog(self)
-                self.start_dlg.setWindowTitle("Bonus Round - Ready?")
-                start_layout: QtWidgets.QHBoxLayout = QtWidgets.QHBoxLayout()
-                self.start_dlg_start_btn: QtWidgets.QPushButton = QtWidgets.QPushButton(
-                    "Start"
-                )
-                start_layout.addWidget(self.start_dlg_start_btn)
-                self.start_dlg.setLayout(start_layout)
-                self.start_dlg_start_btn.clicked.connect(self.start_dlg.accept)
-                self.start_dlg.setModal(True)
-                # show modal and wait for acceptance (player presses Start)
-                if self.start_dlg.exec() == QtWidgets.QDialog.Accepted:
-                    # Player pressed Start -> begin countdown and set countdown flag
-                    self.sounds.stop("BONUS_CHOOSE")
-                    self.sounds.play("COUNTDOWN")
-                    self._countdown_active = True
-                else:
-                    # If Cancelled/Rejected, do nothing special
-                    pass
-
-        self._advance_turn()
-        if not self.current_phase == "FINAL SPIN":
-            self.last_spin_value = None
-
-        self._update_player_scores_ui()
+        self.engine.call_letter(ch)
+
+    def _on_letter_called(self, event: GameEvent) -> None:
+        # the board animates the reveal (or plays the miss sound)
+        self.board.guess_letter(event.data["letter"])
+        self.host_assist.refresh(self.engine.state, self.engine.called_letters)
+
+    def _on_bonus_letters_chosen(self, event: GameEvent) -> None:
+        # store dialog and its button on self so key handling can find them
+        self.start_dlg = QtWidgets.QDialog(self)
+        self.start_dlg.setWindowTitle("Bonus Round - Ready?")
+        start_layout: QtWidgets.QHBoxLayout = QtWidgets.QHBoxLayout()
+        self.start_dlg_start_btn: QtWidgets.QPushButton = QtWidgets.QPushButton(
+            "Start"
+        )
+        start_layout.addWidget(self.start_dlg_start_btn)
+        self.start_dlg.setLayout(start_layout)
+        self.start_dlg_start_btn.clicked.connect(self.start_dlg.accept)
+        self.start_dlg.setModal(True)
+        # show modal and wait for acceptance (player presses Start)
+        if self.start_dlg.exec() == QtWidgets.QDialog.Accepted:
+            # Player pressed Start -> begin countdown and set countdown flag
+            self.sounds.stop("BONUS_CHOOSE")
+            self.sounds.play("COUNTDOWN")
+            self._countdown_active = True
 
     def solve_and_reveal(self) -> None:
         # Host marks the current player's attempt as correct
@@ -721,30 +765,33 @@ class GameWindow(QtWidgets.QMainWindow):
         if self.current_phase in {"TOSS-UP", "COUNTDOWN"}:
             self.sounds.stop("TOSS-UP")
             self.sounds.play("TOSS-UP_SOLVE")
-            self.players[self.current_player_index].add_money(
-                self.puzzle_class.get_prize_value(self.current_puzzle_index)
-            )
-        self.players[self.current_player_index].total_score += self.players[
-            self.current_player_index
-        ].round_score
-        self.board.reveal_all()
-        if self.current_phase != "TOSS-UP":
-            self.sounds.play("PUZZLE_SOLVE")
-        self._end_round_for_player(self.players[self.current_player_index])
-        self._update_player_scores_ui()
+        self.engine.solve(correct=True)
         self.next_puzzle_btn.setEnabled(True)
         if self.current_phase == "FINAL SPIN":
             self.sounds.stop("SPEED_UP")
-            top: Player = max(self.players, key=lambda x: x.total_score)
+            top: Player = self.engine.leader()
             QtWidgets.QMessageBox.information(
                 self,
                 "Bonus Round",
                 f"{top.name} will play the Bonus Round!",
             )
-        if self.current_phase == "BONUS ROUND":
-            self.sounds.stop("COUNTDOWN")
-            self._countdown_active = False
-            self._show_final_results()
+
+    def _on_solved(self, event: GameEvent) -> None:
+        self.board.reveal_all()
+        self.host_assist.refresh(self.engine.state, self.engine.called_letters)
+        if self.current_phase != "TOSS-UP":
+            self.sounds.play("PUZZLE_SOLVE")
+        if self.round_number < len(self.puzzles):
+            name: str = self.players[event.player].name
+            score: str = fmt_money(event.data["round_score"])
+            self.status_label.setText(
+                f"{name} Has Solved The Puzzle! Round Score: {score}"
+            )
+
+    def _on_game_over(self, event: GameEvent) -> None:
+        self.sounds.stop("COUNTDOWN")
+        self._countdown_active = False
+        self._show_final_results()
 
     def incorrect_solve(self) -> None:
         # clear countdown flag if set
@@ -760,34 +807,21 @@ class GameWindow(QtWidgets.QMainWindow):
         elif hasattr(self, "solve_dlg") and self.solve_dlg.isVisible():
             self.solve_dlg.reject()
         self.sounds.play("INCORRECT")
-        # For toss-ups: decrement tossup attempts/allow next buzz; for main rounds treat as normal incorrect
+        # toss-ups carry on revealing; otherwise the engine passes the turn
+        self.engine.solve(correct=False)
         if self.current_phase == "TOSS-UP":
             # incorrect on toss-up — continue toss-up (resume reveal)
             self.status_label.setText("Incorrect! Toss-Up Resumes in 3 Seconds!")
-            QtCore.QTimer.singleShot(3000, self._resume_tossup_reveal)
-        else:
-            self._advance_turn()
-        self._update_player_scores_ui()
+            self.clock.single_shot(3000, self._resume_tossup_reveal)
 
     def _resume_tossup_reveal(self) -> None:
         if not self._tossup_timer.isActive():
-            self._tossup_timer.start()
+            self._arm_tossup_timer()
             self.tossup_paused = False
 
-    def _end_round_for_player(self, player: Player) -> None:
-        if self.round_number < len(self.puzzles):
-            self.status_label.setText(
-                f"{player.name} Has Solved The Puzzle! Round Score: {fmt_money(player.round_score)}"
-            )
-            for p in self.players:
-                p.round_score = 0.0
-        self._update_player_scores_ui()
-
     def _show_final_results(self) -> None:
         self.sounds.play("THEME")
-        scores: list[Player] = sorted(
-            self.players, key=lambda p: p.total_score, reverse=True
-        )
+        scores: list[Player] = self.engine.standings()
         txt = "Final Standings:\n"
         for p in scores:
             txt += f"{p.name}: {fmt_money(p.total_score)}\n"
@@ -796,21 +830,41 @@ class GameWindow(QtWidgets.QMainWindow):
     def override_score(self) -> None:
         idx: int = self.override_player_cb.currentIndex()
         p: Player = self.players[idx]
-        p.round_score = self.override_round_spin.value()
-        p.total_score = self.override_total_spin.value()
-        self._update_player_scores_ui()
+        self.engine.override_score(
+            idx, self.override_round_spin.value(), self.override_total_spin.value()
+        )
         QtWidgets.QMessageBox.information(
             self, "Success", f"{p.name}'s scores updated."
         )
 
+    def toggle_frame_stats(self) -> None:
+        # summaries go to frame_stats.jsonl in the temp dir after each spin / reveal
+        enabled: bool = not self.wheel.frame_stats.enabled
+        for stats in (self.wheel.frame_stats, self.board.frame_stats):
+            stats.enabled = enabled
+            stats.overlay = enabled
+            stats.reset()
+        self.wheel.update()
+        self.board.display.update()
+        self.status_label.setText(f"Frame stats: {'on' if enabled else 'off'}")
+
+    def toggle_threaded_render(self) -> None:
+        self.wheel.set_threaded_rendering(not self.wheel.threaded_render)
+        self.status_label.setText(
+            f"Threaded wheel rendering: {'on' if self.wheel.threaded_render else 'off'}"
+        )
+
+    def toggle_wheel_atlas(self) -> None:
+        self.wheel.set_atlas_enabled(not self.wheel.atlas_enabled)
+        self.status_label.setText(f"Wheel atlas: {self.wheel.atlas_status()}")
+
     def host_set_turn(self, idx: int) -> None:
         # Host sets whose turn it is
-        self.current_player_index = idx
-        self.status_label.setText(f"Turn: {self.players[idx].name}")
+        self.engine.set_turn(idx)
         self.spin_btn.setEnabled(True)
         self.solve_btn.setEnabled(True)
         [
-            x.setEnabled(True)
-            for x in self.letter_buttons.values()
-            if x not in self.board.revealed
+            btn.setEnabled(True)
+            for ch, btn in self.letter_buttons.items()
+            if not self.engine.state.is_letter_revealed(ch)
         ]